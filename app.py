@@ -1,5 +1,4 @@
 import os
-import time
 import json
 import logging
 import subprocess
@@ -7,11 +6,9 @@ import re
 from datetime import datetime
 from io import BytesIO
 
-from flask import Flask, render_template, request, jsonify, send_file, abort, url_for
+from flask import Blueprint, Flask, current_app, render_template, request, jsonify, send_file, abort, url_for
 from werkzeug.utils import secure_filename
 
-from openai import OpenAI
-
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
 from reportlab.lib.styles import getSampleStyleSheet
@@ -19,15 +16,19 @@ from reportlab.lib.units import inch
 
 # Import backend modules
 from backend.routes.api import api as api_blueprint
-from backend.services import transcription, translation, summarization, qa_detection, export
+from backend.services import transcription, translation, summarization, qa_detection, export, llm
 from backend.config import (
     UPLOAD_FOLDER as CONFIG_UPLOAD_FOLDER,
     TRANSCRIPT_FOLDER as CONFIG_TRANSCRIPT_FOLDER,
+    MAX_CONTENT_LENGTH as CONFIG_MAX_CONTENT_LENGTH,
+    MAX_UPLOAD_MB,
     FLASK_PORT,
     SQLALCHEMY_DATABASE_URI,
     SQLALCHEMY_TRACK_MODIFICATIONS,
+    SQLALCHEMY_ENGINE_OPTIONS,
+    LLM_WARM_ON_STARTUP,
 )
-from backend.models import db
+from backend.models import init_db
 
 
 # ----------------------------
@@ -37,66 +38,66 @@ UPLOAD_FOLDER = CONFIG_UPLOAD_FOLDER
 TRANSCRIPT_FOLDER = CONFIG_TRANSCRIPT_FOLDER
 LOG_FOLDER = "logs"
 
-MAX_FILE_AGE_SECONDS = 60 * 60  # 1 hour
-MAX_CONTENT_LENGTH = 25 * 1024 * 1024  # 25 MB
+MAX_CONTENT_LENGTH = CONFIG_MAX_CONTENT_LENGTH
 
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(TRANSCRIPT_FOLDER, exist_ok=True)
-os.makedirs(LOG_FOLDER, exist_ok=True)
+logger = logging.getLogger(__name__)
 
-# Initialize export service
-export.set_transcript_folder(TRANSCRIPT_FOLDER)
+# Legacy (non-/api) routes; registered on the app by create_app()
+legacy = Blueprint("legacy", __name__)
 
 
 # ----------------------------
-# Logging
+# App factory
 # ----------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join(LOG_FOLDER, "app.log"), encoding="utf-8"),
-    ],
-)
-logger = logging.getLogger(__name__)
+def create_app() -> Flask:
+    """
+    Create folders, configure logging and build the Flask app.
 
-# ----------------------------
-# Flask + OpenAI client
-# ----------------------------
-app = Flask(__name__)
-app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
-app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
-app.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = SQLALCHEMY_TRACK_MODIFICATIONS
+    Everything with process-wide side effects lives here rather than at
+    module level: render_pool workers are started with "spawn" and
+    re-import this file as __mp_main__, and they must not reconfigure
+    logging, open the database or warm up the LLM client.
+    """
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    os.makedirs(TRANSCRIPT_FOLDER, exist_ok=True)
+    os.makedirs(LOG_FOLDER, exist_ok=True)
+
+    # Initialize export service
+    export.set_transcript_folder(TRANSCRIPT_FOLDER)
+
+    # ----------------------------
+    # Logging
+    # ----------------------------
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(os.path.join(LOG_FOLDER, "app.log"), encoding="utf-8"),
+        ],
+    )
 
-db.init_app(app)
+    # ----------------------------
+    # Flask + LLM gateway
+    # ----------------------------
+    app = Flask(__name__)
+    app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+    app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+    app.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = SQLALCHEMY_TRACK_MODIFICATIONS
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = SQLALCHEMY_ENGINE_OPTIONS
 
-# Register backend API blueprint
-app.register_blueprint(api_blueprint)
+    init_db(app)
 
-client = OpenAI()  # reads OPENAI_API_KEY from environment
+    # Register backend API blueprint and the legacy routes
+    app.register_blueprint(api_blueprint)
+    app.register_blueprint(legacy)
 
+    # All OpenAI calls go through the shared pooled client in backend.services.llm
+    if LLM_WARM_ON_STARTUP:
+        llm.warm_up()
 
-# ----------------------------
-# Housekeeping
-# ----------------------------
-def cleanup_old_files() -> None:
-    """Delete old audio + transcript files."""
-    now = time.time()
-    for folder in (UPLOAD_FOLDER, TRANSCRIPT_FOLDER):
-        if not os.path.isdir(folder):
-            continue
-        for name in os.listdir(folder):
-            path = os.path.join(folder, name)
-            try:
-                if os.path.isfile(path):
-                    age = now - os.path.getmtime(path)
-                    if age > MAX_FILE_AGE_SECONDS:
-                        os.remove(path)
-                        logger.info("Deleted old file: %s", path)
-            except Exception as e:
-                logger.warning("Cleanup error on %s: %s", path, e)
+    return app
 
 
 # ----------------------------
@@ -204,20 +205,18 @@ def build_pdf_bytes(data: dict) -> bytes:
 # ----------------------------
 # Routes
 # ----------------------------
-@app.errorhandler(413)
+@legacy.app_errorhandler(413)
 def file_too_large(e):
-    return jsonify({"error": "File is too large. Limit is 25 MB."}), 413
+    return jsonify({"error": f"File is too large. Limit is {MAX_UPLOAD_MB} MB."}), 413
 
 
-@app.route("/", methods=["GET"])
+@legacy.route("/", methods=["GET"])
 def index():
     return render_template("index.html")
 
 
-@app.route("/process", methods=["POST"])
+@legacy.route("/process", methods=["POST"])
 def process():
-    cleanup_old_files()
-
     if "audio_file" not in request.files:
         return jsonify({"error": "No file part in request."}), 400
 
@@ -226,7 +225,7 @@ def process():
         return jsonify({"error": "No file selected."}), 400
 
     filename = secure_filename(file.filename)
-    save_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    save_path = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
     file.save(save_path)
     logger.info("Saved file to: %s", os.path.abspath(save_path))
 
@@ -273,41 +272,15 @@ def process():
     original_summary = summary
     original_action_items = action_items
     if was_translated and detected_language and detected_language.lower() != "english":
+        # Summary and action items are translated together (one structured call)
         try:
-            translate_prompt = f"""Translate this meeting summary to {detected_language}. Keep the structure and meaning intact. Only provide the translated text.
-
-Summary:
-{summary}"""
-            translate_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": translate_prompt}],
-                max_tokens=2048,
-            )
-            original_summary = translate_response.choices[0].message.content.strip()
-            logger.info("Translated summary to %s", detected_language)
-        except Exception as e:
-            logger.warning("Could not translate summary to %s: %s", detected_language, e)
-            original_summary = summary  # Fallback to English
-        
-        # Translate action items
-        try:
-            action_items_text = "\n".join(action_items)
-            action_items_prompt = f"""Translate these action items to {detected_language}. Keep the structure and meaning intact. Return as a numbered list.
-
-Action Items:
-{action_items_text}"""
-            action_items_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": action_items_prompt}],
-                max_tokens=1024,
+            original_summary, original_action_items = translation.translate_summary_and_actions(
+                summary, action_items, detected_language
             )
-            translated_items_text = action_items_response.choices[0].message.content.strip()
-            # Parse the translated items back into a list
-            original_action_items = [item.strip() for item in translated_items_text.split('\n') if item.strip()]
-            logger.info("Translated action items to %s", detected_language)
+            logger.info("Translated summary and action items to %s", detected_language)
         except Exception as e:
-            logger.warning("Could not translate action items to %s: %s", detected_language, e)
-            original_action_items = action_items  # Fallback to English
+            logger.warning("Could not translate results to %s: %s", detected_language, e)
+            original_summary, original_action_items = summary, action_items  # Fallback to English
 
     # Save canonical meeting artifact JSON
     meeting_id = new_meeting_id()
@@ -352,14 +325,14 @@ Action Items:
             "transcript_file": transcript_filename,
             "original_language": detected_language,
             "was_translated": was_translated,
-            "download_url": url_for("download_pdf", meeting_id=meeting_id),
-            "discard_url": url_for("discard_meeting", meeting_id=meeting_id),
+            "download_url": url_for(".download_pdf", meeting_id=meeting_id),
+            "discard_url": url_for(".discard_meeting", meeting_id=meeting_id),
             "memo_json": memo_json,
         }
     )
 
 
-@app.route("/download/<meeting_id>", methods=["GET"])
+@legacy.route("/download/<meeting_id>", methods=["GET"])
 def download_pdf(meeting_id):
     try:
         data = load_meeting_artifacts(meeting_id)
@@ -377,7 +350,7 @@ def download_pdf(meeting_id):
     )
 
 
-@app.route("/discard/<meeting_id>", methods=["POST"])
+@legacy.route("/discard/<meeting_id>", methods=["POST"])
 def discard_meeting(meeting_id):
     try:
         safe_meeting_id(meeting_id)
@@ -387,7 +360,7 @@ def discard_meeting(meeting_id):
     return jsonify({"status": "discarded", "meeting_id": meeting_id})
 
 
-@app.route("/open_transcripts", methods=["POST"])
+@legacy.route("/open_transcripts", methods=["POST"])
 def open_transcripts():
     """On macOS, open the transcripts folder in Finder."""
     folder = os.path.abspath(TRANSCRIPT_FOLDER)
@@ -399,7 +372,7 @@ def open_transcripts():
         return jsonify({"error": "Could not open transcripts folder."}), 500
 
 
-@app.route("/detect_questions", methods=["POST"])
+@legacy.route("/detect_questions", methods=["POST"])
 def detect_questions():
     """
     Detect questions in new transcript and answer them automatically.
@@ -445,16 +418,14 @@ Full transcript context:
 \"\"\"{full_transcript}\"\"\"
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        response_text = llm.chat(
+            "qa",
             messages=[
                 {"role": "user", "content": detection_prompt}
             ],
             temperature=0.5,
             max_tokens=1000,
-        )
-
-        response_text = (response.choices[0].message.content or "").strip()
+        ).text
         
         try:
             questions = json.loads(response_text)
@@ -475,7 +446,7 @@ Full transcript context:
         return jsonify({"questions": [], "error": str(e)}), 500
 
 
-@app.route("/translate_content", methods=["POST"])
+@legacy.route("/translate_content", methods=["POST"])
 def translate_content():
     """Endpoint to translate summary and transcript to target language"""
     data = request.json
@@ -493,12 +464,13 @@ def translate_content():
 Summary:
 {summary}"""
         
-        summary_response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        translated_summary = llm.chat(
+            "translation",
             messages=[{"role": "user", "content": summary_prompt}],
+            temperature=0.0,
             max_tokens=2048,
-        )
-        translated_summary = summary_response.choices[0].message.content.strip()
+            cache=True,
+        ).text
         
         # Translate transcript
         transcript_prompt = f"""Translate the following meeting transcript to {target_language}. Maintain the speaker labels and structure. Only provide the translated text, nothing else.
@@ -506,12 +478,13 @@ Summary:
 Transcript:
 {transcript}"""
         
-        transcript_response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        translated_transcript = llm.chat(
+            "translation",
             messages=[{"role": "user", "content": transcript_prompt}],
+            temperature=0.0,
             max_tokens=4096,
-        )
-        translated_transcript = transcript_response.choices[0].message.content.strip()
+            cache=True,
+        ).text
         
         return jsonify({
             "translated_summary": translated_summary,
@@ -526,6 +499,11 @@ Transcript:
 # ----------------------------
 # Main
 # ----------------------------
+# `app` for WSGI servers, flask run and the tools/ scripts. Skipped in
+# spawned worker processes, which import this file as __mp_main__.
+if __name__ != "__mp_main__":
+    app = create_app()
+
 if __name__ == "__main__":
     if not os.environ.get("OPENAI_API_KEY"):
         logger.warning("WARNING: OPENAI_API_KEY is not set in the environment.")
@@ -17,18 +17,38 @@ PROJECT_ROOT = Path(__file__).parent.parent
 UPLOAD_FOLDER = os.path.join(PROJECT_ROOT, "uploads")
 TRANSCRIPT_FOLDER = os.path.join(PROJECT_ROOT, "transcripts")
 LOG_FOLDER = os.path.join(PROJECT_ROOT, "logs")
+CACHE_FOLDER = os.path.join(PROJECT_ROOT, "cache")
 
 # Create folders if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(TRANSCRIPT_FOLDER, exist_ok=True)
 os.makedirs(LOG_FOLDER, exist_ok=True)
+os.makedirs(CACHE_FOLDER, exist_ok=True)
 
 # ----------------------------
 # File Management
 # ----------------------------
 
 MAX_FILE_AGE_SECONDS = 60 * 60  # 1 hour (auto-delete old files)
-MAX_CONTENT_LENGTH = 25 * 1024 * 1024  # 25 MB (max upload size)
+
+# A background janitor deletes uploads and transcript files once they are
+# older than their type's retention (override with JANITOR_RETENTION_<TYPE>).
+# Files still used by queued/running jobs are skipped until released.
+# It starts with the first request the app serves (scripts that only
+# import the app, like the artifact importer, never start it).
+JANITOR_ENABLED = os.getenv("JANITOR_ENABLED", "true").lower() in ("true", "1", "yes")
+JANITOR_RETENTION_SECONDS = {
+    artifact_type: float(os.getenv(f"JANITOR_RETENTION_{artifact_type.upper()}", MAX_FILE_AGE_SECONDS))
+    for artifact_type in ("upload", "live_segment", "transcript")
+}
+JANITOR_INTERVAL_SECONDS = float(os.getenv("JANITOR_INTERVAL_SECONDS", 60))  # max sleep between sweeps
+JANITOR_RESCAN_SECONDS = float(os.getenv("JANITOR_RESCAN_SECONDS", 60 * 60))  # full folder rescan
+MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", 500))
+MAX_CONTENT_LENGTH = MAX_UPLOAD_MB * 1024 * 1024  # max upload size (long meetings are chunked)
+
+# Meetings are stored in the database; also write a JSON copy per meeting
+# to TRANSCRIPT_FOLDER (outside an app context the JSON file is always used)
+MEETING_JSON_MIRROR = os.getenv("MEETING_JSON_MIRROR", "false").lower() in ("true", "1", "yes")
 
 # ----------------------------
 # Database Configuration
@@ -40,6 +60,35 @@ DATABASE_PATH = os.path.join(PROJECT_ROOT, "meeting_intelligence.db")
 SQLALCHEMY_DATABASE_URI = f"sqlite:///{DATABASE_PATH}"
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# SQLite connection profile, applied to every pooled connection by
+# models.init_db: WAL lets readers run alongside a writer, and writers wait
+# up to the busy timeout for the lock instead of failing with "database is
+# locked". Set SQLITE_JOURNAL_MODE=DELETE to restore SQLite's default.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),  # safe with WAL, far fewer fsyncs
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 10000)),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", 32 * 1024)),  # negative = KiB
+}
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+    "connect_args": {
+        "timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000,
+        "check_same_thread": False,  # connections move between job threads via the pool
+    },
+}
+
+# Typed settings are cached per user after one query and invalidated on
+# write; the TTL bounds staleness when several processes share the database.
+SETTINGS_CACHE_TTL_SECONDS = float(os.getenv("SETTINGS_CACHE_TTL_SECONDS", 60))
+
+# GET /api/meetings page size (default and upper bound for ?limit=)
+MEETINGS_PAGE_SIZE = int(os.getenv("MEETINGS_PAGE_SIZE", 50))
+MEETINGS_MAX_PAGE_SIZE = int(os.getenv("MEETINGS_MAX_PAGE_SIZE", 200))
+
 # ----------------------------
 # LLM Configuration
 # ----------------------------
@@ -54,6 +103,37 @@ if not OPENAI_API_KEY:
     logger = logging.getLogger(__name__)
     logger.warning("WARNING: OPENAI_API_KEY is not set in environment")
 
+# Shared gateway (backend/services/llm.py): one pooled keep-alive client for
+# every service, a global concurrency limit and retries on 429/5xx.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", 20))
+LLM_KEEPALIVE_SECONDS = float(os.getenv("LLM_KEEPALIVE_SECONDS", 60))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 3))
+LLM_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", 0.5))
+LLM_RETRY_MAX_SECONDS = float(os.getenv("LLM_RETRY_MAX_SECONDS", 20))
+LLM_WARM_ON_STARTUP = os.getenv("LLM_WARM_ON_STARTUP", "false").lower() in ("true", "1", "yes")
+
+# Response cache for deterministic calls (temperature=0 or explicit opt-in),
+# keyed by model + normalized prompt + parameters.
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+LLM_CACHE_PATH = os.path.join(CACHE_FOLDER, "llm_responses.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 60 * 60))  # 7 days
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 20000))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 100 * 1024 * 1024))  # 100 MB
+
+# Per-stage request timeouts in seconds (override with LLM_TIMEOUT_<STAGE>)
+LLM_TIMEOUTS = {
+    stage: float(os.getenv(f"LLM_TIMEOUT_{stage.upper()}", default))
+    for stage, default in {
+        "transcription": 600,
+        "detection": 30,
+        "translation": 120,
+        "summarization": 120,
+        "qa": 30,
+        "default": 60,
+    }.items()
+}
+
 # ----------------------------
 # Transcription Configuration
 # ----------------------------
@@ -61,6 +141,114 @@ if not OPENAI_API_KEY:
 # Decision: Whisper only (Phase 3: add Deepgram/AssemblyAI)
 TRANSCRIPTION_SERVICE = "whisper"
 WHISPER_MODEL = "whisper-1"
+WHISPER_MAX_UPLOAD_BYTES = 25 * 1024 * 1024  # Whisper API per-request file limit
+
+# Chunked mode: long recordings are split at silences (needs ffmpeg/ffprobe)
+# and the segments transcribed in parallel.
+TRANSCRIPTION_CHUNK_SECONDS = int(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", 600))  # target segment length
+TRANSCRIPTION_CHUNK_OVERLAP_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", 2.0))
+TRANSCRIPTION_MAX_WORKERS = int(os.getenv("TRANSCRIPTION_MAX_WORKERS", 4))
+SILENCE_THRESHOLD_DB = int(os.getenv("SILENCE_THRESHOLD_DB", -35))
+SILENCE_MIN_SECONDS = float(os.getenv("SILENCE_MIN_SECONDS", 0.5))
+# Each segment is prompted with the transcript of the last few seconds
+# before its cut, transcribed in a quick first pass (0 disables prompts)
+TRANSCRIPTION_PROMPT_TAIL_SECONDS = float(os.getenv("TRANSCRIPTION_PROMPT_TAIL_SECONDS", 15))
+# Kill stuck ffprobe/ffmpeg runs instead of blocking a worker forever
+FFPROBE_TIMEOUT_SECONDS = float(os.getenv("FFPROBE_TIMEOUT_SECONDS", 30))
+FFMPEG_TIMEOUT_SECONDS = float(os.getenv("FFMPEG_TIMEOUT_SECONDS", 600))
+
+# Transcript cache: audio SHA-256 -> transcript + language, so re-uploads of
+# the same recording skip Whisper entirely.
+TRANSCRIPT_CACHE_PATH = os.path.join(CACHE_FOLDER, "transcripts.sqlite3")
+TRANSCRIPT_CACHE_TTL_SECONDS = int(os.getenv("TRANSCRIPT_CACHE_TTL_SECONDS", 30 * 24 * 60 * 60))  # 30 days
+TRANSCRIPT_CACHE_MAX_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", 5000))
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", 200 * 1024 * 1024))  # 200 MB
+
+# ----------------------------
+# Translation Configuration
+# ----------------------------
+
+# Long texts are split on speaker/sentence boundaries into segments of about
+# this many tokens and translated concurrently, then reassembled in order.
+TRANSLATION_SEGMENT_TOKENS = int(os.getenv("TRANSLATION_SEGMENT_TOKENS", 1500))
+TRANSLATION_MAX_WORKERS = int(os.getenv("TRANSLATION_MAX_WORKERS", 4))
+
+# Offline language identification (script + common-word scoring) is trusted
+# at or above this confidence; below it the LLM detector is consulted.
+LANGID_CONFIDENCE_THRESHOLD = float(os.getenv("LANGID_CONFIDENCE_THRESHOLD", 0.8))
+
+# ----------------------------
+# Summarization Configuration
+# ----------------------------
+
+# Transcripts above this size are summarized map-reduce style: windows are
+# summarized in parallel into partial memos, then merged.
+SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS = int(os.getenv("SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS", 6000))
+SUMMARY_WINDOW_TOKENS = int(os.getenv("SUMMARY_WINDOW_TOKENS", 3000))
+SUMMARY_MAX_WORKERS = int(os.getenv("SUMMARY_MAX_WORKERS", 4))
+
+# ----------------------------
+# PDF Export
+# ----------------------------
+
+# Rendered reports are cached on disk keyed by a hash of the meeting
+# artifact, so repeat downloads skip ReportLab; least recently used files
+# are evicted above PDF_CACHE_MAX_BYTES. With PDF_PRERENDER the report is
+# rendered in the background as soon as a meeting is saved.
+PDF_CACHE_FOLDER = os.path.join(CACHE_FOLDER, "pdf")
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 200 * 1024 * 1024))  # 200 MB
+PDF_PRERENDER = os.getenv("PDF_PRERENDER", "true").lower() in ("true", "1", "yes")
+
+# CPU-bound rendering (ReportLab) runs in a process pool so it never holds
+# the GIL that request and job threads need. Beyond RENDER_QUEUE_LIMIT
+# queued + running renders, downloads are refused with 503.
+# RENDER_WORKERS=0 renders on the calling thread instead.
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", min(2, os.cpu_count() or 1)))
+RENDER_QUEUE_LIMIT = int(os.getenv("RENDER_QUEUE_LIMIT", 8))
+RENDER_TIMEOUT_SECONDS = float(os.getenv("RENDER_TIMEOUT_SECONDS", 120))
+
+# ----------------------------
+# Background Jobs
+# ----------------------------
+
+# Pipeline work (transcribe -> translate -> summarize) runs off the request
+# thread; size the pool independently of the web workers.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+JOB_QUEUE_LIMIT = int(os.getenv("JOB_QUEUE_LIMIT", 50))  # pending + running jobs
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", 60 * 60))  # keep finished jobs 1 hour
+JOB_EVENT_HISTORY = int(os.getenv("JOB_EVENT_HISTORY", 32))  # events kept per job for SSE resume
+
+# ----------------------------
+# Live Sessions
+# ----------------------------
+
+# Live recordings keep their transcript server-side; clients send only new
+# text.
+LIVE_SESSION_IDLE_SECONDS = int(os.getenv("LIVE_SESSION_IDLE_SECONDS", 30 * 60))
+LIVE_MAX_SESSIONS = int(os.getenv("LIVE_MAX_SESSIONS", 100))
+
+# Audio uploaded in segments while recording is transcribed in the
+# background, so on stop only the last segment is still outstanding.
+LIVE_TRANSCRIPTION_WORKERS = int(os.getenv("LIVE_TRANSCRIPTION_WORKERS", 2))
+
+# The live transcript is summarized window by window (of about this many
+# tokens) while recording; on stop only the last window and a short merge
+# call remain.
+LIVE_SUMMARY_WINDOW_TOKENS = int(os.getenv("LIVE_SUMMARY_WINDOW_TOKENS", 1500))
+
+# Q&A answers are grounded in the QA_TOP_K transcript windows (of about
+# QA_WINDOW_CHARS each) most relevant to the question plus the most recent
+# QA_TAIL_CHARS, so prompt size stays flat as meetings get longer. The
+# index keeps at most QA_INDEX_MAX_WINDOWS windows per session.
+QA_WINDOW_CHARS = int(os.getenv("QA_WINDOW_CHARS", 600))
+QA_TOP_K = int(os.getenv("QA_TOP_K", 4))
+QA_TAIL_CHARS = int(os.getenv("QA_TAIL_CHARS", 2000))
+QA_INDEX_MAX_WINDOWS = int(os.getenv("QA_INDEX_MAX_WINDOWS", 500))
+
+# Snippets are only sent for Q&A detection when a local check (question
+# marks, interrogative words) scores at least QA_PREFILTER_THRESHOLD (0-1).
+QA_PREFILTER_ENABLED = os.getenv("QA_PREFILTER_ENABLED", "true").lower() in ("true", "1", "yes")
+QA_PREFILTER_THRESHOLD = float(os.getenv("QA_PREFILTER_THRESHOLD", 0.5))
 
 # ----------------------------
 # Default User (Phase 1)
@@ -6,12 +6,48 @@ with single-user support for Phase 1.
 """
 
 from datetime import datetime
+import json
+import threading
+import time
 import uuid
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
+
+from .config import SQLITE_PRAGMAS, SETTINGS_CACHE_TTL_SECONDS
 
 db = SQLAlchemy()
 
 
+def init_db(app, pragmas: dict = None) -> None:
+    """
+    Initialize the database for an app.
+
+    SQLite file databases get the connection profile from
+    config.SQLITE_PRAGMAS (WAL, synchronous, busy timeout, mmap and page
+    cache size) on every new pooled connection.
+
+    Args:
+        app: Flask app (SQLALCHEMY_* settings already in app.config)
+        pragmas: PRAGMA name -> value, overriding config.SQLITE_PRAGMAS
+    """
+    db.init_app(app)
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+    with app.app_context():
+        engine = db.engine
+        if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+            return
+
+        def apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name} = {value}")
+            finally:
+                cursor.close()
+
+        event.listen(engine, "connect", apply_pragmas)
+
+
 class User(db.Model):
     """
     User model (created but not exposed to UI in Phase 1).
@@ -74,6 +110,7 @@ class Meeting(db.Model):
     memo_json = db.Column(db.JSON)
     
     # Metadata
+    meeting_type = db.Column(db.String(50))  # copied from memo_json for filtering
     metadata_json = db.Column(db.JSON)  # {agenda: "", attendees: "", meeting_type: "", etc}
     
     # Timestamps
@@ -82,6 +119,12 @@ class Meeting(db.Model):
     
     # Relationships
     exports = db.relationship('ExportHistory', backref='meeting', lazy=True, cascade='all, delete-orphan')
+
+    # Listing pages walk (created_at, id) newest first per user
+    __table_args__ = (
+        db.Index('ix_meetings_user_created', 'user_id', 'created_at', 'id'),
+        db.Index('ix_meetings_user_type_created', 'user_id', 'meeting_type', 'created_at'),
+    )
     
     def to_dict(self):
         """Serialize meeting to dictionary."""
@@ -97,10 +140,76 @@ class Meeting(db.Model):
             'action_items': self.action_items_original,
             'action_items_english': self.action_items_english,
             'memo_json': self.memo_json,
+            'meeting_type': self.meeting_type,
             'metadata': self.metadata_json,
         }
 
 
+# Full-text index over meeting content (SQLite FTS5), kept in sync with the
+# meetings table by triggers. Rows share the meeting's rowid; translated
+# meetings are indexed in both languages. Action items are JSON lists and are
+# indexed as their decoded strings, not the (ASCII-escaped) JSON text.
+_MEETINGS_FTS_VALUES = """
+            new.rowid, new.id, new.user_id,
+            json_extract(new.memo_json, '$.title'),
+            coalesce(new.summary_english, '') || char(10) || coalesce(new.summary_original, ''),
+            coalesce((SELECT group_concat(value, char(10)) FROM json_each(new.action_items_english)), '')
+                || char(10)
+                || coalesce((SELECT group_concat(value, char(10)) FROM json_each(new.action_items_original)), ''),
+            coalesce(new.transcript_english, '')
+                || CASE WHEN new.was_translated THEN char(10) || coalesce(new.transcript_original, '') ELSE '' END
+"""
+
+MEETINGS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+        meeting_id UNINDEXED,
+        user_id UNINDEXED,
+        title,
+        summary,
+        action_items,
+        transcript,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+        INSERT INTO meetings_fts (rowid, meeting_id, user_id, title, summary, action_items, transcript)
+        VALUES ({_MEETINGS_FTS_VALUES});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+        DELETE FROM meetings_fts WHERE rowid = old.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE OF
+        user_id, memo_json, summary_english, summary_original, action_items_english,
+        action_items_original, transcript_english, transcript_original, was_translated
+    ON meetings BEGIN
+        DELETE FROM meetings_fts WHERE rowid = old.rowid;
+        INSERT INTO meetings_fts (rowid, meeting_id, user_id, title, summary, action_items, transcript)
+        VALUES ({_MEETINGS_FTS_VALUES});
+    END
+    """,
+]
+
+for _statement in MEETINGS_FTS_DDL:
+    event.listen(Meeting.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Meeting.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS meetings_fts").execute_if(dialect="sqlite"),
+)
+
+
+# (database URL, user_id) -> (loaded_at, {key: typed value}); see Setting.get_all
+_settings_cache: dict = {}
+_settings_cache_lock = threading.Lock()
+# Bumped on every invalidation; a load that overlapped one is not cached
+_settings_generation = 0
+
+
 class Setting(db.Model):
     """
     Store admin/user settings (language preferences, etc).
@@ -124,34 +233,104 @@ class Setting(db.Model):
     
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    @staticmethod
+    def _convert(value, data_type):
+        """Convert a stored string value to its declared type."""
+        if value is None:
+            return None
+        if data_type == 'bool':
+            return value.lower() in ('true', '1', 'yes')
+        elif data_type == 'int':
+            return int(value)
+        elif data_type == 'json':
+            return json.loads(value)
+        return value
+
+    @staticmethod
+    def get_all(user_id=1):
+        """
+        All of a user's settings as typed values.
+
+        Loaded with one query and cached until the next write through
+        set/set_many (or SETTINGS_CACHE_TTL_SECONDS).
+        """
+        cache_key = (str(db.engine.url), user_id)
+        now = time.monotonic()
+        with _settings_cache_lock:
+            cached = _settings_cache.get(cache_key)
+            generation = _settings_generation
+        if cached and now - cached[0] < SETTINGS_CACHE_TTL_SECONDS:
+            return dict(cached[1])
+
+        rows = db.session.query(Setting.key, Setting.value, Setting.data_type).filter_by(user_id=user_id)
+        values = {key: Setting._convert(value, data_type) for key, value, data_type in rows}
+        with _settings_cache_lock:
+            # A write landed while loading: these values may be stale
+            if generation == _settings_generation:
+                _settings_cache[cache_key] = (now, values)
+        return dict(values)
+
+    @staticmethod
+    def get_many(keys, user_id=1, default=None):
+        """Get several setting values at once ({key: value}, `default` if unset)."""
+        values = Setting.get_all(user_id)
+        return {key: values.get(key, default) for key in keys}
+
     @staticmethod
     def get(key, user_id=1, default=None):
         """Get a setting value by key (Phase 1 uses user_id=1)."""
-        setting = Setting.query.filter_by(user_id=user_id, key=key).first()
-        if setting:
-            # Convert value to appropriate type
-            if setting.data_type == 'bool':
-                return setting.value.lower() in ('true', '1', 'yes')
-            elif setting.data_type == 'int':
-                return int(setting.value)
-            elif setting.data_type == 'json':
-                import json
-                return json.loads(setting.value)
-            return setting.value
-        return default
-    
+        return Setting.get_all(user_id).get(key, default)
+
+    @staticmethod
+    def set_many(values, user_id=1):
+        """
+        Set several settings in one transaction.
+
+        Args:
+            values: {key: (value, data_type)}
+            user_id: Owner of the settings
+
+        Returns:
+            {key: Setting}
+        """
+        existing = {
+            setting.key: setting
+            for setting in Setting.query.filter(
+                Setting.user_id == user_id, Setting.key.in_(list(values))
+            )
+        }
+        saved = {}
+        for key, (value, data_type) in values.items():
+            if data_type == 'json' and not isinstance(value, str):
+                value = json.dumps(value)
+            setting = existing.get(key)
+            if setting:
+                setting.value = str(value)
+                setting.data_type = data_type
+            else:
+                setting = Setting(user_id=user_id, key=key, value=str(value), data_type=data_type)
+                db.session.add(setting)
+            saved[key] = setting
+        try:
+            db.session.commit()
+        finally:
+            Setting.invalidate_cache(user_id)
+        return saved
+
     @staticmethod
     def set(key, value, data_type='string', user_id=1):
         """Set a setting value (Phase 1 uses user_id=1)."""
-        setting = Setting.query.filter_by(user_id=user_id, key=key).first()
-        if setting:
-            setting.value = str(value)
-            setting.data_type = data_type
-        else:
-            setting = Setting(user_id=user_id, key=key, value=str(value), data_type=data_type)
-        db.session.add(setting)
-        db.session.commit()
-        return setting
+        return Setting.set_many({key: (value, data_type)}, user_id=user_id)[key]
+
+    @staticmethod
+    def invalidate_cache(user_id=None):
+        """Drop cached settings for one user (or everyone)."""
+        global _settings_generation
+        with _settings_cache_lock:
+            _settings_generation += 1
+            for cache_key in list(_settings_cache):
+                if user_id is None or cache_key[1] == user_id:
+                    del _settings_cache[cache_key]
     
     def to_dict(self):
         """Serialize setting to dictionary."""
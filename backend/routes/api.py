@@ -2,27 +2,55 @@
 API routes for Meeting Assistant.
 
 Phase 1 endpoints:
-- POST /api/process - Process audio file
+- POST /api/process - Queue audio file for processing
+- GET /api/jobs/<job_id> - Processing job status and result
+- GET /api/process/<job_id>/events - Processing stage events (SSE)
 - POST /api/detect_questions - Detect Q&A in transcript
+- POST /api/live/sessions - Open a live recording session
+- GET /api/live/sessions/<session_id> - Live session state
+- GET /api/live/sessions/<session_id>/memo - Rolling memo so far
+- POST /api/live/sessions/<session_id>/append - Add new transcript text, detect Q&A
+- POST /api/live/sessions/<session_id>/audio - Upload a recorded audio segment
+- POST /api/live/sessions/<session_id>/stop - Finish recording, queue summary
+- DELETE /api/live/sessions/<session_id> - Close a live session
 - POST /api/translate_content - Translate content to target language
+- GET /api/meetings - List meetings (keyset pagination, filters)
+- GET /api/search?q= - Full-text search across meetings
 - GET /api/download/<meeting_id> - Download PDF
+- GET /api/export/bulk - Download many meetings as a streamed ZIP
 - POST /api/discard/<meeting_id> - Delete meeting
+- GET /api/cache/stats - Cache hit/miss and LLM-calls-saved counters
 - POST /api/open_transcripts - Open transcripts folder
 """
 
+import hashlib
+import json
 import logging
 import os
 import subprocess
-from flask import Blueprint, request, jsonify, send_file, abort, url_for, current_app
+import uuid
+from datetime import datetime, timezone
+from flask import (
+    Blueprint, Response, request, jsonify, send_file, abort, url_for, current_app,
+    stream_with_context,
+)
 from werkzeug.utils import secure_filename
-from io import BytesIO
 
-from ..services import transcription, translation, summarization, qa_detection, export
+from ..services import (
+    transcription, translation, qa_detection, export, jobs, pipeline, llm, live, meetings, janitor,
+    render_pool,
+)
 from ..models import Setting
-from ..config import UPLOAD_FOLDER, TRANSCRIPT_FOLDER
+from ..config import UPLOAD_FOLDER, TRANSCRIPT_FOLDER, DEFAULT_USER_ID, JANITOR_ENABLED
 
 logger = logging.getLogger(__name__)
 
+# Comment line sent on idle SSE streams so proxies keep the connection open
+SSE_KEEPALIVE_SECONDS = 15
+
+# Suggested client back-off when the PDF render queue is full
+RENDER_RETRY_AFTER_SECONDS = 5
+
 # Create blueprint
 api = Blueprint('api', __name__, url_prefix='/api')
 
@@ -35,6 +63,13 @@ def before_request():
         export.set_transcript_folder(TRANSCRIPT_FOLDER)
 
 
+@api.before_app_request
+def start_janitor():
+    """Start the background janitor with the first request this process serves."""
+    if not janitor.running() and current_app.config.get("JANITOR_ENABLED", JANITOR_ENABLED):
+        janitor.start()
+
+
 @api.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -44,30 +79,19 @@ def health():
 @api.route('/process', methods=['POST'])
 def process_audio():
     """
-    Process audio file: transcribe, translate, summarize.
+    Accept an audio upload and queue it for processing.
     
     Form data:
     - audio_file: Audio file upload
     - agenda: Optional meeting agenda
     
-    Returns:
-    - meeting_id: Unique ID for this meeting
-    - transcript: Original language transcript
-    - english_transcript: Translated to English (if needed)
-    - summary: Original language summary
-    - english_summary: English summary
-    - action_items: Original language action items
-    - english_action_items: English action items
-    - was_translated: Whether translation occurred
-    - original_language: Detected language
-    - download_url: URL to download PDF
-    - discard_url: URL to delete meeting
-    - memo_json: Structured meeting data
+    Returns (202):
+    - job_id: ID of the queued processing job
+    - status: Job status ('queued')
+    - status_url: URL to poll for progress and the final result
+    - events_url: Server-Sent Events stream of stage transitions
     """
     try:
-        # Cleanup old files
-        _cleanup_old_files()
-
         # Validate file
         if "audio_file" not in request.files:
             return jsonify({"error": "No file part in request."}), 400
@@ -76,118 +100,284 @@ def process_audio():
         if file.filename == "":
             return jsonify({"error": "No file selected."}), 400
 
-        # Save uploaded file
+        # Save uploaded file (unique prefix: jobs may run concurrently)
         filename = secure_filename(file.filename)
-        save_path = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(save_path)
-        logger.info("Saved audio file: %s", os.path.abspath(save_path))
+        save_path = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}_{filename}")
+        # Pinned until the job is done with it (process_meeting unpins)
+        janitor.pin(save_path)
+        try:
+            audio_digest = _save_upload(file, save_path)
+        except Exception:
+            # Client disconnect, size limit, disk full: drop the partial file
+            janitor.unpin(save_path)
+            _remove_quietly(save_path)
+            raise
+        logger.info("Saved audio file: %s (sha256 %s)", os.path.abspath(save_path), audio_digest[:12])
 
         # Get optional agenda from request
         agenda = request.form.get("agenda", "").strip()
 
-        # Step 1: Transcribe
         try:
-            transcript_text, source_language = transcription.transcribe_audio_file(save_path)
-        except Exception as e:
-            logger.exception("Transcription failed")
-            return jsonify({"error": f"Transcription failed: {e}"}), 500
+            job = jobs.submit(
+                pipeline.process_meeting, save_path, filename, agenda,
+                audio_digest=audio_digest,
+            )
+        except jobs.QueueFullError as e:
+            logger.warning("Rejecting upload: %s", e)
+            janitor.unpin(save_path)
+            os.remove(save_path)
+            return jsonify({"error": "Server is busy, please retry shortly."}), 503
+        except BaseException:
+            # No job owns the file, so nothing else will unpin it
+            janitor.unpin(save_path)
+            _remove_quietly(save_path)
+            raise
 
-        original_transcript = transcript_text
+        return jsonify({
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": url_for("api.get_job", job_id=job.id),
+            "events_url": url_for("api.job_events", job_id=job.id),
+        }), 202
 
-        # Step 2: Detect language and translate if needed
-        translated_transcript, detected_language, was_translated = (
-            translation.detect_and_translate_if_needed(transcript_text, source_language)
-        )
+    except Exception as e:
+        logger.exception("Unexpected error in process_audio")
+        return jsonify({"error": f"Unexpected error: {e}"}), 500
 
-        if was_translated:
-            logger.info("Transcript translated from %s to English", detected_language)
 
-        # Step 3: Summarize and extract action items
-        try:
-            summary, action_items, memo_json = (
-                summarization.summarize_and_extract_actions(
-                    translated_transcript, agenda, detected_language
+@api.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Report progress of a processing job.
+    
+    Returns:
+    - job_id, status ('queued'|'running'|'succeeded'|'failed'), stage, progress (0-100)
+    - error: Error message if the job failed
+    - result: Once succeeded, the processed meeting (transcript, summary,
+      action items, languages, memo_json, download_url, discard_url)
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+
+    data = job.to_dict()
+    if data.get("result"):
+        data["result"] = _with_meeting_urls(data["result"])
+    return jsonify(data)
+
+
+@api.route('/process/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    Stream a processing job's stage transitions as Server-Sent Events.
+    
+    Events (in order): uploaded, transcribed, language_detected, translated,
+    summarized, back_translated, saved, then done (with the full result) or
+    failed. Each event's data is JSON with stage, progress and the partial
+    results produced by that stage. Reconnecting clients resume after the
+    Last-Event-ID they received.
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+
+    try:
+        last_id = int(request.headers.get("Last-Event-ID") or request.args.get("last_id") or 0)
+    except ValueError:
+        last_id = 0
+
+    def stream():
+        nonlocal last_id
+        while True:
+            events = job.events_after(last_id, timeout=SSE_KEEPALIVE_SECONDS)
+            if not events:
+                if job.is_finished:
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                last_id = event["id"]
+                data = event["data"]
+                if event["event"] == "saved":
+                    data = _with_meeting_urls(data)
+                elif event["event"] == "done" and data.get("result"):
+                    data = {**data, "result": _with_meeting_urls(data["result"])}
+                yield (
+                    f"id: {event['id']}\n"
+                    f"event: {event['event']}\n"
+                    f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
                 )
-            )
-        except Exception as e:
-            logger.exception("Summarization failed")
-            summary, action_items, memo_json = "", [], {}
-
-        # Step 4: Generate original language versions if translated
-        original_summary = summary
-        original_action_items = action_items
-        
-        if was_translated and detected_language and detected_language.lower() != "english":
-            original_summary, original_action_items = _translate_results_back(
-                summary, action_items, detected_language
-            )
+                if event["event"] in ("done", "failed"):
+                    return
 
-        # Step 5: Save meeting artifacts
-        meeting_id = export.new_meeting_id()
-        
-        try:
-            export.save_meeting_artifacts(
-                meeting_id=meeting_id,
-                filename=filename,
-                transcript=translated_transcript,
-                summary=summary,
-                action_items=action_items,
-                original_language=detected_language,
-                was_translated=was_translated,
-                memo_json=memo_json,
-            )
-        except Exception as e:
-            logger.exception("Failed to save meeting artifacts")
-            return jsonify({"error": f"Failed to save meeting: {e}"}), 500
+    return Response(
+        stream_with_context(stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-        # Step 6: Cleanup audio file
-        try:
-            os.remove(save_path)
-            logger.info("Deleted audio file: %s", save_path)
-        except Exception as e:
-            logger.warning("Could not delete audio file: %s", e)
 
-        return jsonify({
-            "meeting_id": meeting_id,
-            "transcript": original_transcript,
-            "english_transcript": translated_transcript,
-            "summary": original_summary,
-            "english_summary": summary,
-            "action_items": original_action_items,
-            "english_action_items": action_items,
-            "original_language": detected_language,
-            "was_translated": was_translated,
-            "download_url": url_for("api.download_pdf", meeting_id=meeting_id),
-            "discard_url": url_for("api.discard_meeting", meeting_id=meeting_id),
-            "memo_json": memo_json,
-        })
+@api.route('/meetings', methods=['GET'])
+def list_meetings():
+    """
+    List meetings newest first, one page at a time.
 
-    except Exception as e:
-        logger.exception("Unexpected error in process_audio")
-        return jsonify({"error": f"Unexpected error: {e}"}), 500
+    Query params:
+    - limit: Page size
+    - cursor: next_cursor from the previous page
+    - language: Original language (e.g. "Spanish")
+    - meeting_type: Memo meeting type (e.g. "standup")
+    - from, to: Local ISO dates/datetimes bounding created_at
+
+    Returns:
+        JSON with meetings (lightweight fields plus download_url) and
+        next_cursor (null on the last page)
+    """
+    args = request.args
+    try:
+        limit = int(args["limit"]) if args.get("limit") else None
+        date_from = meetings.parse_date(args["from"]) if args.get("from") else None
+        date_to = meetings.parse_date(args["to"], end=True) if args.get("to") else None
+        page, next_cursor = meetings.list_meetings(
+            user_id=DEFAULT_USER_ID,
+            limit=limit,
+            cursor=args.get("cursor"),
+            language=args.get("language"),
+            meeting_type=args.get("meeting_type"),
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    for item in page:
+        item["download_url"] = url_for("api.download_pdf", meeting_id=item["meeting_id"])
+    return jsonify({"meetings": page, "next_cursor": next_cursor})
+
+
+@api.route('/search', methods=['GET'])
+def search_meetings():
+    """
+    Full-text search across meetings.
+
+    Query params:
+    - q: Search text (all words must match; the last may be a prefix)
+    - limit: Max results
+
+    Returns:
+        JSON with results (listing fields plus rank, matched_in, snippet
+        as escaped HTML with <mark>-highlighted terms, download_url)
+    """
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "Missing search query (q)."}), 400
+    try:
+        limit = int(request.args["limit"]) if request.args.get("limit") else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit."}), 400
+
+    results = meetings.search_meetings(query, user_id=DEFAULT_USER_ID, limit=limit)
+    for item in results:
+        item["download_url"] = url_for("api.download_pdf", meeting_id=item["meeting_id"])
+    return jsonify({"query": query, "results": results})
+
+
+@api.route('/export/bulk', methods=['GET'])
+def bulk_export():
+    """
+    Download many meetings as one ZIP archive.
+
+    The archive is streamed as it is built: each meeting is loaded and
+    rendered only when its entry is written, so memory stays flat
+    however many meetings match.
+
+    Query params:
+    - format: pdf (default), json or md
+    - from, to: Local ISO dates/datetimes bounding created_at
+    - language, meeting_type: As for GET /api/meetings
+
+    Returns:
+        application/zip attachment with one <meeting_id>.<format> entry
+        per meeting
+    """
+    args = request.args
+    fmt = (args.get("format") or "pdf").lower()
+    if fmt not in export.BULK_EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format: {fmt}"}), 400
+    # Validate before streaming starts; errors can't change the status afterwards
+    try:
+        date_from = meetings.parse_date(args["from"]) if args.get("from") else None
+        date_to = meetings.parse_date(args["to"], end=True) if args.get("to") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    meeting_ids = meetings.iter_meeting_ids(
+        user_id=DEFAULT_USER_ID,
+        language=args.get("language"),
+        meeting_type=args.get("meeting_type"),
+        date_from=date_from,
+        date_to=date_to,
+    )
+    filename = f"meetings_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{fmt}.zip"
+    return Response(
+        stream_with_context(export.iter_zip_export(meeting_ids, fmt)),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @api.route('/download/<meeting_id>', methods=['GET'])
 def download_pdf(meeting_id):
-    """Download PDF report for a meeting."""
+    """
+    Download PDF report for a meeting.
+
+    Reports are rendered once (in the render process pool) and served
+    from the PDF cache. Responses carry an ETag (the artifact's content
+    hash) and Last-Modified, and conditional requests get 304 Not
+    Modified. When the render queue is full the response is 503 with
+    Retry-After.
+    """
     try:
         data = export.load_meeting_artifacts(meeting_id)
     except (ValueError, FileNotFoundError):
         logger.warning("Meeting not found: %s", meeting_id)
         abort(404)
 
+    etag = export.pdf_cache_key(data)
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    try:
+        pdf_path, etag = export.render_pdf_cached(data)
+    except render_pool.QueueFullError as e:
+        logger.warning("Rejecting PDF download: %s", e)
+        response = jsonify({"error": "Server is busy, please retry shortly."})
+        response.headers["Retry-After"] = str(RENDER_RETRY_AFTER_SECONDS)
+        return response, 503
+    except Exception as e:
+        logger.exception("Error generating PDF: %s", e)
+        abort(500)
+
     try:
-        pdf_bytes = export.build_pdf_bytes(data)
         filename = f"{meeting_id}_meeting_report.pdf"
 
         return send_file(
-            BytesIO(pdf_bytes),
+            pdf_path,
             mimetype="application/pdf",
             as_attachment=True,
             download_name=filename,
+            etag=etag,
+            last_modified=_artifact_last_modified(data),
+            conditional=True,
         )
     except Exception as e:
-        logger.exception("Error generating PDF: %s", e)
+        logger.exception("Error sending PDF: %s", e)
         abort(500)
 
 
@@ -196,6 +386,10 @@ def discard_meeting(meeting_id):
     """Delete a meeting and its artifacts."""
     try:
         export.safe_meeting_id(meeting_id)
+        try:
+            export.pdf_cache.delete(export.pdf_cache_key(export.load_meeting_artifacts(meeting_id)))
+        except FileNotFoundError:
+            pass
         export.delete_meeting_artifacts(meeting_id)
     except ValueError:
         logger.warning("Invalid meeting ID: %s", meeting_id)
@@ -239,14 +433,172 @@ def detect_questions():
         return jsonify({"questions": [], "error": str(e)}), 500
 
 
+@api.route('/live/sessions', methods=['POST'])
+def create_live_session():
+    """
+    Open a live recording session.
+
+    JSON body (optional):
+    - agenda: Meeting agenda, used for the rolling summary
+
+    Returns (201):
+    - session_id, append_url
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        session = live.create_session(agenda=(data.get("agenda") or "").strip())
+    except live.SessionLimitError as e:
+        logger.warning("Rejected live session: %s", e)
+        return jsonify({"error": "Too many live sessions, try again later"}), 503
+
+    return jsonify({
+        "session_id": session.id,
+        "append_url": url_for("api.append_live_transcript", session_id=session.id),
+    }), 201
+
+
+@api.route('/live/sessions/<session_id>', methods=['GET', 'DELETE'])
+def live_session(session_id):
+    """Get the state of a live session, or close it."""
+    if request.method == 'DELETE':
+        session = live.close_session(session_id)
+        if session:
+            # Never stopped, so no job will retry its failed segments
+            live.discard_failed_segments(session)
+    else:
+        session = live.get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+    return jsonify(session.to_dict())
+
+
+@api.route('/live/sessions/<session_id>/memo', methods=['GET'])
+def live_session_memo(session_id):
+    """
+    Running memo of a live session, merged from the transcript windows
+    summarized so far (same schema as a finished meeting's memo_json).
+    """
+    session = live.get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+    return jsonify({
+        "memo": session.summary.memo(),
+        "windows_summarized": session.summary.windows_summarized,
+    })
+
+
+@api.route('/live/sessions/<session_id>/append', methods=['POST'])
+def append_live_transcript(session_id):
+    """
+    Append transcript text spoken since the last call and detect questions.
+
+    JSON body:
+    - text: New transcript text only (the server keeps the context)
+
+    Returns:
+    - questions: Newly detected questions with answers
+    - question_count, transcript_chars
+    """
+    session = live.get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+
+    data = request.get_json() or {}
+    text = data.get("text") or ""
+
+    try:
+        questions = live.append_transcript(session, text)
+    except Exception as e:
+        logger.exception("Live question detection error: %s", e)
+        return jsonify({"questions": [], "error": str(e)}), 500
+
+    state = session.to_dict()
+    return jsonify({
+        "questions": questions,
+        "question_count": state["question_count"],
+        "transcript_chars": state["transcript_chars"],
+    })
+
+
+@api.route('/live/sessions/<session_id>/audio', methods=['POST'])
+def upload_live_audio(session_id):
+    """
+    Upload one self-contained audio segment recorded during a live session.
+
+    Form data:
+    - audio_file: Audio segment
+    - seq: Segment sequence number (0, 1, 2, ...)
+
+    Returns (202):
+    - seq, audio_segments
+    """
+    session = live.get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+
+    try:
+        seq = _save_live_segment(session)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except live.SessionStoppedError as e:
+        return jsonify({"error": str(e)}), 409
+
+    return jsonify({"seq": seq, "audio_segments": session.to_dict()["audio_segments"]}), 202
+
+
+@api.route('/live/sessions/<session_id>/stop', methods=['POST'])
+def stop_live_session(session_id):
+    """
+    Stop a live session and queue summarization of its transcribed audio.
+
+    Form data:
+    - audio_file: Optional final audio segment
+    - seq: Sequence number of the final segment
+    - agenda: Optional meeting agenda
+
+    Returns (202): same as POST /api/process
+    """
+    session = live.get_session(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+
+    try:
+        if "audio_file" in request.files and request.files["audio_file"].filename:
+            _save_live_segment(session)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except live.SessionStoppedError as e:
+        return jsonify({"error": str(e)}), 409
+
+    agenda = request.form.get("agenda", "").strip()
+
+    # Stop first, so no segment can arrive after the job snapshots the pending ones
+    live.stop_session(session)
+    try:
+        job = jobs.submit(pipeline.finish_live_meeting, session, agenda)
+    except jobs.QueueFullError as e:
+        # Session stays open so the client can retry the stop
+        logger.warning("Rejecting live session stop: %s", e)
+        live.resume_session(session)
+        return jsonify({"error": "Server is busy, please retry shortly."}), 503
+
+    live.close_session(session_id)
+    return jsonify({
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": url_for("api.get_job", job_id=job.id),
+        "events_url": url_for("api.job_events", job_id=job.id),
+    }), 202
+
+
 @api.route('/settings', methods=['GET', 'PUT'])
 def settings():
     """Get or update settings for the default user (Phase 1)."""
-    user_id = 1
+    user_id = DEFAULT_USER_ID
 
     if request.method == 'GET':
         keys = ["default_language", "summary_language", "auto_detect_qa"]
-        settings_map = {key: Setting.get(key, user_id=user_id) for key in keys}
+        settings_map = Setting.get_many(keys, user_id=user_id)
         return jsonify({"settings": settings_map})
 
     payload = request.get_json(silent=True) or {}
@@ -256,6 +608,7 @@ def settings():
         return jsonify({"error": "Invalid settings payload."}), 400
 
     updated = {}
+    to_store = {}
     for key, value in incoming.items():
         if isinstance(value, bool):
             data_type = "bool"
@@ -270,9 +623,11 @@ def settings():
             data_type = "string"
             stored_value = str(value)
 
-        Setting.set(key, stored_value, data_type=data_type, user_id=user_id)
+        to_store[key] = (stored_value, data_type)
         updated[key] = value
 
+    Setting.set_many(to_store, user_id=user_id)
+
     return jsonify({"status": "ok", "settings": updated})
 
 
@@ -319,6 +674,17 @@ def translate_content():
         return jsonify({"error": str(e)}), 500
 
 
+@api.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Hit/miss counters and size of the persistent caches, plus Q&A pre-filter savings."""
+    return jsonify({
+        "transcripts": transcription.transcript_cache.stats(),
+        "llm_responses": llm.response_cache.stats(),
+        "pdf_reports": export.pdf_cache.stats(),
+        "qa_prefilter": qa_detection.prefilter_stats(),
+    })
+
+
 @api.route('/open_transcripts', methods=['POST'])
 def open_transcripts():
     """Open transcripts folder in system file browser (macOS only)."""
@@ -336,54 +702,80 @@ def open_transcripts():
 # ----------------------------
 
 
-def _cleanup_old_files():
-    """Delete old audio and transcript files (older than 1 hour)."""
-    import time
-    from ..config import MAX_FILE_AGE_SECONDS
+def _with_meeting_urls(payload: dict) -> dict:
+    """Add download/discard URLs to a payload that carries a meeting_id."""
+    meeting_id = payload.get("meeting_id")
+    if not meeting_id:
+        return payload
+    return {
+        **payload,
+        "download_url": url_for("api.download_pdf", meeting_id=meeting_id),
+        "discard_url": url_for("api.discard_meeting", meeting_id=meeting_id),
+    }
 
-    now = time.time()
-    for folder in (UPLOAD_FOLDER, TRANSCRIPT_FOLDER):
-        if not os.path.isdir(folder):
-            continue
-        try:
-            for name in os.listdir(folder):
-                path = os.path.join(folder, name)
-                try:
-                    if os.path.isfile(path):
-                        age = now - os.path.getmtime(path)
-                        if age > MAX_FILE_AGE_SECONDS:
-                            os.remove(path)
-                            logger.info("Cleaned up old file: %s", path)
-                except Exception as e:
-                    logger.warning("Error cleaning up %s: %s", path, e)
-        except Exception as e:
-            logger.warning("Error listing folder %s: %s", folder, e)
-
-
-def _translate_results_back(summary: str, action_items: list, target_language: str) -> tuple:
+
+def _artifact_last_modified(data: dict):
+    """Creation time of a meeting artifact (local ISO string) as aware UTC, or None."""
+    try:
+        return datetime.fromisoformat(data.get("created_at") or "").astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def _save_upload(file, save_path: str, chunk_size: int = 1024 * 1024) -> str:
     """
-    Translate summary and action items back to original language.
+    Stream an uploaded file to disk, hashing it on the way.
     
     Returns:
-        Tuple of (translated_summary, translated_action_items)
+        SHA-256 hex digest of the file contents
     """
-    if not target_language or target_language.lower() == "unknown":
-        return summary, action_items
-
+    digest = hashlib.sha256()
+    with open(save_path, "wb") as out:
+        while True:
+            chunk = file.stream.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+    janitor.track(save_path)
+    return digest.hexdigest()
+
+
+def _remove_quietly(path: str) -> None:
+    """Delete a file if it exists, logging instead of raising on failure."""
     try:
-        translated_summary = translation.translate_text(summary, target_language)
-    except Exception as e:
-        logger.warning("Could not translate summary to %s: %s", target_language, e)
-        translated_summary = summary
-
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not delete %s: %s", path, e)
+
+
+def _save_live_segment(session) -> int:
+    """Save an uploaded live audio segment and queue it; returns its seq."""
+    file = request.files.get("audio_file")
+    if file is None or file.filename == "":
+        raise ValueError("No audio segment in request.")
     try:
-        action_items_text = "\n".join(action_items)
-        translated_items = translation.translate_text(action_items_text, target_language)
-        translated_action_items = [
-            item.strip() for item in translated_items.split('\n') if item.strip()
-        ]
-    except Exception as e:
-        logger.warning("Could not translate action items to %s: %s", target_language, e)
-        translated_action_items = action_items
-
-    return translated_summary, translated_action_items
+        seq = int(request.form.get("seq", ""))
+    except ValueError:
+        raise ValueError("Missing or invalid segment sequence number.")
+    if seq < 0:
+        raise ValueError("Missing or invalid segment sequence number.")
+
+    filename = secure_filename(file.filename) or "segment.webm"
+    # Unique per upload: a retried seq must not overwrite the queued file
+    save_path = os.path.join(
+        UPLOAD_FOLDER, f"live_{session.id}_{seq:05d}_{uuid.uuid4().hex[:8]}_{filename}"
+    )
+    try:
+        _save_upload(file, save_path)
+    except Exception:
+        _remove_quietly(save_path)
+        raise
+    try:
+        live.add_audio_segment(session, seq, save_path)
+    except live.SessionStoppedError:
+        os.remove(save_path)
+        raise
+    return seq
@@ -0,0 +1,303 @@
+"""
+Persistent caches.
+
+SQLiteCache stores JSON values in one SQLite file. It is used to avoid
+paying twice for expensive API results, such as the transcript of a
+re-uploaded recording. Entries expire after a TTL, and the least
+recently used entries are evicted once the entry/byte caps are exceeded.
+
+FileCache stores binary blobs (e.g. rendered PDFs) as files in a folder
+so they can be streamed straight from disk. The least recently used
+files are evicted above a byte cap.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """
+    JSON-serializable values keyed by string, stored in one SQLite file.
+
+    Safe to share between threads: each operation opens its own
+    short-lived connection. Hit/miss counters are per process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = None,
+        max_entries: int = None,
+        max_bytes: int = None,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._stats_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at "
+                "ON cache_entries (accessed_at)"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str, default=None):
+        """Return the cached value for key, or default on miss/expiry."""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, size, created_at FROM cache_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row and self.ttl_seconds and now - row[2] > self.ttl_seconds:
+                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    conn.commit()
+                    row = None
+                if row:
+                    conn.execute(
+                        "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Cache read failed (%s): %s", self.path, e)
+            row = None
+
+        with self._stats_lock:
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.bytes_saved += row[1]
+        return json.loads(row[0])
+
+    def set(self, key: str, value) -> None:
+        """Store value under key, then evict expired/excess entries."""
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, size, now, now),
+                )
+                self._evict(conn, now)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Cache write failed (%s): %s", self.path, e)
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Cache delete failed (%s): %s", self.path, e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the caps."""
+        if self.ttl_seconds:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+
+        if not (self.max_entries or self.max_bytes):
+            return
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        if (not self.max_entries or count <= self.max_entries) and (
+            not self.max_bytes or total <= self.max_bytes
+        ):
+            return
+
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed_at ASC"
+        ):
+            if (not self.max_entries or count <= self.max_entries) and (
+                not self.max_bytes or total <= self.max_bytes
+            ):
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+        logger.info("Evicted %d cache entries from %s", len(victims), self.path)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        entries, total = 0, 0
+        try:
+            conn = self._connect()
+            try:
+                entries, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Cache stats failed (%s): %s", self.path, e)
+
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "entries": entries,
+                "bytes": total,
+            }
+
+
+class FileCache:
+    """
+    Binary values keyed by string, one file per entry.
+
+    Keys must be safe file names (e.g. hex digests). Writes are atomic
+    (temp file + rename), so concurrent readers never see partial files.
+    Recency is tracked through file mtimes, which are refreshed on hits.
+    """
+
+    def __init__(self, folder: str, max_bytes: int = None, suffix: str = ""):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}{self.suffix}")
+
+    def get(self, key: str):
+        """Return the path of the cached file for key, or None on miss."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            with self._stats_lock:
+                self.misses += 1
+            return None
+        with self._stats_lock:
+            self.hits += 1
+        return path
+
+    def set(self, key: str, data: bytes) -> str:
+        """Store data under key, evict excess files, and return its path."""
+        os.makedirs(self.folder, exist_ok=True)
+        path = self.path_for(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Cache delete failed (%s): %s", self.folder, e)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every cached file."""
+        entries = []
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(self.suffix) or name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.folder, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: str = None) -> None:
+        """Drop least recently used files until under max_bytes."""
+        if not self.max_bytes:
+            return
+        with self._evict_lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                    total -= size
+                    removed += 1
+                except OSError as e:
+                    logger.warning("Cache eviction failed (%s): %s", path, e)
+            if removed:
+                logger.info("Evicted %d cached files from %s", removed, self.folder)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        entries = self._entries()
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+            }
@@ -0,0 +1,92 @@
+"""
+Token-aware text segmentation.
+
+Splits long transcripts into segments that fit a token budget, breaking
+on speaker turns / lines first, then sentences, then words. Segments are
+exact substrings of the input (trailing whitespace included), so
+"".join(split_text(text, n)) == text and results can be reassembled in
+order with the original spacing.
+"""
+
+import re
+
+# Scripts where one character is roughly one token (no spaces between
+# words): Thai, kana, CJK ideographs (extension A, unified, compatibility),
+# Hangul. A regex character-class body, shared with qa_detection.
+DENSE_SCRIPT_RANGES = r"\u0e00-\u0e7f\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_DENSE_SCRIPT_RE = re.compile(f"[{DENSE_SCRIPT_RANGES}]")
+
+# Line breaks (speaker turns), sentence ends, then word gaps
+_LINE_RE = re.compile(r"[^\n]*\n+|[^\n]+$")
+_SENTENCE_RE = re.compile(r".+?(?:[.!?](?=\s)|[。！？]|$)\s*", re.S)
+_WORD_RE = re.compile(r"\S+\s*|\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate without a tokenizer.
+
+    Dense scripts (CJK, kana, Hangul, Thai) count one token per
+    character; everything else counts one token per ~4 characters.
+    """
+    if not text:
+        return 0
+    dense = len(_DENSE_SCRIPT_RE.findall(text))
+    return dense + (len(text) - dense + 3) // 4
+
+
+def _split_units(text: str, max_tokens: int) -> list[str]:
+    """Break text into pieces no larger than max_tokens, coarsest first."""
+    units = []
+    for line in _LINE_RE.findall(text):
+        if estimate_tokens(line) <= max_tokens:
+            units.append(line)
+            continue
+        for sentence in _SENTENCE_RE.findall(line):
+            if estimate_tokens(sentence) <= max_tokens:
+                units.append(sentence)
+                continue
+            for word in _WORD_RE.findall(sentence):
+                if estimate_tokens(word) <= max_tokens:
+                    units.append(word)
+                    continue
+                # Unbroken run (e.g. CJK without punctuation): hard split
+                step = max(1, max_tokens)
+                units.extend(word[i:i + step] for i in range(0, len(word), step))
+    return units
+
+
+def split_text(text: str, max_tokens: int) -> list[str]:
+    """
+    Split text into consecutive segments of at most ~max_tokens each.
+
+    Args:
+        text: Text to split
+        max_tokens: Token budget per segment
+
+    Returns:
+        List of segments whose concatenation is the original text
+    """
+    if not text:
+        return []
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    segments = []
+    current = ""
+    current_tokens = 0
+    for unit in _split_units(text, max_tokens):
+        unit_tokens = estimate_tokens(unit)
+        if current and current_tokens + unit_tokens > max_tokens:
+            segments.append(current)
+            current, current_tokens = "", 0
+        current += unit
+        current_tokens += unit_tokens
+    if current:
+        segments.append(current)
+    return segments
+
+
+def trailing_whitespace(segment: str) -> str:
+    """Return the whitespace a segment ends with (its separator)."""
+    return segment[len(segment.rstrip()):]
@@ -2,6 +2,9 @@
 Export service for meeting artifacts (PDF, JSON, etc).
 
 Handles PDF generation, meeting artifact storage, and export operations.
+Meetings are persisted to the Meeting table; per-meeting JSON files in
+TRANSCRIPT_FOLDER remain as an optional mirror and as the fallback
+outside an app context.
 Phase 1: PDF export only
 Phase 3: Add email export support
 """
@@ -9,14 +12,32 @@ Phase 3: Add email export support
 import os
 import re
 import json
+import hashlib
 import logging
-from datetime import datetime
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from io import BytesIO
+from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from flask import current_app, has_app_context
+
+from ..config import (
+    DEFAULT_USER_ID,
+    MEETING_JSON_MIRROR,
+    PDF_CACHE_FOLDER,
+    PDF_CACHE_MAX_BYTES,
+    RENDER_TIMEOUT_SECONDS,
+)
+from ..models import db, Meeting
+from . import janitor, render_pool
+from .cache import FileCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +45,22 @@ logger = logging.getLogger(__name__)
 TRANSCRIPT_FOLDER = None
 _MEETING_ID_RE = re.compile(r"^[A-Za-z0-9_-]{6,80}$")
 
+# Bump when the report layout changes so cached PDFs are re-rendered
+PDF_RENDER_VERSION = 2
+
+# Transcript lines longer than this are split at sentence ends into
+# separate paragraphs
+PDF_TRANSCRIPT_CHUNK_CHARS = 1200
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。！？])\s+")
+
+# Formats for GET /api/export/bulk
+BULK_EXPORT_FORMATS = ("pdf", "json", "md")
+
+# artifact hash -> rendered PDF report
+pdf_cache = FileCache(PDF_CACHE_FOLDER, max_bytes=PDF_CACHE_MAX_BYTES, suffix=".pdf")
+_prerender_executor = None
+_prerender_lock = threading.Lock()
+
 
 def set_transcript_folder(folder_path: str):
     """Set the transcript folder path (called from app.py)."""
@@ -70,6 +107,11 @@ def meeting_json_path(meeting_id: str) -> str:
     return os.path.join(TRANSCRIPT_FOLDER, f"{meeting_id}.json")
 
 
+def _db_available() -> bool:
+    """True inside an app context with Flask-SQLAlchemy initialized."""
+    return has_app_context() and "sqlalchemy" in current_app.extensions
+
+
 def save_meeting_artifacts(
     meeting_id: str,
     filename: str,
@@ -78,19 +120,36 @@ def save_meeting_artifacts(
     action_items: list,
     original_language: str = "English",
     was_translated: bool = False,
-    memo_json: dict = None
+    memo_json: dict = None,
+    transcript_original: str = None,
+    summary_original: str = None,
+    action_items_original: list = None,
+    duration_seconds: float = None,
+    metadata: dict = None,
+    user_id: int = DEFAULT_USER_ID,
 ) -> None:
-    """Save meeting data as JSON artifact.
-    
+    """Save meeting data to the Meeting table (and/or a JSON artifact).
+
+    Inside an app context the meeting is written to the database, plus a
+    JSON copy when MEETING_JSON_MIRROR is set. Without one (scripts,
+    tests) only the JSON artifact is written.
+
     Args:
         meeting_id: Unique meeting ID
         filename: Original audio filename
-        transcript: Full transcript text
-        summary: Generated summary
-        action_items: List of action items
+        transcript: Full transcript text (English)
+        summary: Generated summary (English)
+        action_items: List of action items (English)
         original_language: Detected language
         was_translated: Whether translation occurred
         memo_json: Optional structured memo data
+        transcript_original: Transcript in the original language
+            (defaults to `transcript`)
+        summary_original: Summary in the original language
+        action_items_original: Action items in the original language
+        duration_seconds: Recording length, if known
+        metadata: Optional extra data (agenda, meeting_type, ...)
+        user_id: Owner of the meeting
     """
     payload = {
         "meeting_id": meeting_id,
@@ -102,20 +161,117 @@ def save_meeting_artifacts(
         "summary": summary or "",
         "action_items": action_items or [],
         "memo_json": memo_json or {},
+        "transcript_original": transcript_original if transcript_original is not None else transcript or "",
+        "summary_original": summary_original if summary_original is not None else summary or "",
+        "action_items_original": (
+            action_items_original if action_items_original is not None else action_items or []
+        ),
+        "duration_seconds": duration_seconds,
+        "metadata": metadata or {},
     }
-    
+
+    if _db_available():
+        _save_meeting_row(payload, user_id)
+        if not MEETING_JSON_MIRROR:
+            return
+
     path = meeting_json_path(meeting_id)
     try:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
+        janitor.track(path)
         logger.info("Saved meeting artifacts to: %s", os.path.abspath(path))
     except Exception as e:
         logger.exception("Error saving meeting artifacts: %s", e)
         raise
 
 
+def meeting_from_artifact(data: dict, user_id: int = DEFAULT_USER_ID) -> Meeting:
+    """Build a Meeting row from an artifact dict (as saved to JSON).
+
+    Artifacts written before the database existed only have the English
+    fields; those are used for the original-language fields as well.
+    """
+    # Artifacts carry local time; the database stores naive UTC like the
+    # model defaults
+    try:
+        created_at = local_to_utc(datetime.fromisoformat(data.get("created_at") or ""))
+    except ValueError:
+        created_at = datetime.utcnow()
+
+    memo = data.get("memo_json") or {}
+    meeting_type = memo.get("meeting_type") if isinstance(memo, dict) else None
+
+    duration = data.get("duration_seconds")
+    transcript = data.get("transcript") or ""
+    summary = data.get("summary") or ""
+    action_items = data.get("action_items") or []
+    return Meeting(
+        id=safe_meeting_id(data.get("meeting_id")),
+        user_id=user_id,
+        audio_filename=data.get("source_filename"),
+        original_language=data.get("original_language") or "English",
+        duration_seconds=int(round(duration)) if duration is not None else None,
+        transcript_original=data.get("transcript_original") or transcript,
+        summary_original=data.get("summary_original") or summary,
+        action_items_original=data.get("action_items_original") or action_items,
+        transcript_english=transcript,
+        summary_english=summary,
+        action_items_english=action_items,
+        was_translated=bool(data.get("was_translated")),
+        memo_json=memo,
+        meeting_type=str(meeting_type)[:50] if meeting_type else None,
+        metadata_json=data.get("metadata") or {},
+        created_at=created_at,
+    )
+
+
+def local_to_utc(value: datetime) -> datetime:
+    """Naive local (or aware) datetime -> naive UTC."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def utc_to_local(value: datetime) -> datetime:
+    """Naive UTC datetime -> naive local time."""
+    return value.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+
+def _save_meeting_row(payload: dict, user_id: int) -> None:
+    """Insert (or replace) the Meeting row for an artifact payload."""
+    meeting = meeting_from_artifact(payload, user_id)
+    try:
+        db.session.merge(meeting)
+        db.session.commit()
+        logger.info("Saved meeting %s to database", meeting.id)
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error saving meeting to database: %s", e)
+        raise
+
+
+def _meeting_to_artifact(meeting: Meeting) -> dict:
+    """Serialize a Meeting row in the artifact dict shape used by exports."""
+    created_at = meeting.created_at
+    return {
+        "meeting_id": meeting.id,
+        "created_at": utc_to_local(created_at).isoformat(timespec="seconds") if created_at else "",
+        "source_filename": meeting.audio_filename or "",
+        "original_language": meeting.original_language,
+        "was_translated": bool(meeting.was_translated),
+        "transcript": meeting.transcript_english or "",
+        "summary": meeting.summary_english or "",
+        "action_items": meeting.action_items_english or [],
+        "memo_json": meeting.memo_json or {},
+        "transcript_original": meeting.transcript_original or "",
+        "summary_original": meeting.summary_original or "",
+        "action_items_original": meeting.action_items_original or [],
+        "duration_seconds": meeting.duration_seconds,
+        "metadata": meeting.metadata_json or {},
+    }
+
+
 def load_meeting_artifacts(meeting_id: str) -> dict:
-    """Load meeting data from JSON artifact.
+    """Load meeting data from the database, falling back to the JSON artifact.
     
     Args:
         meeting_id: Meeting ID
@@ -124,9 +280,15 @@ def load_meeting_artifacts(meeting_id: str) -> dict:
         Dictionary with meeting data
         
     Raises:
-        FileNotFoundError: If artifact doesn't exist
+        FileNotFoundError: If the meeting is neither in the database nor on disk
         json.JSONDecodeError: If JSON is invalid
     """
+    meeting_id = safe_meeting_id(meeting_id)
+    if _db_available():
+        meeting = db.session.get(Meeting, meeting_id)
+        if meeting is not None:
+            return _meeting_to_artifact(meeting)
+
     path = meeting_json_path(meeting_id)
     if not os.path.exists(path):
         logger.warning("Meeting artifact not found: %s", path)
@@ -146,11 +308,23 @@ def load_meeting_artifacts(meeting_id: str) -> dict:
 
 
 def delete_meeting_artifacts(meeting_id: str) -> None:
-    """Delete meeting JSON artifact.
+    """Delete a meeting's database row and JSON artifact (whichever exist).
     
     Args:
         meeting_id: Meeting ID
     """
+    meeting_id = safe_meeting_id(meeting_id)
+    if _db_available():
+        try:
+            meeting = db.session.get(Meeting, meeting_id)
+            if meeting is not None:
+                db.session.delete(meeting)
+                db.session.commit()
+                logger.info("Deleted meeting %s from database", meeting_id)
+        except Exception as e:
+            db.session.rollback()
+            logger.warning("Error deleting meeting from database: %s", e)
+
     path = meeting_json_path(meeting_id)
     try:
         if os.path.exists(path):
@@ -160,6 +334,45 @@ def delete_meeting_artifacts(meeting_id: str) -> None:
         logger.warning("Error deleting meeting artifacts: %s", e)
 
 
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Report paragraph styles, built once and shared (read-only) by every render."""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle("Transcript", parent=styles["BodyText"], spaceBefore=0, spaceAfter=4))
+    return styles
+
+
+def _transcript_chunks(text: str, max_chars: int = PDF_TRANSCRIPT_CHUNK_CHARS) -> list[str]:
+    """Split a transcript into lines, and long lines into sentence groups of at most max_chars."""
+    chunks = []
+    for line in text.splitlines():
+        line = line.strip()
+        if len(line) <= max_chars:
+            if line:
+                chunks.append(line)
+            continue
+
+        current = ""
+        for sentence in _SENTENCE_SPLIT_RE.split(line):
+            while len(sentence) > max_chars:
+                # No sentence break: cut at the last space that keeps the piece in bounds
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+    return chunks
+
+
 def build_pdf_bytes(data: dict) -> bytes:
     """Generate PDF report from meeting data.
     
@@ -178,7 +391,7 @@ def build_pdf_bytes(data: dict) -> bytes:
         topMargin=0.8 * inch,
         bottomMargin=0.8 * inch,
     )
-    styles = getSampleStyleSheet()
+    styles = _pdf_styles()
 
     story = []
     
@@ -223,11 +436,13 @@ def build_pdf_bytes(data: dict) -> bytes:
         story.append(Paragraph("No action items found.", styles["BodyText"]))
     story.append(Spacer(1, 12))
 
-    # Transcript section
+    # Transcript section: one flowable per line / sentence group, so layout
+    # stays linear in transcript length instead of re-flowing one giant
+    # paragraph across every page
     story.append(Paragraph("Transcript", styles["Heading2"]))
-    transcript_text = (data.get("transcript") or "").replace("\n", "<br/>")
-    if transcript_text:
-        story.append(Paragraph(transcript_text, styles["BodyText"]))
+    chunks = _transcript_chunks(data.get("transcript") or "")
+    if chunks:
+        story.extend(Paragraph(escape(chunk), styles["Transcript"]) for chunk in chunks)
     else:
         story.append(Paragraph("No transcript available.", styles["BodyText"]))
 
@@ -250,3 +465,168 @@ def export_to_pdf(meeting_id: str) -> bytes:
     """
     data = load_meeting_artifacts(meeting_id)
     return build_pdf_bytes(data)
+
+
+def pdf_cache_key(data: dict) -> str:
+    """Content hash of a meeting artifact (and report layout version).
+
+    Used as the PDF cache key and as the download's ETag.
+    """
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"v{PDF_RENDER_VERSION}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+def render_pdf_cached(data: dict) -> tuple[str, str]:
+    """Return the path of the PDF report for an artifact, rendering it on a cache miss.
+
+    Rendering runs in the render_pool worker processes.
+
+    Args:
+        data: Meeting data dictionary (as returned by load_meeting_artifacts)
+
+    Returns:
+        Tuple of (pdf_path, cache_key)
+
+    Raises:
+        render_pool.QueueFullError: If too many renders are already pending
+    """
+    key = pdf_cache_key(data)
+    path = pdf_cache.get(key)
+    if path is None:
+        path = pdf_cache.set(key, render_pool.run(build_pdf_bytes, data))
+        logger.info("Rendered PDF for meeting %s", data.get("meeting_id"))
+    return path, key
+
+
+def prerender_pdf(data: dict) -> None:
+    """Render and cache an artifact's PDF report in the background."""
+    global _prerender_executor
+    with _prerender_lock:
+        if _prerender_executor is None:
+            _prerender_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-prerender")
+
+    def run():
+        try:
+            render_pdf_cached(data)
+        except Exception as e:
+            logger.warning("Could not pre-render PDF for %s: %s", data.get("meeting_id"), e)
+
+    _prerender_executor.submit(run)
+
+
+def build_markdown(data: dict) -> str:
+    """Render meeting data as a Markdown document.
+
+    Args:
+        data: Meeting data dictionary (as returned by load_meeting_artifacts)
+
+    Returns:
+        Markdown text
+    """
+    memo = data.get("memo_json") or {}
+    title = (memo.get("title") if isinstance(memo, dict) else None) or "Meeting Assistant Report"
+    lines = [f"# {title}", ""]
+    lines.append(f"- Meeting ID: {data.get('meeting_id', '')}")
+    lines.append(f"- Created: {data.get('created_at', '')}")
+    if data.get("source_filename"):
+        lines.append(f"- Source file: {data['source_filename']}")
+    original_language = data.get("original_language")
+    if original_language and original_language.lower() != "english":
+        lines.append(f"- Original language: {original_language}")
+
+    lines += ["", "## Summary", "", (data.get("summary") or "No summary available.").strip(), ""]
+
+    lines += ["## Action Items", ""]
+    items = data.get("action_items") or []
+    lines += [f"{n}. {item}" for n, item in enumerate(items, start=1)] or ["No action items found."]
+
+    lines += ["", "## Transcript", "", (data.get("transcript") or "No transcript available.").strip(), ""]
+    return "\n".join(lines)
+
+
+class _ZipSink:
+    """Write-only file object that collects zipfile output for streaming."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _open_bulk_pdf(data: dict):
+    """
+    Open a bulk export entry's PDF for reading.
+
+    An already-cached report is read from the PDF cache; otherwise it is
+    rendered into memory and not cached, so a large export does not evict
+    the reports of interactive downloads. A full render queue is waited
+    out (up to RENDER_TIMEOUT_SECONDS) rather than failing the entry.
+    """
+    path = pdf_cache.get(pdf_cache_key(data))
+    if path is not None:
+        try:
+            return open(path, "rb")
+        except FileNotFoundError:
+            pass  # evicted since the lookup
+    return BytesIO(render_pool.run(build_pdf_bytes, data, wait=RENDER_TIMEOUT_SECONDS))
+
+
+def iter_zip_export(meeting_ids, fmt: str = "pdf", chunk_size: int = 64 * 1024):
+    """Stream a ZIP archive of meetings, rendering each entry as it is reached.
+
+    Only the entry being written is held in memory, so memory use does
+    not grow with the number of meetings. A meeting that cannot be
+    exported becomes a `<meeting_id>.error.txt` entry instead of
+    aborting the archive.
+
+    Args:
+        meeting_ids: Iterable of meeting IDs (consumed lazily)
+        fmt: Entry format: "pdf", "json" or "md"
+        chunk_size: Bytes per PDF read
+
+    Yields:
+        Chunks of the ZIP file
+    """
+    if fmt not in BULK_EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    sink = _ZipSink()
+    # PDFs are already compressed; text formats deflate well
+    compression = zipfile.ZIP_STORED if fmt == "pdf" else zipfile.ZIP_DEFLATED
+    count = 0
+    with zipfile.ZipFile(sink, "w", compression=compression) as archive:
+        for meeting_id in meeting_ids:
+            try:
+                data = load_meeting_artifacts(meeting_id)
+                if fmt == "pdf":
+                    with _open_bulk_pdf(data) as pdf, \
+                            archive.open(f"{meeting_id}.pdf", "w") as entry:
+                        for chunk in iter(lambda: pdf.read(chunk_size), b""):
+                            entry.write(chunk)
+                            written = sink.pop()
+                            if written:
+                                yield written
+                elif fmt == "json":
+                    archive.writestr(
+                        f"{meeting_id}.json", json.dumps(data, ensure_ascii=False, indent=2, default=str)
+                    )
+                else:
+                    archive.writestr(f"{meeting_id}.md", build_markdown(data))
+                count += 1
+            except Exception as e:
+                logger.warning("Bulk export skipped meeting %s: %s", meeting_id, e)
+                archive.writestr(f"{meeting_id}.error.txt", f"Could not export meeting {meeting_id}: {e}\n")
+            yield sink.pop()
+    # Central directory
+    yield sink.pop()
+    logger.info("Bulk export streamed %d meetings as %s", count, fmt)
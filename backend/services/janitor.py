@@ -0,0 +1,235 @@
+"""
+Background janitor for uploaded audio and transcript files.
+
+Files are tracked in an expiry heap keyed by the time they become
+deletable (mtime + their type's retention, see JANITOR_RETENTION_SECONDS).
+The heap is rebuilt from one folder scan at startup (and every
+JANITOR_RESCAN_SECONDS, to pick up files written by other processes);
+files the app writes itself are added with track() as they are saved.
+A daemon thread sleeps until the next expiry, so requests never pay for
+a directory sweep.
+
+Files that queued or running jobs still need are pinned (pin/unpin or
+the in_use() context manager) and are re-checked later instead of being
+deleted underneath the job.
+"""
+
+import heapq
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from ..config import (
+    UPLOAD_FOLDER,
+    TRANSCRIPT_FOLDER,
+    JANITOR_RETENTION_SECONDS,
+    JANITOR_INTERVAL_SECONDS,
+    JANITOR_RESCAN_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Live recording segments are saved to UPLOAD_FOLDER with this prefix
+LIVE_SEGMENT_PREFIX = "live_"
+
+_lock = threading.Lock()
+_heap: list[tuple[float, str]] = []
+_scheduled: dict[str, float] = {}  # path -> current expiry (older heap entries are stale)
+_pins: Counter = Counter()
+_folders = {"upload": UPLOAD_FOLDER, "transcript": TRANSCRIPT_FOLDER}
+_retention = dict(JANITOR_RETENTION_SECONDS)
+_thread = None
+_start_lock = threading.Lock()
+_stop = threading.Event()
+
+
+def configure(upload_folder: str = None, transcript_folder: str = None, retention: dict = None) -> None:
+    """Override the watched folders and/or per-type retention (seconds)."""
+    with _lock:
+        if upload_folder:
+            _folders["upload"] = upload_folder
+        if transcript_folder:
+            _folders["transcript"] = transcript_folder
+        if retention:
+            _retention.update(retention)
+
+
+def artifact_type(path: str):
+    """Artifact type of a file ('upload', 'live_segment', 'transcript'), or None if unmanaged."""
+    folder = os.path.dirname(os.path.abspath(path))
+    if folder == os.path.abspath(_folders["transcript"]):
+        return "transcript"
+    if folder == os.path.abspath(_folders["upload"]):
+        return "live_segment" if os.path.basename(path).startswith(LIVE_SEGMENT_PREFIX) else "upload"
+    return None
+
+
+def _schedule(path: str, expires_at: float) -> None:
+    # Caller holds _lock
+    _scheduled[path] = expires_at
+    heapq.heappush(_heap, (expires_at, path))
+
+
+def _expiry(path: str):
+    """When the file becomes deletable, or None if it is gone/unmanaged."""
+    kind = artifact_type(path)
+    if kind is None:
+        return None
+    try:
+        return os.path.getmtime(path) + _retention[kind]
+    except OSError:
+        return None
+
+
+def track(path: str) -> None:
+    """Schedule a newly written file for deletion after its retention."""
+    expires_at = _expiry(path)
+    if expires_at is not None:
+        with _lock:
+            _schedule(path, expires_at)
+
+
+def rebuild() -> int:
+    """
+    Rebuild the expiry heap from the watched folders.
+
+    Returns:
+        Number of files tracked
+    """
+    entries = []
+    for folder in set(_folders.values()):
+        try:
+            names = os.listdir(folder)
+        except OSError as e:
+            logger.warning("Janitor could not list %s: %s", folder, e)
+            continue
+        for name in names:
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):
+                expires_at = _expiry(path)
+                if expires_at is not None:
+                    entries.append((expires_at, path))
+
+    heapq.heapify(entries)
+    with _lock:
+        _heap[:] = entries
+        _scheduled.clear()
+        _scheduled.update((path, expires_at) for expires_at, path in entries)
+    logger.info("Janitor tracking %d files", len(entries))
+    return len(entries)
+
+
+def pin(path: str) -> None:
+    """Keep a file until unpin() (pins are counted)."""
+    with _lock:
+        _pins[path] += 1
+
+
+def unpin(path: str) -> None:
+    """Release a pin taken with pin()."""
+    with _lock:
+        _pins[path] -= 1
+        if _pins[path] <= 0:
+            del _pins[path]
+
+
+@contextmanager
+def in_use(path: str):
+    """Pin a file for the duration of a with-block."""
+    pin(path)
+    try:
+        yield path
+    finally:
+        unpin(path)
+
+
+def sweep(now: float = None) -> int:
+    """
+    Delete tracked files whose retention has passed.
+
+    Pinned files are re-checked after JANITOR_INTERVAL_SECONDS; files
+    modified since they were tracked are rescheduled from their new mtime.
+
+    Returns:
+        Number of files deleted
+    """
+    now = time.time() if now is None else now
+    removed = 0
+    with _lock:
+        while _heap and _heap[0][0] <= now:
+            expires_at, path = heapq.heappop(_heap)
+            if _scheduled.get(path) != expires_at:
+                continue  # superseded by a later schedule
+            if _pins[path]:
+                _schedule(path, now + JANITOR_INTERVAL_SECONDS)
+                continue
+
+            current = _expiry(path)
+            if current is None:
+                del _scheduled[path]
+                continue
+            if current > now:
+                _schedule(path, current)
+                continue
+
+            del _scheduled[path]
+            try:
+                os.remove(path)
+                removed += 1
+                logger.info("Janitor deleted expired file: %s", path)
+            except OSError as e:
+                logger.warning("Janitor could not delete %s: %s", path, e)
+    return removed
+
+
+def _next_expiry():
+    with _lock:
+        return _heap[0][0] if _heap else None
+
+
+def _run() -> None:
+    next_rescan = time.time() + JANITOR_RESCAN_SECONDS
+    while not _stop.is_set():
+        now = time.time()
+        try:
+            if now >= next_rescan:
+                rebuild()
+                next_rescan = now + JANITOR_RESCAN_SECONDS
+            sweep(now)
+        except Exception as e:
+            logger.exception("Janitor sweep failed: %s", e)
+
+        next_due = _next_expiry()
+        delay = JANITOR_INTERVAL_SECONDS if next_due is None else next_due - time.time()
+        _stop.wait(max(1.0, min(delay, JANITOR_INTERVAL_SECONDS)))
+
+
+def running() -> bool:
+    """Whether the janitor thread is running."""
+    return _thread is not None and _thread.is_alive()
+
+
+def start() -> None:
+    """Scan the folders and start the janitor thread (no-op if running)."""
+    global _thread
+    if running():
+        return
+    with _start_lock:
+        if running():
+            return
+        rebuild()
+        _stop.clear()
+        _thread = threading.Thread(target=_run, name="janitor", daemon=True)
+        _thread.start()
+
+
+def stop(timeout: float = None) -> None:
+    """Stop the janitor thread."""
+    global _thread
+    _stop.set()
+    if _thread is not None:
+        _thread.join(timeout)
+        _thread = None
@@ -0,0 +1,235 @@
+"""
+Background job queue for long-running pipeline work.
+
+Uploads are accepted on the request thread and handed to a bounded pool
+of worker threads, so web workers never wait on Whisper/GPT latency.
+Job state lives in memory; clients poll it via GET /api/jobs/<id> or
+follow its event log as a Server-Sent Events stream. Only the last
+JOB_EVENT_HISTORY events are kept, and once a job finishes its earlier
+events drop their partial results (the final result carries them all).
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, has_app_context
+
+from ..config import JOB_WORKERS, JOB_QUEUE_LIMIT, JOB_RETENTION_SECONDS, JOB_EVENT_HISTORY
+
+logger = logging.getLogger(__name__)
+
+# Job status values
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    """Raised when too many jobs are pending to accept another one."""
+
+
+class Job:
+    """
+    A unit of background work with stage/progress reporting.
+
+    The job function receives the Job as its first argument and calls
+    `update()` as it moves through pipeline stages and `emit()` to publish
+    events (with partial results) to stream subscribers.
+    """
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = QUEUED
+        self.stage = QUEUED
+        self.progress = 0
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at = None
+        self.events: deque[dict] = deque(maxlen=JOB_EVENT_HISTORY)
+        self._last_event_id = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def update(self, stage: str, progress: int = None) -> None:
+        """Record a stage transition (progress is 0-100)."""
+        with self._lock:
+            self.stage = stage
+            if progress is not None:
+                self.progress = max(0, min(100, int(progress)))
+            self.updated_at = time.time()
+        logger.info("Job %s: %s (%s%%)", self.id, stage, self.progress)
+
+    def emit(self, event: str, data: dict = None) -> None:
+        """Append an event to the job's log and wake stream subscribers."""
+        with self._lock:
+            self._append_event(event, data)
+
+    def _append_event(self, event: str, data: dict = None) -> None:
+        # Caller holds self._lock
+        self._last_event_id += 1
+        self.events.append({
+            "id": self._last_event_id,
+            "event": event,
+            "data": {"stage": self.stage, "progress": self.progress, **(data or {})},
+        })
+        self._changed.notify_all()
+
+    def events_after(self, last_id: int = 0, timeout: float = None) -> list[dict]:
+        """
+        Return retained events with id > last_id, waiting up to `timeout`
+        seconds for new ones if there are none yet (and the job is still
+        running).
+        """
+        with self._lock:
+            if self._last_event_id <= last_id and not self.is_finished and timeout:
+                self._changed.wait(timeout)
+            return [event for event in self.events if event["id"] > last_id]
+
+    def _start(self) -> None:
+        with self._lock:
+            self.status = RUNNING
+            self.updated_at = time.time()
+
+    def _finish(self, result=None, error: str = None) -> None:
+        with self._lock:
+            now = time.time()
+            self.status = FAILED if error else SUCCEEDED
+            self.stage = "failed" if error else "done"
+            if not error:
+                self.progress = 100
+            self.result = result
+            self.error = error
+            self.updated_at = now
+            self.finished_at = now
+            # Stage events keep only their stage/progress; "done" has the full result
+            for event in self.events:
+                data = event["data"]
+                event["data"] = {"stage": data["stage"], "progress": data["progress"]}
+            if error:
+                self._append_event("failed", {"error": error})
+            else:
+                self._append_event("done", {"result": result})
+
+    def to_dict(self) -> dict:
+        """Serialize job state to dictionary."""
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "status": self.status,
+                "stage": self.stage,
+                "progress": self.progress,
+                "error": self.error,
+                "result": self.result,
+            }
+
+
+_jobs: dict[str, Job] = {}
+_jobs_lock = threading.Lock()
+_executor = None
+_queue_limit = JOB_QUEUE_LIMIT
+
+
+def configure(max_workers: int = None, queue_limit: int = None) -> None:
+    """
+    (Re)configure the worker pool.
+
+    Existing jobs keep running on the previous pool; new jobs use the new one.
+    """
+    global _executor, _queue_limit
+    with _jobs_lock:
+        old = _executor
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers or JOB_WORKERS,
+            thread_name_prefix="job-worker",
+        )
+        if queue_limit is not None:
+            _queue_limit = queue_limit
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    if _executor is None:
+        configure()
+    return _executor
+
+
+def _prune_finished(now: float) -> None:
+    """Drop finished jobs older than the retention window (caller holds lock)."""
+    expired = [
+        job_id for job_id, job in _jobs.items()
+        if job.finished_at and now - job.finished_at > JOB_RETENTION_SECONDS
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def active_count() -> int:
+    """Number of queued or running jobs."""
+    with _jobs_lock:
+        return sum(1 for job in _jobs.values() if not job.is_finished)
+
+
+def submit(fn, *args, **kwargs) -> Job:
+    """
+    Enqueue `fn(job, *args, **kwargs)` on the worker pool.
+
+    If called inside a Flask app context, the worker runs inside a fresh
+    context for the same app so services can use the database.
+
+    Returns:
+        The queued Job
+
+    Raises:
+        QueueFullError: If JOB_QUEUE_LIMIT jobs are already pending/running
+    """
+    app = current_app._get_current_object() if has_app_context() else None
+    job = Job(uuid.uuid4().hex)
+
+    with _jobs_lock:
+        _prune_finished(time.time())
+        active = sum(1 for existing in _jobs.values() if not existing.is_finished)
+        if active >= _queue_limit:
+            raise QueueFullError(f"Job queue is full ({active} active jobs)")
+        _jobs[job.id] = job
+
+    def run():
+        job._start()
+        try:
+            if app is not None:
+                with app.app_context():
+                    result = fn(job, *args, **kwargs)
+            else:
+                result = fn(job, *args, **kwargs)
+        except Exception as e:
+            logger.exception("Job %s failed: %s", job.id, e)
+            job._finish(error=str(e))
+        else:
+            job._finish(result=result)
+
+    try:
+        _get_executor().submit(run)
+    except BaseException:
+        # Never queued: don't leave it holding a queue slot forever
+        with _jobs_lock:
+            _jobs.pop(job.id, None)
+        raise
+    logger.info("Queued job %s", job.id)
+    return job
+
+
+def get_job(job_id: str):
+    """Return the Job with this ID, or None if unknown/expired."""
+    with _jobs_lock:
+        return _jobs.get(job_id)
@@ -0,0 +1,176 @@
+"""
+Offline language identification.
+
+Identifies the language of a transcript without a network call, covering
+every language in translation.LANGUAGE_CODES:
+- non-Latin scripts (Cyrillic, Arabic, Devanagari, Thai, Hangul, kana,
+  Han) mostly decide the language on their own; Han text is split into
+  Cantonese vs Mandarin by characteristic particles
+- Latin-script text is scored by common function words plus the
+  diacritics that are distinctive for each language
+
+The result carries a confidence in [0, 1] so callers can fall back to
+the LLM detector for short or ambiguous text.
+"""
+
+import re
+from collections import Counter
+from typing import NamedTuple
+
+# Only the head of long transcripts is needed to identify the language
+SAMPLE_CHARS = 4000
+
+# Below this many scored words/characters, confidence is scaled down
+MIN_EVIDENCE = 20
+
+_SCRIPTS = {
+    "hangul": re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]"),
+    "kana": re.compile(r"[\u3040-\u30ff]"),
+    "han": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"),
+    "cyrillic": re.compile(r"[\u0400-\u04ff]"),
+    "arabic": re.compile(r"[\u0600-\u06ff\u0750-\u077f]"),
+    "devanagari": re.compile(r"[\u0900-\u097f]"),
+    "thai": re.compile(r"[\u0e00-\u0e7f]"),
+    "latin": re.compile(r"[A-Za-z\u00c0-\u024f\u1e00-\u1eff]"),
+}
+
+# Scripts used by exactly one supported language
+_SCRIPT_LANGUAGE = {
+    "hangul": "ko",
+    "kana": "ja",
+    "cyrillic": "ru",
+    "arabic": "ar",
+    "devanagari": "hi",
+    "thai": "th",
+}
+
+# Particles that are common in written Cantonese but not Mandarin, and
+# vice versa
+_CANTONESE_CHARS = set("嘅係唔咗喺冇佢哋嘢啲咁嗰乜嚟睇噉咪攞")
+_MANDARIN_CHARS = set("的是了们这那么没他她吗呢在")
+
+# Frequent function words per Latin-script language
+_COMMON_WORDS = {
+    "en": "the and to of a in is that it we you for on with this be are have was not but they will what so",
+    "es": "el la de que y en los se del las un por con una para es no lo al pero más como este esta también muy",
+    "fr": "le la les de des et est que en un une du pour pas dans qui sur nous vous ce il avec mais sont",
+    "de": "der die das und ist ich nicht zu den von mit sich auf für ein eine wir auch es dem sind aber wie",
+    "it": "il di che e è la per un una non sono del della con mi ci questo anche come ma gli nel alla essere",
+    "pt": "o a de que e do da em um uma para com não os no na por mais as dos como mas foi ao você isso",
+    "nl": "de het een en van ik te dat is niet op zijn voor met we die er maar ook als bij wat dit",
+    "sv": "och att det som är en på för med jag inte av till har den om vi ett men så kan vad ska också mycket",
+    "da": "og at det er en på til med jeg ikke af for har den om vi et men så kan der hvad skal også meget",
+    "tr": "ve bir bu şu da için ile çok ne mi mı var olarak ama gibi daha ben biz sonra önce kadar değil şey evet tamam yani şimdi bunu",
+    "pl": "i w nie na to że się z jest do jak co ale tak po od mamy są jestem tym czy dla",
+    "vi": "và của là có không được này cho với các những một người trong đã sẽ tôi chúng ta để",
+}
+_COMMON_WORD_SETS = {code: set(words.split()) for code, words in _COMMON_WORDS.items()}
+
+# Words shared by several languages count for each of them proportionally less
+_WORD_WEIGHTS = {
+    word: 1 / n
+    for word, n in Counter(w for words in _COMMON_WORD_SETS.values() for w in words).items()
+}
+
+# Letters that (among the supported languages) point strongly at one language
+_DISTINCTIVE_CHARS = {
+    "es": "ñ¿¡",
+    "fr": "œêëîûù",  # not è: it is the Italian "is"
+    "de": "ßü",
+    "pt": "ãõ",
+    "tr": "şğı",
+    "pl": "łąęśźżćń",
+    "vi": "ăđơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ",
+    "da": "æø",
+    "sv": "åäö",
+    "it": "ìò",
+}
+_DISTINCTIVE_WEIGHT = 0.5
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+
+class LanguageGuess(NamedTuple):
+    """Identified ISO 639-1 code (or 'unknown') and confidence in [0, 1]."""
+    code: str
+    confidence: float
+
+
+def identify(text: str) -> LanguageGuess:
+    """
+    Identify the language of a text offline.
+
+    Args:
+        text: Text to analyze (only the first SAMPLE_CHARS are used)
+
+    Returns:
+        LanguageGuess(code, confidence); ('unknown', 0.0) if no signal
+    """
+    sample = (text or "")[:SAMPLE_CHARS]
+    counts = {name: len(pattern.findall(sample)) for name, pattern in _SCRIPTS.items()}
+    letters = sum(counts.values())
+    if not letters:
+        return LanguageGuess("unknown", 0.0)
+
+    script, script_count = max(counts.items(), key=lambda item: item[1])
+    script_share = script_count / letters
+
+    # Japanese mixes kana with Han; any meaningful kana share decides it
+    if counts["kana"] and counts["kana"] >= 0.1 * (counts["kana"] + counts["han"]):
+        script, script_count = "kana", counts["kana"] + counts["han"]
+        script_share = script_count / letters
+
+    if script in _SCRIPT_LANGUAGE:
+        return LanguageGuess(
+            _SCRIPT_LANGUAGE[script],
+            round(script_share * _evidence(script_count), 3),
+        )
+    if script == "han":
+        return _identify_chinese(sample, script_share)
+    return _identify_latin(sample)
+
+
+def _evidence(count: int) -> float:
+    """Scale factor for how much text backed a decision."""
+    return min(1.0, count / MIN_EVIDENCE)
+
+
+def _identify_chinese(sample: str, script_share: float) -> LanguageGuess:
+    """Tell Cantonese from Mandarin by their characteristic particles."""
+    cantonese = sum(1 for ch in sample if ch in _CANTONESE_CHARS)
+    mandarin = sum(1 for ch in sample if ch in _MANDARIN_CHARS)
+    markers = cantonese + mandarin
+    if not markers:
+        return LanguageGuess("zh", round(0.5 * script_share, 3))
+
+    code = "yue" if cantonese > mandarin else "zh"
+    share = max(cantonese, mandarin) / markers
+    evidence = min(1.0, markers / (MIN_EVIDENCE / 4))
+    return LanguageGuess(code, round(share * script_share * evidence, 3))
+
+
+def _identify_latin(sample: str) -> LanguageGuess:
+    """Score Latin-script text by common words and distinctive letters."""
+    words = [w.lower() for w in _WORD_RE.findall(sample)]
+    if not words:
+        return LanguageGuess("unknown", 0.0)
+
+    frequencies = Counter(words)
+    lowered = sample.lower()
+    scores = {}
+    for code, common in _COMMON_WORD_SETS.items():
+        score = sum(n * _WORD_WEIGHTS[word] for word, n in frequencies.items() if word in common)
+        score += _DISTINCTIVE_WEIGHT * sum(lowered.count(ch) for ch in _DISTINCTIVE_CHARS.get(code, ""))
+        scores[code] = score
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best_code, best = ranked[0]
+    runner_up = ranked[1][1]
+    if best <= 0:
+        return LanguageGuess("unknown", 0.0)
+
+    # Margin over the runner-up, discounted when little text matched
+    margin = (best - runner_up) / best
+    coverage = min(1.0, best / max(1, len(words)) * 5)
+    confidence = (0.5 + 0.5 * margin) * coverage * _evidence(len(words))
+    return LanguageGuess(best_code, round(min(1.0, confidence), 3))
@@ -0,0 +1,369 @@
+"""
+Live recording sessions.
+
+A session holds the rolling transcript of one live recording on the
+server, so clients only upload what is new since their last call instead
+of the whole transcript every few seconds. The transcript is kept in a
+qa_detection.TranscriptIndex (bounded to QA_INDEX_MAX_WINDOWS windows), so
+each question is answered from relevant windows plus the recent tail.
+Sessions live in memory and expire after LIVE_SESSION_IDLE_SECONDS
+without activity.
+
+Recorded audio can also be streamed into a session as self-contained
+segments while recording. Each segment is transcribed and translated to
+English in the background as it arrives and kept in sequence order, and
+the in-order English transcript feeds a rolling summary
+(summarization.RollingSummary). When the recording stops only the final
+segment and a short memo merge remain. A segment that fails keeps its
+audio until the stop, where it is retried; if it fails again the stop
+fails rather than saving a transcript with a hole in it.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from ..config import LIVE_SESSION_IDLE_SECONDS, LIVE_MAX_SESSIONS, LIVE_TRANSCRIPTION_WORKERS
+from . import janitor, qa_detection, summarization, transcription, translation
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLimitError(RuntimeError):
+    """Raised when too many live sessions are open to start another one."""
+
+
+class SessionStoppedError(RuntimeError):
+    """Raised when audio arrives for a session that has already stopped."""
+
+
+class LiveSession:
+    """Rolling transcript and detected questions for one live recording."""
+
+    def __init__(self, session_id: str, index=None, agenda: str = ""):
+        self.id = session_id
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.index = index if index is not None else qa_detection.TranscriptIndex()
+        self.summary = summarization.RollingSummary(agenda)
+        self.questions: list[dict] = []
+        self.stopped = False
+        self._seen_questions: set[str] = set()
+        self._audio_parts: dict[int, tuple[str, str]] = {}  # seq -> (text, language)
+        self._english_parts: dict[int, tuple[str, str, bool]] = {}  # seq -> (text, language name, translated)
+        self._audio_futures: dict[int, object] = {}
+        self._failed_audio: dict[int, str] = {}  # seq -> audio path kept for a retry
+        self._next_summary_seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_chars(self) -> int:
+        return self.index.total_chars
+
+    def append(self, text: str) -> str:
+        """
+        Add new transcript text.
+
+        Returns:
+            Answer context for the text, built from what preceded it
+        """
+        with self._lock:
+            context = self.index.context_for(text)
+            self.index.add(text)
+            self.updated_at = time.time()
+        return context
+
+    def add_questions(self, questions: list[dict]) -> list[dict]:
+        """Record detected questions, returning only ones not seen before."""
+        new = []
+        with self._lock:
+            for question in questions:
+                key = " ".join(str(question.get("question", "")).lower().split())
+                if not key or key in self._seen_questions:
+                    continue
+                self._seen_questions.add(key)
+                self.questions.append(question)
+                new.append(question)
+        return new
+
+    def audio_transcript(self) -> tuple[str, str]:
+        """
+        Transcript of the audio segments transcribed so far, in sequence
+        order, and the majority language code.
+        """
+        with self._lock:
+            parts = [self._audio_parts[seq] for seq in sorted(self._audio_parts)]
+        text = " ".join(part.strip() for part, _ in parts if part.strip())
+        languages = Counter(code for part, code in parts if part.strip())
+        return text, (languages.most_common(1)[0][0] if languages else "")
+
+    def english_transcript(self) -> tuple[str, str, bool]:
+        """
+        English transcript of the segments translated so far, in sequence
+        order, with the same (text, language_name, was_translated) shape as
+        translation.detect_and_translate_if_needed.
+        """
+        with self._lock:
+            parts = [self._english_parts[seq] for seq in sorted(self._english_parts)]
+        spoken = [part for part in parts if part[0].strip()]
+        text = " ".join(part[0].strip() for part in spoken)
+        languages = Counter(name for _, name, _ in spoken if name.lower() != "unknown")
+        language_name = languages.most_common(1)[0][0] if languages else "Unknown"
+        return text, language_name, any(translated for _, _, translated in spoken)
+
+    def wait_for_audio(self, timeout: float = None) -> None:
+        """Block until every submitted audio segment has been transcribed."""
+        with self._lock:
+            pending = list(self._audio_futures.values())
+        wait(pending, timeout=timeout)
+
+    def feed_summary(self, force: bool = False) -> None:
+        """
+        Pass translated segments to the rolling summary in sequence order.
+
+        Segments are fed only once every earlier one is done; force=True
+        feeds everything left, skipping sequence numbers that never arrived.
+        """
+        with self._lock:
+            seqs = sorted(seq for seq in self._english_parts if seq >= self._next_summary_seq)
+            for seq in seqs:
+                if seq != self._next_summary_seq and not force:
+                    break
+                text = self._english_parts[seq][0].strip()
+                if text:
+                    self.summary.add(text + " ")
+                self._next_summary_seq = seq + 1
+
+    def _previous_text(self, seq: int) -> str:
+        """Transcript of segment seq-1 if it is already done (for prompting)."""
+        with self._lock:
+            part = self._audio_parts.get(seq - 1)
+        return part[0] if part else ""
+
+    def to_dict(self) -> dict:
+        """Serialize session state to dictionary."""
+        with self._lock:
+            return {
+                "session_id": self.id,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+                "transcript_chars": self.total_chars,
+                "indexed_windows": len(self.index),
+                "question_count": len(self.questions),
+                "audio_segments": len(self._audio_futures),
+                "audio_segments_transcribed": len(self._audio_parts),
+                "audio_segments_translated": len(self._english_parts),
+                "audio_segments_failed": len(self._failed_audio),
+                "summary_windows": self.summary.windows_summarized,
+                "stopped": self.stopped,
+            }
+
+
+_sessions: dict[str, LiveSession] = {}
+_sessions_lock = threading.Lock()
+_audio_executor = None
+
+
+def _prune_idle(now: float) -> None:
+    """Drop sessions idle longer than LIVE_SESSION_IDLE_SECONDS (caller holds lock)."""
+    expired = [
+        session_id for session_id, session in _sessions.items()
+        if now - session.updated_at > LIVE_SESSION_IDLE_SECONDS
+    ]
+    for session_id in expired:
+        logger.info("Live session %s expired", session_id)
+        discard_failed_segments(_sessions.pop(session_id))
+
+
+def create_session(agenda: str = "") -> LiveSession:
+    """
+    Open a new live session.
+
+    Args:
+        agenda: Optional meeting agenda, used for the rolling summary
+
+    Raises:
+        SessionLimitError: If LIVE_MAX_SESSIONS sessions are already open
+    """
+    session = LiveSession(uuid.uuid4().hex, agenda=agenda)
+    with _sessions_lock:
+        _prune_idle(time.time())
+        if len(_sessions) >= LIVE_MAX_SESSIONS:
+            raise SessionLimitError(f"Too many live sessions ({len(_sessions)} open)")
+        _sessions[session.id] = session
+    logger.info("Opened live session %s", session.id)
+    return session
+
+
+def get_session(session_id: str):
+    """Return the LiveSession with this ID, or None if unknown/expired."""
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session and time.time() - session.updated_at > LIVE_SESSION_IDLE_SECONDS:
+            discard_failed_segments(_sessions.pop(session_id))
+            return None
+        return session
+
+
+def close_session(session_id: str):
+    """Remove a session, returning it (or None if unknown)."""
+    with _sessions_lock:
+        session = _sessions.pop(session_id, None)
+    if session:
+        logger.info("Closed live session %s (%d chars)", session_id, session.total_chars)
+    return session
+
+
+def append_transcript(session: LiveSession, text: str) -> list[dict]:
+    """
+    Append new transcript text to a session and answer any questions in it.
+
+    Args:
+        session: Live session
+        text: Transcript text spoken since the previous append
+
+    Returns:
+        Newly detected questions (duplicates of earlier ones are dropped)
+    """
+    if not text or not text.strip():
+        return []
+
+    context = session.append(text)
+    questions = qa_detection.detect_and_answer_questions(text, context=context)
+    return session.add_questions(questions)
+
+
+def _get_audio_executor() -> ThreadPoolExecutor:
+    global _audio_executor
+    with _sessions_lock:
+        if _audio_executor is None:
+            _audio_executor = ThreadPoolExecutor(
+                max_workers=LIVE_TRANSCRIPTION_WORKERS,
+                thread_name_prefix="live-transcribe",
+            )
+        return _audio_executor
+
+
+def add_audio_segment(session: LiveSession, seq: int, file_path: str) -> None:
+    """
+    Queue a self-contained audio segment for background transcription.
+
+    The file is pinned in the janitor until transcribed, then deleted; a
+    segment that fails to transcribe keeps its file for
+    retry_failed_segments. The text is then translated to English. Segments
+    may arrive and finish out of order; the transcript is assembled by
+    sequence number.
+
+    Raises:
+        SessionStoppedError: If the session was already stopped
+    """
+    with session._lock:
+        if session.stopped:
+            raise SessionStoppedError(f"Live session {session.id} has stopped")
+        if seq in session._audio_futures:
+            logger.warning("Live session %s: duplicate segment %d ignored", session.id, seq)
+            os.remove(file_path)
+            return
+        session.updated_at = time.time()
+        janitor.pin(file_path)
+        session._audio_futures[seq] = _get_audio_executor().submit(
+            _transcribe_segment, session, seq, file_path
+        )
+
+
+def _transcribe_segment(session: LiveSession, seq: int, file_path: str) -> bool:
+    """Transcribe and translate one segment; False (audio kept if untranscribed) on failure."""
+    try:
+        prompt = session._previous_text(seq)[-transcription.PROMPT_TAIL_CHARS:] or None
+        text, language = transcription.transcribe_segment(file_path, prompt)
+    except Exception as e:
+        logger.exception("Live session %s: segment %d failed: %s", session.id, seq, e)
+        with session._lock:
+            session._failed_audio[seq] = file_path
+        return False
+
+    _delete_segment_file(file_path)
+    with session._lock:
+        session._failed_audio.pop(seq, None)
+        session._audio_parts[seq] = (text, language)
+    logger.info("Live session %s: segment %d transcribed (%d chars)", session.id, seq, len(text))
+    if not _translate_segment(session, seq):
+        return False
+    session.feed_summary()
+    return True
+
+
+def _translate_segment(session: LiveSession, seq: int) -> bool:
+    """Translate a transcribed segment to English; False on failure."""
+    with session._lock:
+        text, language = session._audio_parts[seq]
+    try:
+        english = translation.detect_and_translate_if_needed(text, language)
+    except Exception as e:
+        logger.exception("Live session %s: translating segment %d failed: %s", session.id, seq, e)
+        return False
+    with session._lock:
+        session._english_parts[seq] = english
+    return True
+
+
+def _delete_segment_file(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except OSError as e:
+        logger.warning("Could not delete audio segment: %s", e)
+    janitor.unpin(file_path)
+
+
+def retry_failed_segments(session: LiveSession) -> list[int]:
+    """
+    Transcribe or translate again every segment that failed in the background.
+
+    Call once all submitted segments are done (wait_for_audio). Audio of
+    segments that fail again is deleted.
+
+    Returns:
+        Sequence numbers of segments that still could not be processed
+    """
+    with session._lock:
+        failed = sorted(session._failed_audio.items())
+        untranslated = sorted(set(session._audio_parts) - set(session._english_parts))
+    still_failed = []
+    for seq, file_path in failed:
+        logger.info("Live session %s: retrying segment %d", session.id, seq)
+        if not _transcribe_segment(session, seq, file_path):
+            still_failed.append(seq)
+    for seq in untranslated:
+        logger.info("Live session %s: retrying translation of segment %d", session.id, seq)
+        if not _translate_segment(session, seq):
+            still_failed.append(seq)
+    discard_failed_segments(session)
+    return sorted(still_failed)
+
+
+def discard_failed_segments(session: LiveSession) -> None:
+    """Delete the audio kept for failed segments (e.g. when a session is dropped)."""
+    with session._lock:
+        failed = list(session._failed_audio.values())
+        session._failed_audio.clear()
+    for file_path in failed:
+        _delete_segment_file(file_path)
+
+
+def stop_session(session: LiveSession) -> None:
+    """Stop accepting audio; segments already received still finish."""
+    with session._lock:
+        session.stopped = True
+        session.updated_at = time.time()
+
+
+def resume_session(session: LiveSession) -> None:
+    """Accept audio again after stop_session (e.g. when the stop could not be queued)."""
+    with session._lock:
+        session.stopped = False
+        session.updated_at = time.time()
+
@@ -0,0 +1,248 @@
+"""
+Shared LLM gateway.
+
+Every service talks to OpenAI through this module instead of building
+its own client. It provides:
+- one lazily created client with a pooled keep-alive HTTP transport
+- per-stage request timeouts (LLM_TIMEOUTS)
+- retry with jittered exponential backoff on 429/5xx/connection errors
+- a global semaphore capping concurrent requests across all threads
+- a persistent response cache for deterministic calls
+- optional connection warm-up at startup
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from typing import NamedTuple
+
+import httpx
+from openai import OpenAI, APIConnectionError, APIStatusError
+
+from ..config import (
+    LLM_MODEL,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_CONNECTIONS,
+    LLM_KEEPALIVE_SECONDS,
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BASE_SECONDS,
+    LLM_RETRY_MAX_SECONDS,
+    LLM_TIMEOUTS,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MAX_BYTES,
+)
+from .cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+_semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+# cache key -> {"text": ..., "finish_reason": ...}
+response_cache = SQLiteCache(
+    LLM_CACHE_PATH,
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    max_bytes=LLM_CACHE_MAX_BYTES,
+)
+
+
+class ChatResult(NamedTuple):
+    """Text of a chat completion and why generation stopped."""
+    text: str
+    finish_reason: str
+
+
+def get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                        keepalive_expiry=LLM_KEEPALIVE_SECONDS,
+                    ),
+                    timeout=LLM_TIMEOUTS["default"],
+                )
+                # Retries are handled here so they share the semaphore/backoff
+                _client = OpenAI(http_client=http_client, max_retries=0)
+    return _client
+
+
+def _timeout(stage: str) -> float:
+    return LLM_TIMEOUTS.get(stage, LLM_TIMEOUTS["default"])
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, APIConnectionError)  # includes timeouts
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Full-jitter exponential backoff, honoring Retry-After when sent."""
+    if isinstance(error, APIStatusError):
+        retry_after = error.response.headers.get("retry-after") if error.response else None
+        try:
+            if retry_after is not None:
+                return min(LLM_RETRY_MAX_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    ceiling = min(LLM_RETRY_MAX_SECONDS, LLM_RETRY_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def _call(stage: str, fn):
+    """Run fn() under the concurrency limit, retrying transient failures."""
+    attempt = 0
+    while True:
+        try:
+            with _semaphore:
+                return fn()
+        except Exception as e:
+            if attempt >= LLM_MAX_RETRIES or not _is_retryable(e):
+                raise
+            delay = _retry_delay(e, attempt)
+            attempt += 1
+            logger.warning(
+                "%s request failed (%s); retry %d/%d in %.1fs",
+                stage, e.__class__.__name__, attempt, LLM_MAX_RETRIES, delay,
+            )
+            time.sleep(delay)
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize line endings and trailing whitespace for cache keys."""
+    lines = str(text).replace("\r\n", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def cache_key(model: str, messages: list[dict], params: dict) -> str:
+    """Hash (model, normalized messages, parameters) into a cache key."""
+    normalized = [
+        {"role": m.get("role"), "content": _normalize_text(m.get("content") or "")}
+        for m in messages
+    ]
+    payload = json.dumps(
+        {"model": model, "messages": normalized, "params": params},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def chat(
+    stage: str,
+    messages: list[dict],
+    model: str = None,
+    cache: bool = None,
+    **params,
+) -> ChatResult:
+    """
+    Run a chat completion.
+
+    Args:
+        stage: Pipeline stage name, selects the timeout (e.g. 'translation')
+        messages: Chat messages
+        model: Model name (defaults to LLM_MODEL)
+        cache: Use the response cache. None caches only deterministic
+            calls (temperature=0); False opts out; True opts in.
+            Truncated or malformed-JSON responses are never cached.
+        **params: Extra completion parameters (temperature, max_tokens, ...)
+
+    Returns:
+        ChatResult(text, finish_reason)
+
+    Raises:
+        Exception: On non-retryable API errors or when retries are exhausted
+    """
+    model = model or LLM_MODEL
+    if cache is None:
+        cache = params.get("temperature") == 0
+    key = cache_key(model, messages, params) if cache and LLM_CACHE_ENABLED else None
+
+    if key:
+        cached = response_cache.get(key)
+        if cached:
+            logger.debug("%s response served from cache", stage)
+            return ChatResult(cached["text"], cached["finish_reason"])
+
+    def request():
+        return get_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            timeout=_timeout(stage),
+            **params,
+        )
+
+    response = _call(stage, request)
+    choice = response.choices[0]
+    result = ChatResult((choice.message.content or "").strip(), choice.finish_reason)
+
+    if key and _is_cacheable(result, params):
+        response_cache.set(key, result._asdict())
+    return result
+
+
+def _is_cacheable(result: ChatResult, params: dict) -> bool:
+    """
+    Only complete responses are cached: a truncated reply, or one that
+    is not valid JSON when JSON was requested, would be replayed to every
+    retry for the whole TTL.
+    """
+    if not result.text or result.finish_reason == "length":
+        return False
+    if (params.get("response_format") or {}).get("type") == "json_object":
+        try:
+            json.loads(result.text)
+        except json.JSONDecodeError:
+            return False
+    return True
+
+
+def transcribe(file_path: str, model: str, stage: str = "transcription", **params):
+    """
+    Transcribe an audio file (the file is reopened for each attempt).
+
+    Returns:
+        The transcription API result object
+    """
+    def request():
+        with open(file_path, "rb") as f:
+            return get_client().audio.transcriptions.create(
+                model=model,
+                file=f,
+                timeout=_timeout(stage),
+                **params,
+            )
+
+    return _call(stage, request)
+
+
+def warm_up(background: bool = True) -> None:
+    """
+    Open a pooled connection ahead of the first real request, so it does
+    not pay for DNS + TLS setup.
+    """
+    def run():
+        try:
+            get_client().models.list(timeout=_timeout("default"))
+            logger.info("LLM connection warmed up")
+        except Exception as e:
+            logger.warning("LLM warm-up failed: %s", e)
+
+    if background:
+        threading.Thread(target=run, name="llm-warm-up", daemon=True).start()
+    else:
+        run()
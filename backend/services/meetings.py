@@ -0,0 +1,259 @@
+"""
+Meeting listing and search.
+
+Pages through a user's meetings newest first with keyset pagination on
+(created_at, id): each page continues from the last row of the previous
+one through the ix_meetings_user_created index, so page cost does not
+grow with how far the client has scrolled. Only lightweight columns are
+loaded; transcripts, summaries and memos stay in the database.
+
+Search runs against the meetings_fts FTS5 index, which triggers keep in
+step with the meetings table (see models.MEETINGS_FTS_DDL).
+"""
+
+import base64
+import html
+import logging
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import load_only
+
+from ..config import DEFAULT_USER_ID, MEETINGS_PAGE_SIZE, MEETINGS_MAX_PAGE_SIZE
+from ..models import db, Meeting
+from . import export
+
+logger = logging.getLogger(__name__)
+
+# meetings_fts columns searched, in snippet preference order, and their
+# BM25 weights
+_SEARCH_COLUMNS = ("title", "summary", "action_items", "transcript")
+SEARCH_WEIGHTS = "10.0, 4.0, 3.0, 1.0"
+SEARCH_SNIPPET_TOKENS = 16
+SEARCH_MAX_TERMS = 16
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# snippet() wraps matches in these private-use characters; the text is
+# HTML-escaped first and only then are they turned into <mark> tags
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+
+_LIST_COLUMNS = (
+    Meeting.id,
+    Meeting.created_at,
+    Meeting.audio_filename,
+    Meeting.original_language,
+    Meeting.meeting_type,
+    Meeting.was_translated,
+    Meeting.duration_seconds,
+)
+
+
+def encode_cursor(created_at: datetime, meeting_id: str) -> str:
+    """Opaque page cursor for the row a page ended on."""
+    raw = f"{created_at.isoformat()}|{meeting_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Inverse of encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, meeting_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), export.safe_meeting_id(meeting_id)
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def parse_date(value: str, end: bool = False) -> datetime:
+    """
+    Parse a local ISO date or datetime filter into naive UTC.
+
+    A bare date as the end of a range covers that whole day.
+
+    Raises:
+        ValueError: If the value is not an ISO date/datetime
+    """
+    parsed = datetime.fromisoformat(value)
+    if end and len(value) <= 10:
+        parsed += timedelta(days=1)
+    return export.local_to_utc(parsed)
+
+
+def list_meetings(
+    user_id: int = DEFAULT_USER_ID,
+    limit: int = None,
+    cursor: str = None,
+    language: str = None,
+    meeting_type: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+) -> tuple[list[dict], str]:
+    """
+    One page of a user's meetings, newest first.
+
+    Args:
+        user_id: Owner of the meetings
+        limit: Page size (capped at MEETINGS_MAX_PAGE_SIZE)
+        cursor: next_cursor from the previous page
+        language: Only meetings in this original language (case-insensitive)
+        meeting_type: Only meetings of this type
+        date_from: Only meetings created at or after this (naive UTC)
+        date_to: Only meetings created before this (naive UTC)
+
+    Returns:
+        Tuple of (meetings, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = max(1, min(limit or MEETINGS_PAGE_SIZE, MEETINGS_MAX_PAGE_SIZE))
+
+    query = Meeting.query.options(load_only(*_LIST_COLUMNS)).filter(Meeting.user_id == user_id)
+    if language:
+        query = query.filter(func.lower(Meeting.original_language) == language.lower())
+    if meeting_type:
+        query = query.filter(Meeting.meeting_type == meeting_type)
+    if date_from:
+        query = query.filter(Meeting.created_at >= date_from)
+    if date_to:
+        query = query.filter(Meeting.created_at < date_to)
+    if cursor:
+        query = query.filter(tuple_(Meeting.created_at, Meeting.id) < decode_cursor(cursor))
+
+    # One extra row tells whether another page follows
+    rows = (
+        query.order_by(Meeting.created_at.desc(), Meeting.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return [_summary_dict(row) for row in rows], next_cursor
+
+
+def iter_meeting_ids(user_id: int = DEFAULT_USER_ID, **filters):
+    """
+    Yield the IDs of every matching meeting, newest first.
+
+    Walks list_meetings pages, so only one page is held in memory at a
+    time however many meetings match.
+
+    Args:
+        user_id: Owner of the meetings
+        **filters: language, meeting_type, date_from, date_to (as for list_meetings)
+    """
+    cursor = None
+    while True:
+        page, cursor = list_meetings(
+            user_id=user_id, limit=MEETINGS_MAX_PAGE_SIZE, cursor=cursor, **filters
+        )
+        for item in page:
+            yield item["meeting_id"]
+        if not cursor:
+            return
+
+
+def _summary_dict(meeting: Meeting) -> dict:
+    return {
+        "meeting_id": meeting.id,
+        "created_at": (
+            export.utc_to_local(meeting.created_at).isoformat(timespec="seconds")
+            if meeting.created_at else ""
+        ),
+        "source_filename": meeting.audio_filename or "",
+        "original_language": meeting.original_language,
+        "meeting_type": meeting.meeting_type,
+        "was_translated": bool(meeting.was_translated),
+        "duration_seconds": meeting.duration_seconds,
+    }
+
+
+def _fts_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 query: every word must match, the
+    last one as a prefix (so results appear while the user is typing).
+    """
+    words = _WORD_RE.findall(query or "")
+    if not words:
+        return ""
+    terms = [f'"{word}"' for word in words[:SEARCH_MAX_TERMS]]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_meetings(query: str, user_id: int = DEFAULT_USER_ID, limit: int = None) -> list[dict]:
+    """
+    Full-text search over meeting titles, summaries, action items and
+    transcripts (original and English), best matches first.
+
+    Ranking is BM25 with title and summary hits weighted above transcript
+    hits. Snippets are HTML-escaped, with matched terms wrapped in
+    <mark>...</mark>, so they can be inserted as HTML.
+
+    Args:
+        query: Free-text search string
+        user_id: Owner of the meetings
+        limit: Max results (capped at MEETINGS_MAX_PAGE_SIZE)
+
+    Returns:
+        Meetings with listing fields plus rank, snippet and the column
+        the snippet came from ("matched_in")
+    """
+    match = _fts_query(query)
+    if not match:
+        return []
+    limit = max(1, min(limit or MEETINGS_PAGE_SIZE, MEETINGS_MAX_PAGE_SIZE))
+
+    snippets = ",\n".join(
+        f"snippet(meetings_fts, {n}, :match_start, :match_end, '…', {SEARCH_SNIPPET_TOKENS}) AS {name}_snippet"
+        for n, name in enumerate(_SEARCH_COLUMNS, start=2)
+    )
+    statement = text(f"""
+        SELECT m.id, m.created_at, m.audio_filename, m.original_language,
+               m.meeting_type, m.was_translated, m.duration_seconds,
+               bm25(meetings_fts, 0, 0, {SEARCH_WEIGHTS}) AS rank,
+               {snippets}
+        FROM meetings_fts
+        JOIN meetings m ON m.rowid = meetings_fts.rowid
+        WHERE meetings_fts MATCH :match AND meetings_fts.user_id = :user_id
+        ORDER BY rank
+        LIMIT :limit
+    """).columns(*_LIST_COLUMNS)
+
+    params = {
+        "match": match,
+        "user_id": user_id,
+        "limit": limit,
+        "match_start": _MATCH_START,
+        "match_end": _MATCH_END,
+    }
+    results = []
+    for row in db.session.execute(statement, params):
+        item = _summary_dict(row)
+        item["rank"] = round(-row.rank, 4)
+        # First column (in weight order) with a highlighted match
+        matched_in = next(
+            (name for name in _SEARCH_COLUMNS if _MATCH_START in (getattr(row, f"{name}_snippet") or "")),
+            "transcript",
+        )
+        item["matched_in"] = matched_in
+        item["snippet"] = _highlight(getattr(row, f"{matched_in}_snippet") or "")
+        results.append(item)
+    return results
+
+
+def _highlight(snippet: str) -> str:
+    """HTML-escape a raw snippet, then turn the match markers into <mark> tags."""
+    escaped = html.escape(snippet.strip())
+    return escaped.replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
@@ -0,0 +1,278 @@
+"""
+Meeting processing pipeline.
+
+Runs the full chain for one uploaded recording:
+transcribe -> detect/translate -> summarize -> back-translate -> save.
+Live recordings arrive already transcribed segment by segment and join
+the chain after transcription (finish_live_meeting).
+Called from background jobs; progress is reported through the Job, and
+each completed stage emits an event carrying its partial results
+(uploaded, transcribed, language_detected, translated, summarized,
+back_translated, saved) for the SSE progress stream.
+"""
+
+import logging
+import os
+import time
+
+from ..config import PDF_PRERENDER
+from . import transcription, translation, summarization, export, janitor, live
+
+logger = logging.getLogger(__name__)
+
+# Filename recorded for meetings captured with live recording
+LIVE_RECORDING_FILENAME = "live_recording.webm"
+
+
+def process_meeting(
+    job,
+    save_path: str,
+    filename: str,
+    agenda: str = "",
+    audio_digest: str = None,
+) -> dict:
+    """
+    Process an uploaded audio file end to end.
+
+    Args:
+        job: Job used for stage/progress reporting
+        save_path: Path of the uploaded audio file, pinned in the janitor
+            by the caller (deleted and unpinned when done)
+        filename: Original (sanitized) upload filename
+        agenda: Optional meeting agenda
+        audio_digest: SHA-256 of the upload, used for the transcript cache
+
+    Returns:
+        Result payload (same fields as the former synchronous /api/process
+        response, minus URLs which the route adds)
+
+    Raises:
+        RuntimeError: If transcription or saving fails
+    """
+    try:
+        job.emit("uploaded", {"filename": filename})
+
+        # Step 1: Transcribe
+        job.update("transcribing", 10)
+        try:
+            transcript_text, source_language = transcription.transcribe_audio_file(
+                save_path, audio_digest=audio_digest
+            )
+        except Exception as e:
+            logger.exception("Transcription failed")
+            raise RuntimeError(f"Transcription failed: {e}") from e
+
+        return _process_transcript(
+            job, transcript_text, source_language, filename, agenda,
+            duration_seconds=transcription.audio_duration(save_path),
+        )
+
+    finally:
+        # Step 6: Cleanup audio file
+        try:
+            os.remove(save_path)
+            logger.info("Deleted audio file: %s", save_path)
+        except Exception as e:
+            logger.warning("Could not delete audio file: %s", e)
+        janitor.unpin(save_path)
+
+
+def finish_live_meeting(job, session, agenda: str = "") -> dict:
+    """
+    Finish a live recording whose audio was transcribed segment by segment.
+
+    Waits for segments still being transcribed (normally just the last
+    one) and retries any that failed, then runs the same steps as
+    process_meeting on the assembled transcript. If a segment still
+    fails the job fails, so the client re-sends the whole recording.
+    Segments were translated as they arrived and the memo comes from the
+    session's rolling summary of that English text, so only the last
+    segment, the memo's last window and a short merge call are left to run.
+
+    Args:
+        job: Job used for stage/progress reporting
+        session: live.LiveSession that received the audio segments
+        agenda: Optional meeting agenda
+
+    Returns:
+        Result payload (same fields as process_meeting)
+
+    Raises:
+        RuntimeError: If a segment could not be transcribed or translated,
+            no speech was transcribed or saving fails
+    """
+    job.update("transcribing", 10)
+    session.wait_for_audio()
+    failed = live.retry_failed_segments(session)
+    if failed:
+        raise RuntimeError(
+            f"Processing failed for {len(failed)} recording segment(s); "
+            "upload the full recording instead"
+        )
+    transcript_text, source_language = session.audio_transcript()
+    if not transcript_text.strip():
+        raise RuntimeError("Transcription failed: no speech was transcribed in this recording")
+
+    session.feed_summary(force=True)
+    agenda = agenda or session.summary.agenda
+    english = session.english_transcript()
+
+    def translate(text, source_language, on_language_detected=None):
+        _, language_name, was_translated = english
+        if on_language_detected:
+            on_language_detected(language_name, was_translated)
+        return english
+
+    def summarize(english_transcript, agenda, detected_language):
+        try:
+            return session.summary.finalize(agenda)
+        except Exception as e:
+            logger.warning("Rolling summary failed, summarizing full transcript: %s", e)
+            return summarization.summarize_and_extract_actions(
+                english_transcript, agenda, detected_language
+            )
+
+    return _process_transcript(
+        job, transcript_text, source_language, LIVE_RECORDING_FILENAME, agenda,
+        translate=translate,
+        summarize=summarize,
+        duration_seconds=time.time() - session.created_at,
+    )
+
+
+def _process_transcript(
+    job,
+    transcript_text: str,
+    source_language: str,
+    filename: str,
+    agenda: str = "",
+    translate=None,
+    summarize=None,
+    duration_seconds: float = None,
+) -> dict:
+    """
+    Steps after transcription: translate, summarize, back-translate, save.
+
+    `translate(transcript, source_language, on_language_detected=...)`
+    replaces translation.detect_and_translate_if_needed and
+    `summarize(english_transcript, agenda, detected_language)` replaces
+    summarization.summarize_and_extract_actions when given. The meeting
+    is saved with both its original-language and English versions.
+    """
+    translate = translate or translation.detect_and_translate_if_needed
+    summarize = summarize or summarization.summarize_and_extract_actions
+    original_transcript = transcript_text
+    job.update("detecting_language", 35)
+    job.emit("transcribed", {
+        "transcript": original_transcript,
+        "source_language": source_language,
+    })
+
+    def language_detected(language_name, needs_translation):
+        if needs_translation:
+            job.update("translating", 40)
+        job.emit("language_detected", {
+            "original_language": language_name,
+            "needs_translation": needs_translation,
+        })
+
+    # Step 2: Detect language and translate if needed
+    translated_transcript, detected_language, was_translated = translate(
+        transcript_text, source_language, on_language_detected=language_detected
+    )
+
+    if was_translated:
+        logger.info("Transcript translated from %s to English", detected_language)
+        job.emit("translated", {"english_transcript": translated_transcript})
+
+    # Step 3: Summarize and extract action items
+    job.update("summarizing", 60)
+    try:
+        summary, action_items, memo_json = summarize(
+            translated_transcript, agenda, detected_language
+        )
+    except Exception:
+        logger.exception("Summarization failed")
+        summary, action_items, memo_json = "", [], {}
+
+    job.emit("summarized", {
+        "english_summary": summary,
+        "english_action_items": action_items,
+        "memo_json": memo_json,
+    })
+
+    # Step 4: Generate original language versions if translated
+    original_summary = summary
+    original_action_items = action_items
+
+    if was_translated and detected_language and detected_language.lower() != "english":
+        job.update("back_translating", 85)
+        original_summary, original_action_items = _translate_results_back(
+            summary, action_items, detected_language
+        )
+        job.emit("back_translated", {
+            "summary": original_summary,
+            "action_items": original_action_items,
+        })
+
+    # Step 5: Save meeting artifacts
+    job.update("saving", 95)
+    meeting_id = export.new_meeting_id()
+
+    try:
+        export.save_meeting_artifacts(
+            meeting_id=meeting_id,
+            filename=filename,
+            transcript=translated_transcript,
+            summary=summary,
+            action_items=action_items,
+            original_language=detected_language,
+            was_translated=was_translated,
+            memo_json=memo_json,
+            transcript_original=original_transcript,
+            summary_original=original_summary,
+            action_items_original=original_action_items,
+            duration_seconds=duration_seconds,
+            metadata={"agenda": agenda} if agenda else None,
+        )
+    except Exception as e:
+        logger.exception("Failed to save meeting artifacts")
+        raise RuntimeError(f"Failed to save meeting: {e}") from e
+
+    job.emit("saved", {"meeting_id": meeting_id})
+
+    if PDF_PRERENDER:
+        try:
+            export.prerender_pdf(export.load_meeting_artifacts(meeting_id))
+        except Exception as e:
+            logger.warning("Could not queue PDF pre-render: %s", e)
+
+    return {
+        "meeting_id": meeting_id,
+        "transcript": original_transcript,
+        "english_transcript": translated_transcript,
+        "summary": original_summary,
+        "english_summary": summary,
+        "action_items": original_action_items,
+        "english_action_items": action_items,
+        "original_language": detected_language,
+        "was_translated": was_translated,
+        "memo_json": memo_json,
+    }
+
+
+def _translate_results_back(summary: str, action_items: list, target_language: str) -> tuple:
+    """
+    Translate summary and action items back to original language.
+
+    Returns:
+        Tuple of (translated_summary, translated_action_items)
+    """
+    if not target_language or target_language.lower() == "unknown":
+        return summary, action_items
+
+    try:
+        return translation.translate_summary_and_actions(summary, action_items, target_language)
+    except Exception as e:
+        logger.warning("Could not translate results to %s: %s", target_language, e)
+        return summary, action_items
@@ -4,31 +4,316 @@ Question and answer detection service.
 Automatically detects questions in meeting transcripts,
 determines if they're rhetorical, and answers real questions
 based on the meeting context.
+
+Rather than sending the whole transcript with every snippet, answers are
+grounded in a BM25 index over fixed-size transcript windows: the windows
+most relevant to the snippet's questions plus the most recent tail. The
+index is incremental, so live sessions add text as it arrives.
+
+Most snippets contain no question, so a local pre-filter (question marks,
+interrogative words across the supported languages) gates the LLM call.
 """
 
 import json
 import logging
-from openai import OpenAI
+import math
+import re
+import threading
+from collections import Counter, deque
+
+from ..config import (
+    QA_WINDOW_CHARS,
+    QA_TOP_K,
+    QA_TAIL_CHARS,
+    QA_INDEX_MAX_WINDOWS,
+    QA_PREFILTER_ENABLED,
+    QA_PREFILTER_THRESHOLD,
+)
+from . import llm
+from .chunking import DENSE_SCRIPT_RANGES
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI()  # reads OPENAI_API_KEY from environment
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Words, plus single CJK/kana/Hangul/Thai characters (no spaces between words)
+_TERM_RE = re.compile(rf"[{DENSE_SCRIPT_RANGES}]|[^\W\d_]{{2,}}|\d+")
+_QUESTION_RE = re.compile(r"[^.!?。！？\n]*[?？]")
+
+
+def _terms(text: str) -> list[str]:
+    return [t.lower() for t in _TERM_RE.findall(text or "")]
+
+
+class _Window:
+    __slots__ = ("id", "start", "text", "tf", "length")
+
+    def __init__(self, window_id: int, start: int, text: str):
+        self.id = window_id
+        self.start = start
+        self.text = text
+        self.tf = Counter(_terms(text))
+        self.length = sum(self.tf.values())
+
+
+class TranscriptIndex:
+    """
+    Incremental BM25 index over consecutive transcript windows.
+
+    Text is appended as it arrives; every ~window_chars it is sealed into
+    a window and indexed. Only the newest max_windows windows are kept.
+    """
+
+    def __init__(self, window_chars: int = None, max_windows: int = None):
+        self.window_chars = window_chars or QA_WINDOW_CHARS
+        self.max_windows = max_windows or QA_INDEX_MAX_WINDOWS
+        self.total_chars = 0
+        self._windows: deque[_Window] = deque()
+        self._by_id: dict[int, _Window] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._total_length = 0
+        self._next_id = 0
+        self._open = ""
+        self._open_start = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def add(self, text: str) -> None:
+        """Append transcript text, indexing every window it completes."""
+        if not text:
+            return
+        with self._lock:
+            self._open += text
+            self.total_chars += len(text)
+            while len(self._open) >= self.window_chars:
+                # Prefer to cut after a space in the second half of the window
+                cut = self._open.rfind(" ", self.window_chars // 2, self.window_chars)
+                cut = cut + 1 if cut != -1 else self.window_chars
+                self._seal(self._open[:cut])
+                self._open = self._open[cut:]
+
+    def _seal(self, text: str) -> None:
+        # Caller holds self._lock
+        window = _Window(self._next_id, self._open_start, text)
+        self._next_id += 1
+        self._open_start += len(text)
+        self._windows.append(window)
+        self._by_id[window.id] = window
+        self._total_length += window.length
+        for term, tf in window.tf.items():
+            self._postings.setdefault(term, {})[window.id] = tf
+
+        while len(self._windows) > self.max_windows:
+            self._evict(self._windows.popleft())
+
+    def _evict(self, window: _Window) -> None:
+        # Caller holds self._lock
+        del self._by_id[window.id]
+        self._total_length -= window.length
+        for term in window.tf:
+            postings = self._postings[term]
+            del postings[window.id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, k: int = None, before: int = None) -> list[str]:
+        """
+        Return the texts of the k windows most relevant to the query,
+        in transcript order.
+
+        Args:
+            query: Query text
+            k: Number of windows (defaults to QA_TOP_K)
+            before: Only consider windows that end at or before this
+                character offset
+        """
+        k = QA_TOP_K if k is None else k
+        query_terms = set(_terms(query))
+        with self._lock:
+            count = len(self._windows)
+            if not count or not query_terms or k <= 0:
+                return []
+            average_length = self._total_length / count or 1
+
+            scores: dict[int, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for window_id, tf in postings.items():
+                    window = self._by_id[window_id]
+                    if before is not None and window.start + len(window.text) > before:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * window.length / average_length)
+                    scores[window_id] = scores.get(window_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            best = sorted(scores, key=lambda window_id: scores[window_id], reverse=True)[:k]
+            return [self._by_id[window_id].text for window_id in sorted(best)]
+
+    def tail(self, chars: int = None) -> str:
+        """The most recent `chars` characters of indexed transcript."""
+        chars = QA_TAIL_CHARS if chars is None else chars
+        with self._lock:
+            pieces = [self._open]
+            size = len(self._open)
+            for window in reversed(self._windows):
+                if size >= chars:
+                    break
+                pieces.append(window.text)
+                size += len(window.text)
+            text = "".join(reversed(pieces))
+        return text[-chars:] if chars > 0 else ""
+
+    def context_for(self, snippet: str, k: int = None, tail_chars: int = None) -> str:
+        """
+        Build answer context for a snippet: the windows most relevant to
+        its questions (or to the whole snippet if none are marked), then
+        the recent tail.
+        """
+        tail_chars = QA_TAIL_CHARS if tail_chars is None else tail_chars
+        tail = self.tail(tail_chars)
+        query = " ".join(_QUESTION_RE.findall(snippet or "")) or snippet
+        excerpts = self.search(query, k, before=self.total_chars - len(tail))
+
+        parts = [f"[Earlier excerpt]\n{excerpt.strip()}" for excerpt in excerpts]
+        if tail.strip():
+            parts.append(f"[Most recent transcript]\n{tail.strip()}")
+        return "\n\n".join(parts)
+
+
+# ---- Local question pre-filter ----
+
+# Question punctuation (Whisper marks rising intonation with "?")
+_QUESTION_MARK_RE = re.compile(r"[?？¿؟]")
+
+# Unambiguous interrogative markers: particles, accented interrogatives,
+# fixed question phrases
+_STRONG_CUE_RE = re.compile(
+    r"吗|嗎|呢[？?]?$|(?<!没)(?<!没有)什么|为什么|怎么|咩|點解|邊個|係咪|係唔係|有冇"  # zh / yue
+    r"|ですか|ますか|でしょうか|のか|なぜ|だれ"  # ja
+    # not いつも "always", どうも "thanks", どこか "somewhere", 誰か "someone"
+    r"|いつ(?!も)|どう(?![もぞ])|どこ(?![かも])|誰(?![かも])"
+    # 何 only in interrogative forms (not 何か "something", 何も "nothing", 任何 "any")
+    r"|何(?:が|を|て|故|人|時(?!も)|で(?!も)|と(?![かも])|なの|だろう|でしょう)"
+    r"|까요?|나요|니까|무엇|왜|어떻게|언제|어디|누구"  # ko
+    r"|ไหม|หรือเปล่า|อะไร|ทำไม|อย่างไร|เมื่อไร|ที่ไหน"  # th
+    r"|क्या|क्यों|कैसे|कब|कहाँ|कौन"  # hi
+    r"|(?<!\w)(?:هل|لماذا|كيف|متى|أين|ماذا|من هو)(?!\w)"  # ar
+    r"|(?<!\w)(?:qué|cuándo|dónde|quién|quiénes|cómo|cuál|cuáles|cuánto|cuánta)(?!\w)"  # es
+    r"|(?<!\w)(?:est-ce que|qu'est-ce|pourquoi|combien)(?!\w)|-(?:vous|tu|il|elle|on|nous)(?!\w)"  # fr
+    r"|(?<!\w)(?:warum|wieso|weshalb)(?!\w)"  # de
+    r"|(?<!\w)(?:por que|por quê|será que)(?!\w)"  # pt
+    r"|(?<!\w)(?:perché|cosa|come mai)(?!\w)"  # it
+    r"|(?<!\w)(?:waarom|wanneer)(?!\w)|(?<!\w)(?:varför|hvorfor|hvornår)(?!\w)"  # nl / sv / da
+    r"|(?<!\w)(?:neden|nasıl|ne zaman|nerede)(?!\w)"  # tr
+    # mi/mı close the clause they question (Spanish/Italian "mi" does not)
+    r"|(?<!\w)m[ıiuü](?:s[ıiuü]n(?:[ıiuü]z)?)?(?=\s*(?:[,;:]|$))"
+    r"|(?<!\w)(?:czy|dlaczego)(?!\w)"  # pl
+    r"|(?<!\w)(?:почему|зачем|ли|сколько)(?!\w)"  # ru
+    r"|(?<!\w)(?:tại sao|bao giờ|như thế nào|ở đâu|có phải|không ạ)(?!\w)"  # vi
+    r"|(?<!\w)(?:any (?:questions|thoughts|ideas|objections)|don't you think|any idea)$"
+    r"|,\s*(?:right|isn't it)$",  # tag questions need the comma ("that's right" is a statement)
+    re.IGNORECASE,
+)
+
+# English question openers (wh-word + auxiliary, auxiliary + subject). Both
+# also occur inside statements ("the problem is it does not scale"), so they
+# only count at the start of a clause, after optional filler words.
+_EN_QUESTION_START_RE = re.compile(
+    r"(?:^|[.!。！;:\n])\s*(?:(?:so|and|but|okay|ok|well|also|then|now|sorry),?\s+)*"
+    r"(?:(?:what|when|where|who|why|how|which)(?:'s|'re| is| are| was| were| do| does| did| can| could| will| would| should)"
+    r"|(?:do|does|did|can|could|will|would|should|is|are|was|were|have|has|shall)"
+    r" (?:you|we|they|i|he|she|it|anyone|everyone|somebody|someone))(?!\w)",
+    re.IGNORECASE,
+)
+
+# Interrogative words that also appear in statements; only counted when
+# they open a clause. Unaccented Spanish que/como/donde are left out: the
+# interrogatives carry accents (strong cues above), the plain forms are
+# "that", "as" and "where" in statements.
+_LEAD_WORDS = {
+    "what", "when", "where", "who", "why", "how", "which",
+    "quand", "comment", "quel", "quelle", "où", "qui",
+    "wie", "wann", "wo", "wer", "welche", "quale", "quando", "dove", "chi",
+    "onde", "qual", "quem", "wat", "hoe", "waar", "vad", "hur", "när",
+    "hvad", "hvordan", "ne", "kim", "hangi", "jak", "kiedy", "gdzie", "co", "kto",
+    "что", "как", "кто", "какой", "когда", "где", "gì", "sao",
+}
+_CLAUSE_START_RE = re.compile(r"(?:^|[.!。！;:\n]\s*)([^\W\d_]+)", re.UNICODE)
+
+_prefilter_lock = threading.Lock()
+_prefilter_counts = {"checked": 0, "passed": 0, "skipped": 0}
+
+
+def question_score(text: str) -> float:
+    """
+    Score (0-1) how likely a snippet contains a question, without an LLM.
+
+    1.0 for question punctuation, 0.8 for unambiguous interrogative
+    markers in any supported language, 0.6 for an interrogative word
+    opening a clause, 0 otherwise.
+    """
+    if not text:
+        return 0.0
+    if _QUESTION_MARK_RE.search(text):
+        return 1.0
+    stripped = text.strip().rstrip(".!。！")
+    if _STRONG_CUE_RE.search(stripped) or _EN_QUESTION_START_RE.search(stripped):
+        return 0.8
+    for word in _CLAUSE_START_RE.findall(stripped):
+        if word.lower() in _LEAD_WORDS:
+            return 0.6
+    return 0.0
+
+
+def might_contain_question(text: str, threshold: float = None) -> bool:
+    """
+    Cheap gate before an LLM detection call; counts checks and calls saved.
+    """
+    threshold = QA_PREFILTER_THRESHOLD if threshold is None else threshold
+    passed = question_score(text) >= threshold
+    with _prefilter_lock:
+        _prefilter_counts["checked"] += 1
+        _prefilter_counts["passed" if passed else "skipped"] += 1
+    return passed
+
+
+def prefilter_stats() -> dict:
+    """Snippets checked by the pre-filter and LLM calls it saved."""
+    with _prefilter_lock:
+        counts = dict(_prefilter_counts)
+    counts["llm_calls_saved"] = counts["skipped"]
+    counts["skip_ratio"] = round(counts["skipped"] / counts["checked"], 3) if counts["checked"] else 0.0
+    counts["enabled"] = QA_PREFILTER_ENABLED
+    counts["threshold"] = QA_PREFILTER_THRESHOLD
+    return counts
 
 
 def detect_and_answer_questions(
     new_transcript: str,
-    full_transcript: str = ""
+    full_transcript: str = "",
+    context: str = None,
+    prefilter: bool = None,
 ) -> list[dict]:
     """
     Detect questions in a transcript snippet and answer real questions.
     
     Identifies questions, classifies them as rhetorical or real,
-    and provides answers for real questions using full context.
+    and provides answers for real questions using relevant context.
     
     Args:
         new_transcript: New transcript snippet to analyze for questions
-        full_transcript: Full meeting transcript for context (optional)
+        full_transcript: Full meeting transcript (optional); long ones are
+            reduced to the windows relevant to the snippet plus the tail
+        context: Prebuilt answer context (e.g. TranscriptIndex.context_for),
+            used instead of full_transcript
+        prefilter: Skip the LLM call when the local pre-filter finds no
+            question cue (defaults to QA_PREFILTER_ENABLED)
     
     Returns:
         List of question dictionaries with keys:
@@ -42,11 +327,20 @@ def detect_and_answer_questions(
     if not new_transcript or len(new_transcript) < 20:
         logger.info("Transcript snippet too short, skipping question detection")
         return []
+
+    if prefilter is None:
+        prefilter = QA_PREFILTER_ENABLED
+    if prefilter and not might_contain_question(new_transcript):
+        logger.debug("No question cues in snippet, skipping question detection")
+        return []
     
+    if context is None:
+        context = _context_from_transcript(new_transcript, full_transcript or "")
+
     logger.info(
         "Detecting questions in %d char snippet (context: %d chars)",
         len(new_transcript),
-        len(full_transcript or "")
+        len(context)
     )
     
     detection_prompt = f"""Analyze this transcript snippet and identify any questions asked.
@@ -54,7 +348,7 @@ def detect_and_answer_questions(
 For each question found:
 1. Extract the exact question (verbatim from the transcript)
 2. Determine if it's a rhetorical question (asked for effect, not expecting answer) or a real question
-3. If it's a real question, answer it based on the FULL meeting transcript so far
+3. If it's a real question, answer it based on the meeting transcript context below
 
 Respond with ONLY a JSON array (no other text):
 [
@@ -75,21 +369,20 @@ If no questions are found, return an empty array: []
 New transcript snippet:
 \"\"\"{new_transcript}\"\"\"
 
-Full transcript context:
-\"\"\"{full_transcript}\"\"\"
+Meeting transcript context:
+\"\"\"{context}\"\"\"
 """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        response_text = llm.chat(
+            "qa",
             messages=[
                 {"role": "user", "content": detection_prompt}
             ],
             temperature=0.5,
             max_tokens=1000,
-        )
-        
-        response_text = (response.choices[0].message.content or "").strip()
+            cache=False,  # answers depend on the live meeting state
+        ).text
         
         try:
             questions = json.loads(response_text)
@@ -108,6 +401,17 @@ Full transcript context:
         raise
 
 
+def _context_from_transcript(new_transcript: str, full_transcript: str) -> str:
+    """Use a short transcript as-is; index a long one and retrieve from it."""
+    if len(full_transcript) <= QA_TAIL_CHARS + QA_TOP_K * QA_WINDOW_CHARS:
+        return full_transcript
+
+    windows = len(full_transcript) // QA_WINDOW_CHARS + 1
+    index = TranscriptIndex(max_windows=max(QA_INDEX_MAX_WINDOWS, windows))
+    index.add(full_transcript)
+    return index.context_for(new_transcript)
+
+
 def auto_detect_qa(transcript: str) -> list[dict]:
     """
     Auto-detect Q&A patterns in a complete transcript.
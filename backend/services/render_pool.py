@@ -0,0 +1,134 @@
+"""
+Process pool for CPU-bound export rendering.
+
+ReportLab layout is pure Python and holds the GIL for as long as it
+runs, which stalls every thread in the web process (request handlers,
+pipeline jobs waiting on OpenAI). Rendering is handed to a small pool of
+worker processes instead: the calling thread only waits on a future,
+so other threads keep running.
+
+Admission is bounded: at most RENDER_QUEUE_LIMIT renders may be queued
+or running, beyond that run() raises QueueFullError so callers can shed
+load (e.g. answer 503) instead of piling up work. Callers that would
+rather wait (bulk exports) pass `wait` to block until a slot frees up.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ..config import RENDER_WORKERS, RENDER_QUEUE_LIMIT, RENDER_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(RuntimeError):
+    """Raised when too many renders are pending to accept another one."""
+
+
+_lock = threading.Lock()
+_slot_freed = threading.Condition(_lock)
+_executor = None
+_max_workers = RENDER_WORKERS
+_queue_limit = RENDER_QUEUE_LIMIT
+_pending = 0
+
+
+def configure(max_workers: int = None, queue_limit: int = None) -> None:
+    """
+    (Re)configure the pool; max_workers=0 renders on the calling thread.
+
+    Renders already running finish on the previous pool.
+    """
+    global _executor, _max_workers, _queue_limit
+    with _lock:
+        old = _executor
+        _executor = None
+        if max_workers is not None:
+            _max_workers = max_workers
+        if queue_limit is not None:
+            _queue_limit = queue_limit
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    # Caller holds _lock. "spawn" avoids forking a process that has
+    # threads (job workers, the janitor) mid-flight. Spawned workers
+    # re-import the main script as __mp_main__, so it must keep app
+    # setup out of module level (app.py builds its app in create_app()
+    # and skips that under __mp_main__).
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=_max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def pending() -> int:
+    """Number of queued or running renders."""
+    with _lock:
+        return _pending
+
+
+def _release(_future=None) -> None:
+    global _pending
+    with _lock:
+        _pending -= 1
+        _slot_freed.notify()
+
+
+def run(fn, *args, timeout: float = None, wait: float = 0):
+    """
+    Run `fn(*args)` in a worker process and return its result.
+
+    `fn` and its arguments must be picklable (module-level functions,
+    plain data).
+
+    Args:
+        timeout: Max seconds for the render itself (default RENDER_TIMEOUT_SECONDS)
+        wait: Max seconds to wait for a free slot when the queue is full
+
+    Raises:
+        QueueFullError: If RENDER_QUEUE_LIMIT renders are still pending after `wait`
+        TimeoutError: If the render takes longer than the timeout
+    """
+    global _pending, _executor
+    with _lock:
+        if not _slot_freed.wait_for(lambda: _pending < _queue_limit, timeout=wait):
+            raise QueueFullError(f"Render queue is full ({_pending} pending)")
+        _pending += 1
+        inline = _max_workers <= 0
+        executor = None if inline else _get_executor()
+
+    if inline:
+        try:
+            return fn(*args)
+        finally:
+            _release()
+
+    try:
+        future = executor.submit(fn, *args)
+    except BrokenProcessPool:
+        _release()
+        with _lock:
+            if _executor is executor:
+                _executor = None
+        raise
+    except Exception:
+        _release()
+        raise
+    future.add_done_callback(_release)
+
+    try:
+        return future.result(timeout=timeout or RENDER_TIMEOUT_SECONDS)
+    except BrokenProcessPool:
+        logger.error("Render worker died; starting a new pool for later renders")
+        with _lock:
+            if _executor is executor:
+                _executor = None
+        raise
@@ -3,17 +3,34 @@ Meeting summarization and action item extraction service.
 
 Uses GPT-4o-mini to summarize transcripts and extract structured action items.
 Supports structured JSON output with fallback to plain text.
+
+Long transcripts are summarized map-reduce style: windows are summarized
+in parallel into partial memos (same schema), merged and deduplicated
+locally, then a short reduce call rewrites the title and summary.
+
+Live meetings use the same building blocks incrementally (RollingSummary):
+each window is summarized as soon as enough transcript has arrived, so
+finishing the memo only costs the last window plus the reduce call.
 """
 
 import json
 import logging
-from openai import OpenAI
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import (
+    SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS,
+    SUMMARY_WINDOW_TOKENS,
+    SUMMARY_MAX_WORKERS,
+    LIVE_SUMMARY_WINDOW_TOKENS,
+)
+from . import llm
+from .chunking import estimate_tokens, split_text
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI()  # reads OPENAI_API_KEY from environment
-
 # Supported meeting types
 MEETING_TYPES = [
     'recruiting',
@@ -109,6 +126,8 @@ def summarize_and_extract_actions(
     
     Strategy:
     - Use GPT to produce structured JSON memo (meeting-type aware)
+    - Above SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS, summarize windows in
+      parallel and merge the partial memos (see merge_memos)
     - If agenda provided, organize around agenda items
     - Render memo to readable text
     - Extract action items as list[str]
@@ -133,6 +152,69 @@ def summarize_and_extract_actions(
         detected_language
     )
 
+    # --- Attempt structured JSON output ---
+    try:
+        if estimate_tokens(transcript or "") > SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS:
+            data = _summarize_map_reduce(transcript, agenda)
+        else:
+            logger.debug("Attempting structured JSON summarization")
+            data = _request_memo(_build_memo_prompt(transcript, agenda))
+
+        summary_text = _render_memo_to_text(data)
+        action_items = _action_items_to_strings(data.get("action_items") or [])
+
+        logger.info("Structured summarization succeeded, %d action items extracted", len(action_items))
+        return summary_text, action_items, data
+
+    except json.JSONDecodeError as e:
+        logger.warning("JSON parsing failed in structured summarization: %s", e)
+    except Exception as e:
+        logger.warning("Structured summarization failed (will use fallback): %s", e)
+
+    # --- Fallback: plain text (always works) ---
+    logger.debug("Using fallback plain text summarization")
+    fallback_prompt = f"""
+Summarize the transcript in 5-10 bullet points (high signal, no fluff).
+Then list action items as '-' bullets in the format: "Action — Owner (Due: ...)".
+If none, write: None.
+
+Transcript:
+\"\"\"{transcript}\"\"\"
+""".strip()
+
+    try:
+        text = llm.chat(
+            "summarization",
+            messages=[{"role": "user", "content": fallback_prompt}],
+            temperature=0.2,
+            max_tokens=900,
+            cache=True,
+        ).text
+        
+        # Extract action items (lines starting with "- ")
+        action_items = [
+            ln[2:].strip() for ln in text.splitlines()
+            if ln.strip().startswith("- ")
+        ]
+        
+        logger.info("Fallback summarization succeeded, %d action items extracted", len(action_items))
+        return text, action_items, {}
+        
+    except Exception as e:
+        logger.exception("Fallback summarization also failed: %s", e)
+        return "", [], {}
+
+
+def _build_memo_prompt(transcript: str, agenda: str = "", part: tuple[int, int] = None) -> str:
+    """
+    Build the structured memo prompt.
+
+    Args:
+        transcript: Transcript (or transcript window) to summarize
+        agenda: Optional meeting agenda
+        part: Optional (index, total) when summarizing one window of a
+            longer transcript; total is None for a transcript still growing
+    """
     agenda_instruction = ""
     if agenda.strip():
         agenda_instruction = f"""
@@ -143,7 +225,16 @@ IMPORTANT: The meeting had the following agenda:
 When structuring your notes, organize them by agenda items. Any discussion that doesn't fit the agenda should be placed in sections labeled "Opening Conversation" or "Other".
 In the notes_by_section, use the agenda items as headings where applicable."""
 
-    prompt_text = f"""
+    part_instruction = ""
+    if part and part[1] is None:
+        part_instruction = f"""
+- This is part {part[0]} of an ongoing meeting transcript. Cover only what is said in this part.
+- Write the memo in English, even if the transcript is in another language."""
+    elif part:
+        part_instruction = f"""
+- This is part {part[0]} of {part[1]} of a longer transcript. Cover only what is said in this part."""
+
+    return f"""
 You are an enterprise meeting assistant.
 
 Step 1: Identify meeting type.
@@ -173,84 +264,347 @@ Rules:
 - Preserve exact numbers and commitments verbatim (prices, dates, headcount, utilization, SLA, etc.).
 - If something is not discussed, leave arrays empty ([]) rather than adding filler.
 - Keep it concise and actionable.
-- Action items should only include explicit commitments or clearly assigned next steps.{agenda_instruction}
+- Action items should only include explicit commitments or clearly assigned next steps.{part_instruction}{agenda_instruction}
 
 Transcript:
 \"\"\"{transcript}\"\"\"
 """.strip()
 
-    # --- Attempt structured JSON output ---
-    try:
-        logger.debug("Attempting structured JSON summarization")
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are precise and structured."},
-                {"role": "user", "content": prompt_text},
-            ],
-            temperature=0.2,
-            max_tokens=900,
-            response_format={"type": "json_object"},
-        )
 
-        content = (resp.choices[0].message.content or "").strip()
-        data = json.loads(content) if content else {}
+def _request_memo(prompt_text: str, max_tokens: int = 900) -> dict:
+    """Run a JSON-mode memo request and parse the result."""
+    content = llm.chat(
+        "summarization",
+        messages=[
+            {"role": "system", "content": "You are precise and structured."},
+            {"role": "user", "content": prompt_text},
+        ],
+        temperature=0.2,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+        cache=True,  # a client retry should not pay for the same memo twice
+    ).text
+    return json.loads(content) if content else {}
+
+
+def _action_items_to_strings(action_items_raw: list) -> list[str]:
+    """Normalize action items to list[str] for UI."""
+    action_items: list[str] = []
+
+    for ai in action_items_raw:
+        if isinstance(ai, str):
+            s = ai.strip()
+            if s:
+                action_items.append(s)
+        elif isinstance(ai, dict):
+            item = (ai.get("item") or "").strip()
+            owner = (ai.get("owner") or "Unassigned").strip()
+            due = (ai.get("due") or "Not stated").strip()
+            if item:
+                action_items.append(f"{item} — {owner} (Due: {due})")
 
-        summary_text = _render_memo_to_text(data)
+    return action_items
 
-        # Normalize action items to list[str] for UI
-        action_items_raw = data.get("action_items") or []
-        action_items: list[str] = []
-        
-        for ai in action_items_raw:
+
+# ----------------------------
+# Map-reduce summarization
+# ----------------------------
+
+_LIST_FIELDS = ("summary_bullets", "key_topics", "decisions", "risks_blockers", "open_questions")
+_UNSET_VALUES = {"", "unassigned", "not stated", "none", "n/a", "tbd"}
+
+
+def _dedupe_key(value) -> str:
+    """Case/punctuation-insensitive key used to spot duplicate entries."""
+    return re.sub(r"[\W_]+", " ", str(value).lower()).strip()
+
+
+def _merge_unique(values: list) -> list:
+    """Keep the first occurrence of each entry, in order."""
+    seen = set()
+    merged = []
+    for value in values:
+        if not isinstance(value, str):
+            value = str(value)
+        key = _dedupe_key(value)
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(value.strip())
+    return merged
+
+
+def merge_memos(memos: list[dict]) -> dict:
+    """
+    Merge partial memos into one, deterministically and without an LLM.
+
+    List fields are concatenated in order and deduplicated ignoring case
+    and punctuation. Duplicate action items are merged, keeping the first
+    real owner/due value. Note sections with the same heading are merged.
+    The meeting type is the most common one (earliest wins ties).
+
+    Args:
+        memos: Partial memos following the summarize_and_extract_actions schema
+
+    Returns:
+        Merged memo with the same schema
+    """
+    memos = [m for m in memos if isinstance(m, dict)]
+    merged: dict = {}
+
+    types = [(m.get("meeting_type") or "").strip() for m in memos]
+    types = [t for t in types if t]
+    if types:
+        counts = Counter(types)
+        merged["meeting_type"] = max(types, key=lambda t: (counts[t], -types.index(t)))
+    else:
+        merged["meeting_type"] = "other"
+
+    titles = [(m.get("title") or "").strip() for m in memos]
+    merged["title"] = next((t for t in titles if t), "Meeting Notes")
+
+    for field in _LIST_FIELDS:
+        merged[field] = _merge_unique(
+            [v for m in memos for v in (m.get(field) or []) if v]
+        )
+
+    actions: dict[str, dict] = {}
+    for m in memos:
+        for ai in m.get("action_items") or []:
             if isinstance(ai, str):
-                s = ai.strip()
-                if s:
-                    action_items.append(s)
-            elif isinstance(ai, dict):
-                item = (ai.get("item") or "").strip()
-                owner = (ai.get("owner") or "Unassigned").strip()
-                due = (ai.get("due") or "Not stated").strip()
-                if item:
-                    action_items.append(f"{item} — {owner} (Due: {due})")
+                ai = {"item": ai}
+            if not isinstance(ai, dict):
+                continue
+            item = (ai.get("item") or "").strip()
+            key = _dedupe_key(item)
+            if not key:
+                continue
+            existing = actions.setdefault(
+                key, {"item": item, "owner": "Unassigned", "due": "Not stated"}
+            )
+            for field in ("owner", "due"):
+                value = (ai.get(field) or "").strip()
+                if value and _dedupe_key(existing[field]) in _UNSET_VALUES \
+                        and _dedupe_key(value) not in _UNSET_VALUES:
+                    existing[field] = value
+    merged["action_items"] = list(actions.values())
+
+    sections: dict[str, dict] = {}
+    for m in memos:
+        for sec in m.get("notes_by_section") or []:
+            if not isinstance(sec, dict):
+                continue
+            heading = (sec.get("heading") or "").strip()
+            target = sections.setdefault(_dedupe_key(heading), {"heading": heading, "bullets": []})
+            target["bullets"] = _merge_unique(target["bullets"] + list(sec.get("bullets") or []))
+    merged["notes_by_section"] = list(sections.values())
 
-        logger.info("Structured summarization succeeded, %d action items extracted", len(action_items))
-        return summary_text, action_items, data
+    return merged
 
-    except json.JSONDecodeError as e:
-        logger.warning("JSON parsing failed in structured summarization: %s", e)
-    except Exception as e:
-        logger.warning("Structured summarization failed (will use fallback): %s", e)
 
-    # --- Fallback: plain text (always works) ---
-    logger.debug("Using fallback plain text summarization")
-    fallback_prompt = f"""
-Summarize the transcript in 5-10 bullet points (high signal, no fluff).
-Then list action items as '-' bullets in the format: "Action — Owner (Due: ...)".
-If none, write: None.
+def _reduce_overview(merged: dict, agenda: str = "") -> dict:
+    """
+    Ask the model to condense the merged memo's title/type/summary/topics.
 
-Transcript:
-\"\"\"{transcript}\"\"\"
+    Only the small merged memo is sent, never the transcript. Decisions
+    and action items stay exactly as merged locally.
+    """
+    agenda_line = f"\nMeeting agenda:\n{agenda}\n" if agenda.strip() else ""
+    prompt_text = f"""
+You are an enterprise meeting assistant. Below are notes merged from consecutive parts of ONE meeting.
+Rewrite the overview as JSON using EXACTLY this schema:
+
+{{
+  "meeting_type": "one of: recruiting, interview, sales, customer_discovery, planning, status_update, standup, technical_review, support, 1on1, other",
+  "title": "Short descriptive title (max 10 words)",
+  "summary_bullets": ["3-8 bullets, high signal, covering the whole meeting"],
+  "key_topics": ["3-10 short topic phrases"]
+}}
+
+Rules:
+- Use ONLY the notes below. Do NOT infer.
+- Preserve exact numbers and commitments verbatim.
+{agenda_line}
+Notes:
+{json.dumps({k: merged.get(k) for k in ("meeting_type", "title", "summary_bullets", "key_topics", "decisions")}, ensure_ascii=False)}
 """.strip()
 
+    return _request_memo(prompt_text, max_tokens=600)
+
+
+def _summarize_map_reduce(transcript: str, agenda: str = "") -> dict:
+    """
+    Summarize a long transcript window by window, then merge.
+
+    Windows that fail are summarized once more; the memo is only built
+    when every window is covered.
+
+    Raises:
+        RuntimeError: If a window still fails on retry
+    """
+    windows = [w for w in split_text(transcript, SUMMARY_WINDOW_TOKENS) if w.strip()]
+    total = len(windows)
+    logger.info("Map-reduce summarization over %d windows", total)
+
+    def summarize_window(index: int, window: str):
+        try:
+            return _request_memo(_build_memo_prompt(window, agenda, part=(index + 1, total)))
+        except Exception as e:
+            logger.warning("Summarizing window %d/%d failed: %s", index + 1, total, e)
+            return None
+
+    with ThreadPoolExecutor(
+        max_workers=min(SUMMARY_MAX_WORKERS, total),
+        thread_name_prefix="summarize",
+    ) as pool:
+        partials = list(pool.map(summarize_window, range(total), windows))
+
+    for index, partial in enumerate(partials):
+        if partial is None:
+            logger.info("Retrying summary of window %d/%d", index + 1, total)
+            try:
+                partials[index] = _request_memo(
+                    _build_memo_prompt(windows[index], agenda, part=(index + 1, total))
+                )
+            except Exception as e:
+                raise RuntimeError(f"Summarizing window {index + 1}/{total} failed: {e}") from e
+
+    return _merge_with_overview(partials, agenda)
+
+
+def _merge_with_overview(partials: list[dict], agenda: str = "") -> dict:
+    """Merge partial memos locally, then condense the overview in one short call."""
+    merged = merge_memos(partials)
+
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": fallback_prompt}],
-            temperature=0.2,
-            max_tokens=900,
-        )
-        text = (resp.choices[0].message.content or "").strip()
-        
-        # Extract action items (lines starting with "- ")
-        action_items = [
-            ln[2:].strip() for ln in text.splitlines()
-            if ln.strip().startswith("- ")
-        ]
-        
-        logger.info("Fallback summarization succeeded, %d action items extracted", len(action_items))
-        return text, action_items, {}
-        
+        overview = _reduce_overview(merged, agenda)
+        for field in ("meeting_type", "title"):
+            if isinstance(overview.get(field), str) and overview[field].strip():
+                merged[field] = overview[field].strip()
+        for field in ("summary_bullets", "key_topics"):
+            if isinstance(overview.get(field), list) and overview[field]:
+                merged[field] = _merge_unique(overview[field])
     except Exception as e:
-        logger.exception("Fallback summarization also failed: %s", e)
-        return "", [], {}
+        logger.warning("Reduce step failed, keeping locally merged memo: %s", e)
+        merged["summary_bullets"] = merged["summary_bullets"][:8]
+        merged["key_topics"] = merged["key_topics"][:10]
+
+    return merged
+
+
+_rolling_executor = None
+_rolling_executor_lock = threading.Lock()
+
+
+def _get_rolling_executor() -> ThreadPoolExecutor:
+    global _rolling_executor
+    with _rolling_executor_lock:
+        if _rolling_executor is None:
+            _rolling_executor = ThreadPoolExecutor(
+                max_workers=SUMMARY_MAX_WORKERS,
+                thread_name_prefix="rolling-summary",
+            )
+        return _rolling_executor
+
+
+class RollingSummary:
+    """
+    Running memo for a transcript that grows over time (live meetings).
+
+    Text is added in transcript order. Every ~window_tokens it is cut into
+    a window and summarized in the background into a partial memo; memo()
+    merges what is done so far and finalize() produces the final result.
+    """
+
+    def __init__(self, agenda: str = "", window_tokens: int = None):
+        self.agenda = agenda
+        self.window_tokens = window_tokens or LIVE_SUMMARY_WINDOW_TOKENS
+        self._pending = ""
+        self._windows = []
+        self._futures = []  # in window order, parallel to _windows
+        self._lock = threading.Lock()
+
+    @property
+    def windows_summarized(self) -> int:
+        with self._lock:
+            return sum(1 for future in self._futures if future.done())
+
+    def add(self, text: str) -> None:
+        """Append transcript text, summarizing every window it completes."""
+        if not text:
+            return
+        with self._lock:
+            self._pending += text
+            if estimate_tokens(self._pending) < self.window_tokens:
+                return
+            windows = split_text(self._pending, self.window_tokens)
+            # The last window may still grow; keep it pending
+            self._pending = windows.pop()
+            for window in windows:
+                self._submit(window)
+
+    def _submit(self, window: str) -> None:
+        # Caller holds self._lock
+        index = len(self._futures) + 1
+        self._windows.append(window)
+        self._futures.append(_get_rolling_executor().submit(self._summarize_window, window, index))
+
+    def _summarize_window(self, window: str, index: int):
+        try:
+            return self._request_window(window, index)
+        except Exception as e:
+            logger.warning("Rolling summary of window %d failed: %s", index, e)
+            return None
+
+    def _request_window(self, window: str, index: int) -> dict:
+        return _request_memo(_build_memo_prompt(window, self.agenda, part=(index, None)))
+
+    def memo(self) -> dict:
+        """Partial memo merged from the windows summarized so far."""
+        with self._lock:
+            done = [future.result() for future in self._futures if future.done()]
+        partials = [p for p in done if p]
+        return merge_memos(partials) if partials else {}
+
+    def finalize(self, agenda: str = None) -> tuple[str, list[str], dict]:
+        """
+        Summarize the remaining text and merge everything into the final memo.
+
+        Windows whose background summary failed are summarized again here,
+        so the memo never silently leaves out part of the meeting.
+
+        Returns:
+            Same as summarize_and_extract_actions:
+            (summary_text, action_items_list, memo_json_dict)
+
+        Raises:
+            RuntimeError: If there is nothing to summarize or a window
+                still fails on retry
+        """
+        agenda = self.agenda if agenda is None else agenda
+        with self._lock:
+            if self._pending.strip():
+                self._submit(self._pending)
+            self._pending = ""
+            windows = list(zip(self._windows, self._futures))
+
+        if not windows:
+            raise RuntimeError("No transcript to summarize")
+
+        partials = []
+        for index, (window, future) in enumerate(windows, start=1):
+            partial = future.result()
+            if partial is None:
+                logger.info("Retrying rolling summary of window %d", index)
+                try:
+                    partial = self._request_window(window, index)
+                except Exception as e:
+                    raise RuntimeError(f"Rolling summary of window {index} failed: {e}") from e
+            partials.append(partial)
+
+        data = partials[0] if len(partials) == 1 else _merge_with_overview(partials, agenda)
+        logger.info("Rolling summary finalized from %d windows", len(partials))
+        return (
+            _render_memo_to_text(data),
+            _action_items_to_strings(data.get("action_items") or []),
+            data,
+        )
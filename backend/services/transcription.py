@@ -3,56 +3,373 @@ Transcription service using OpenAI Whisper.
 
 Handles audio file transcription for all supported audio formats.
 Decision: Whisper only (Phase 3: can add Deepgram/AssemblyAI support).
+
+Long recordings (over the Whisper upload limit or the chunk length) are
+split at silence boundaries into overlapping segments with ffmpeg and
+transcribed in parallel, then stitched back together. Each segment is
+prompted with the words just before its cut, taken from a quick first
+pass over those few seconds, so the segments never wait on each other.
+
+Results are cached by the SHA-256 of the audio, so re-uploading the
+same recording never calls Whisper twice.
 """
 
 import logging
-from openai import OpenAI
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import (
+    WHISPER_MODEL,
+    WHISPER_MAX_UPLOAD_BYTES,
+    TRANSCRIPTION_CHUNK_SECONDS,
+    TRANSCRIPTION_CHUNK_OVERLAP_SECONDS,
+    TRANSCRIPTION_MAX_WORKERS,
+    SILENCE_THRESHOLD_DB,
+    SILENCE_MIN_SECONDS,
+    TRANSCRIPTION_PROMPT_TAIL_SECONDS,
+    FFPROBE_TIMEOUT_SECONDS,
+    FFMPEG_TIMEOUT_SECONDS,
+    TRANSCRIPT_CACHE_PATH,
+    TRANSCRIPT_CACHE_TTL_SECONDS,
+    TRANSCRIPT_CACHE_MAX_ENTRIES,
+    TRANSCRIPT_CACHE_MAX_BYTES,
+)
+from . import llm
+from .cache import SQLiteCache
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI()  # reads OPENAI_API_KEY from environment
+# audio digest -> {"transcript": ..., "language": ...}
+transcript_cache = SQLiteCache(
+    TRANSCRIPT_CACHE_PATH,
+    ttl_seconds=TRANSCRIPT_CACHE_TTL_SECONDS,
+    max_entries=TRANSCRIPT_CACHE_MAX_ENTRIES,
+    max_bytes=TRANSCRIPT_CACHE_MAX_BYTES,
+)
+
+# Characters of the previous segment passed as the Whisper prompt
+PROMPT_TAIL_CHARS = 200
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
 
 
-def transcribe_audio_file(file_path: str) -> tuple[str, str]:
+def transcribe_audio_file(
+    file_path: str,
+    chunked: bool = None,
+    audio_digest: str = None,
+) -> tuple[str, str]:
     """
     Transcribe audio file using OpenAI Whisper.
-    
+
     Args:
         file_path: Path to audio file (supports mp3, mp4, mpeg, mpga, m4a, wav, webm)
-    
+        chunked: Force (True) or disable (False) chunked mode; None decides
+            from file size and duration
+        audio_digest: SHA-256 hex digest of the file; enables the transcript cache
+
     Returns:
         Tuple of (transcript_text, detected_language_code)
-        
+
     Raises:
         FileNotFoundError: If audio file doesn't exist
         Exception: On API or file read errors
     """
-    logger.info("Transcribing file: %s", file_path)
-    
+    cache_key = f"{WHISPER_MODEL}:{audio_digest}" if audio_digest else None
+    if cache_key:
+        cached = transcript_cache.get(cache_key)
+        if cached:
+            logger.info("Transcript cache hit for %s (%s)", file_path, audio_digest[:12])
+            return cached["transcript"], cached["language"]
+
+    if chunked is None:
+        chunked = _should_chunk(file_path)
+
+    if chunked and _ffmpeg_available():
+        transcript, detected_language_code = _transcribe_chunked(file_path)
+    else:
+        if chunked:
+            logger.warning("ffmpeg/ffprobe not found; transcribing %s in a single request", file_path)
+
+        logger.info("Transcribing file: %s", file_path)
+        transcript, detected_language_code = _transcribe_single(file_path)
+
+        logger.info(
+            "Successfully transcribed %s (%s) - %d characters",
+            file_path,
+            detected_language_code,
+            len(transcript)
+        )
+
+    if cache_key and transcript.strip():
+        transcript_cache.set(
+            cache_key, {"transcript": transcript, "language": detected_language_code}
+        )
+
+    return transcript, detected_language_code
+
+
+def transcribe_segment(file_path: str, prompt: str = None) -> tuple[str, str]:
+    """
+    Transcribe one short, self-contained audio segment (e.g. a slice of a
+    live recording) in a single request.
+
+    Args:
+        file_path: Path to the audio segment
+        prompt: Optional preceding text to keep wording consistent
+
+    Returns:
+        Tuple of (transcript_text, detected_language_code)
+    """
+    return _transcribe_single(file_path, prompt)
+
+
+def _transcribe_single(file_path: str, prompt: str = None) -> tuple[str, str]:
+    """Send one audio file to Whisper; returns (text, language_code)."""
+    params = {
+        "language": None,  # Auto-detect language
+    }
+    if prompt:
+        params["prompt"] = prompt
+
     try:
-        with open(file_path, "rb") as f:
-            result = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=f,
-                language=None,  # Auto-detect language
-            )
+        result = llm.transcribe(file_path, model=WHISPER_MODEL, **params)
     except FileNotFoundError:
         logger.error("Audio file not found: %s", file_path)
         raise
     except Exception as e:
         logger.exception("Transcription API error: %s", e)
         raise
-    
+
     transcript = result.text or ""
     # Whisper returns language code (e.g., 'en', 'es', 'fr')
     detected_language_code = getattr(result, 'language', 'en') or 'en'
-    
+    return transcript, detected_language_code
+
+
+# ----------------------------
+# Chunked mode
+# ----------------------------
+
+
+def _ffmpeg_available() -> bool:
+    return bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
+
+
+def _should_chunk(file_path: str) -> bool:
+    """Decide whether a file needs chunked transcription."""
+    try:
+        if os.path.getsize(file_path) > WHISPER_MAX_UPLOAD_BYTES:
+            return True
+    except OSError:
+        return False
+
+    if not _ffmpeg_available():
+        return False
+    duration = probe_duration(file_path)
+    return bool(duration and duration > TRANSCRIPTION_CHUNK_SECONDS * 1.5)
+
+
+def audio_duration(file_path: str):
+    """Duration of an audio file in seconds, or None without ffprobe."""
+    if not shutil.which("ffprobe"):
+        return None
+    return probe_duration(file_path)
+
+
+def probe_duration(file_path: str):
+    """Return audio duration in seconds via ffprobe, or None if unknown."""
+    try:
+        out = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                file_path,
+            ],
+            capture_output=True, text=True, check=True, timeout=FFPROBE_TIMEOUT_SECONDS,
+        ).stdout.strip()
+        return float(out)
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        logger.warning("Could not probe duration of %s: %s", file_path, e)
+        return None
+
+
+def _detect_silences(file_path: str) -> list[tuple[float, float]]:
+    """
+    Return (start, end) silence intervals found by ffmpeg silencedetect.
+
+    If ffmpeg times out, no silences are returned (segments are then cut
+    at the target length).
+    """
+    try:
+        proc = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-nostats", "-i", file_path,
+                "-af", f"silencedetect=noise={SILENCE_THRESHOLD_DB}dB:d={SILENCE_MIN_SECONDS}",
+                "-f", "null", "-",
+            ],
+            capture_output=True, text=True, timeout=FFMPEG_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("Silence detection timed out for %s; using hard cuts", file_path)
+        return []
+    silences = []
+    start = None
+    for line in proc.stderr.splitlines():
+        m = _SILENCE_START_RE.search(line)
+        if m:
+            start = max(0.0, float(m.group(1)))
+            continue
+        m = _SILENCE_END_RE.search(line)
+        if m and start is not None:
+            silences.append((start, float(m.group(1))))
+            start = None
+    return silences
+
+
+def plan_segments(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_seconds: float = TRANSCRIPTION_CHUNK_SECONDS,
+    overlap_seconds: float = TRANSCRIPTION_CHUNK_OVERLAP_SECONDS,
+) -> list[tuple[float, float]]:
+    """
+    Choose segment boundaries for a recording.
+
+    Each cut is placed at the middle of the latest silence between 60% and
+    100% of the target length (or a hard cut at the target if there is no
+    silence). Every segment after the first starts `overlap_seconds`
+    before its cut so words at the boundary are heard twice.
+
+    Returns:
+        List of (start, end) times in seconds
+    """
+    if duration <= 0:
+        return []
+
+    midpoints = sorted((s + e) / 2 for s, e in silences)
+    cuts = []
+    position = 0.0
+    while duration - position > target_seconds:
+        window_start = position + target_seconds * 0.6
+        window_end = position + target_seconds
+        candidates = [m for m in midpoints if window_start <= m <= window_end]
+        cut = candidates[-1] if candidates else window_end
+        cuts.append(cut)
+        position = cut
+
+    segments = []
+    start = 0.0
+    for cut in cuts + [duration]:
+        segments.append((max(0.0, start - overlap_seconds) if segments else 0.0, cut))
+        start = cut
+    return segments
+
+
+def _extract_segment(file_path: str, start: float, end: float, out_path: str) -> None:
+    """Cut [start, end) from the source into a small mono mp3."""
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+            "-i", file_path,
+            "-vn", "-ac", "1", "-ar", "16000", "-b:a", "64k",
+            out_path,
+        ],
+        capture_output=True, check=True, timeout=FFMPEG_TIMEOUT_SECONDS,
+    )
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def stitch_transcripts(texts: list[str], max_overlap_words: int = 40) -> str:
+    """
+    Join segment transcripts, dropping words repeated across an overlap.
+
+    For each boundary, the longest run (>= 2 words) at the end of the text
+    so far that matches the start of the next segment, ignoring case and
+    punctuation, is removed from the next segment.
+    """
+    words: list[str] = []
+    for text in texts:
+        next_words = (text or "").split()
+        if not next_words:
+            continue
+        limit = min(max_overlap_words, len(words), len(next_words))
+        tail = [_normalize_word(w) for w in words[-limit:]] if limit else []
+        head = [_normalize_word(w) for w in next_words[:limit]]
+        for size in range(limit, 1, -1):
+            if tail[-size:] == head[:size]:
+                next_words = next_words[size:]
+                break
+        words.extend(next_words)
+    return " ".join(words)
+
+
+def _transcribe_chunked(file_path: str) -> tuple[str, str]:
+    """Split a long recording and transcribe the segments concurrently."""
+    duration = probe_duration(file_path)
+    if not duration:
+        logger.warning("Unknown duration for %s; transcribing in a single request", file_path)
+        return _transcribe_single(file_path)
+
+    segments = plan_segments(duration, _detect_silences(file_path))
+    logger.info(
+        "Transcribing %s in %d segments (%.0fs, %d workers)",
+        file_path, len(segments), duration, TRANSCRIPTION_MAX_WORKERS,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="transcribe_") as tmp_dir:
+
+        def tail_prompt(index: int):
+            # Words spoken just before this segment's cut
+            start, end = segments[index]
+            tail_path = os.path.join(tmp_dir, f"tail_{index:04d}.mp3")
+            try:
+                _extract_segment(file_path, max(start, end - TRANSCRIPTION_PROMPT_TAIL_SECONDS), end, tail_path)
+                text, _ = _transcribe_single(tail_path)
+            except Exception as e:
+                logger.warning("No continuity prompt after segment %d: %s", index, e)
+                return None
+            return text[-PROMPT_TAIL_CHARS:] or None
+
+        def work(index: int, start: float, end: float, prompt: str = None) -> tuple[str, str]:
+            segment_path = os.path.join(tmp_dir, f"segment_{index:04d}.mp3")
+            _extract_segment(file_path, start, end, segment_path)
+            return _transcribe_single(segment_path, prompt=prompt)
+
+        with ThreadPoolExecutor(
+            max_workers=TRANSCRIPTION_MAX_WORKERS,
+            thread_name_prefix="transcribe",
+        ) as pool:
+            # First pass: transcribe the tail of every segment but the last,
+            # so each segment's prompt is ready before any segment starts
+            prompts = [None] * len(segments)
+            if TRANSCRIPTION_PROMPT_TAIL_SECONDS > 0:
+                prompts[1:] = pool.map(tail_prompt, range(len(segments) - 1))
+            futures = [
+                pool.submit(work, index, start, end, prompts[index])
+                for index, (start, end) in enumerate(segments)
+            ]
+            results = [future.result() for future in futures]
+
+    transcript = stitch_transcripts([text for text, _ in results])
+    languages = Counter(code for text, code in results if text.strip())
+    detected_language_code = languages.most_common(1)[0][0] if languages else "en"
+
     logger.info(
-        "Successfully transcribed %s (%s) - %d characters",
+        "Successfully transcribed %s in %d segments (%s) - %d characters",
         file_path,
+        len(segments),
         detected_language_code,
         len(transcript)
     )
-    
     return transcript, detected_language_code
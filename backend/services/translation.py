@@ -2,18 +2,28 @@
 Language detection and translation service.
 
 Detects language of transcripts and translates to English if needed.
-Uses GPT-4o-mini for language detection and translation.
+Language is identified offline (langid) when confident, falling back to
+GPT-4o-mini; translation uses GPT-4o-mini.
+
+Long texts are split into token-budgeted segments on speaker/sentence
+boundaries and translated concurrently, so output is never truncated by
+a single call's max_tokens and latency stays close to one round trip.
 """
 
 import json
 import logging
 import re
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
 
-logger = logging.getLogger(__name__)
+from ..config import (
+    TRANSLATION_SEGMENT_TOKENS,
+    TRANSLATION_MAX_WORKERS,
+    LANGID_CONFIDENCE_THRESHOLD,
+)
+from . import llm, langid
+from .chunking import estimate_tokens, split_text, trailing_whitespace
 
-# Initialize OpenAI client
-client = OpenAI()  # reads OPENAI_API_KEY from environment
+logger = logging.getLogger(__name__)
 
 # ISO 639-1 language codes for common languages
 LANGUAGE_CODES = {
@@ -39,6 +49,9 @@ LANGUAGE_CODES = {
     'da': 'Danish',
 }
 
+# Per-call output cap for gpt-4o-mini translations
+MAX_OUTPUT_TOKENS = 4096
+
 
 def _contains_cjk(text: str) -> bool:
     """Return True if text contains CJK characters."""
@@ -81,17 +94,15 @@ Text to analyze:
 """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        response_text = llm.chat(
+            "detection",
             messages=[
                 {"role": "user", "content": detection_prompt}
             ],
             temperature=0.0,
             max_tokens=200,
             response_format={"type": "json_object"},
-        )
-        
-        response_text = (response.choices[0].message.content or "").strip()
+        ).text
         result = json.loads(response_text)
         
         logger.info(
@@ -133,25 +144,17 @@ def translate_to_english(text: str, source_language: str) -> str:
         logger.warning("Empty text provided for translation")
         return ""
     
-    translation_prompt = f"""Translate the following {source_language} text to English. 
+    def build_prompt(segment: str) -> str:
+        return f"""Translate the following {source_language} text to English. 
 Provide ONLY the English translation, word-for-word and complete, with no explanations or comments.
 
 {source_language} text:
-\"\"\"{text}\"\"\"
+\"\"\"{segment}\"\"\"
 
 English translation:"""
-    
+
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "user", "content": translation_prompt}
-            ],
-            temperature=0.0,
-            max_tokens=4096,  # Max allowed for full transcript
-        )
-        
-        translated_text = (response.choices[0].message.content or "").strip()
+        translated_text = _translate_segmented(text, build_prompt)
         
         if translated_text:
             logger.info(
@@ -170,7 +173,11 @@ English translation:"""
         raise
 
 
-def detect_and_translate_if_needed(text: str, source_language: str = "") -> tuple[str, str, bool]:
+def detect_and_translate_if_needed(
+    text: str,
+    source_language: str = "",
+    on_language_detected=None,
+) -> tuple[str, str, bool]:
     """
     Detect language and translate to English if needed.
 
@@ -179,6 +186,8 @@ def detect_and_translate_if_needed(text: str, source_language: str = "") -> tupl
     Args:
         text: Text to process (transcript or summary)
         source_language: Optional hint about source language (Whisper code or name)
+        on_language_detected: Optional callback(language_name, needs_translation)
+            invoked once the language is known, before any translation starts
 
     Returns:
         Tuple of (processed_text, detected_language_name, was_translated)
@@ -207,31 +216,36 @@ def detect_and_translate_if_needed(text: str, source_language: str = "") -> tupl
                 language_name = None
             elif language_name and language_name.lower() == "english":
                 logger.info("Source language hint indicates English, no translation needed")
+                _notify(on_language_detected, language_name, False)
                 return text, language_name, False
 
             if language_name:
                 logger.info("Source language hint: %s, translating to English", language_name)
+                _notify(on_language_detected, language_name, True)
                 translated_text = translate_to_english(text, language_name)
                 return translated_text, language_name, True
 
     try:
-        # Detect language
-        detection_result = detect_language(text)
+        # Detect language, offline first
+        detection_result = _identify_offline(text) or detect_language(text)
         language_name = detection_result.get("detected_language", "Unknown")
         is_english = detection_result.get("is_english", False)
 
         # If detection failed, avoid translating to "Unknown"
         if language_name.lower() == "unknown":
             logger.warning("Language detection returned Unknown; skipping translation")
+            _notify(on_language_detected, "Unknown", False)
             return text, "Unknown", False
 
         # If already English, return as-is
         if is_english:
             logger.info("Text is already in English, no translation needed")
+            _notify(on_language_detected, language_name, False)
             return text, language_name, False
 
         # For non-English, translate to English
         logger.info("Text is in %s, translating to English", language_name)
+        _notify(on_language_detected, language_name, True)
         translated_text = translate_to_english(text, language_name)
 
         return translated_text, language_name, True
@@ -243,6 +257,38 @@ def detect_and_translate_if_needed(text: str, source_language: str = "") -> tupl
         return text, "Unknown", False
 
 
+def _identify_offline(text: str):
+    """
+    Identify the language locally; None when not confident enough, in
+    which case the caller falls back to the LLM detector.
+    """
+    guess = langid.identify(text)
+    language_name = LANGUAGE_CODES.get(guess.code)
+    if not language_name or guess.confidence < LANGID_CONFIDENCE_THRESHOLD:
+        logger.info(
+            "Offline language ID inconclusive (%s, confidence %.2f); asking the LLM",
+            guess.code, guess.confidence,
+        )
+        return None
+
+    logger.info("Detected language offline: %s (confidence %.2f)", language_name, guess.confidence)
+    return {
+        'detected_language': language_name,
+        'language_code': guess.code,
+        'is_english': guess.code == 'en',
+    }
+
+
+def _notify(callback, language_name: str, needs_translation: bool) -> None:
+    """Invoke an on_language_detected callback, never letting it break translation."""
+    if callback is None:
+        return
+    try:
+        callback(language_name, needs_translation)
+    except Exception as e:
+        logger.warning("Language detection callback failed: %s", e)
+
+
 def translate_text(text: str, target_language: str) -> str:
     """
     Translate text to a specific target language.
@@ -263,20 +309,192 @@ def translate_text(text: str, target_language: str) -> str:
     if not target_language or target_language.lower() == "unknown":
         return text
     
-    prompt = f"""Translate the following text to {target_language}. 
+    def build_prompt(segment: str) -> str:
+        return f"""Translate the following text to {target_language}. 
 Only provide the translated text, nothing else.
 
 Text:
-{text}"""
+{segment}"""
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.0,
-            max_tokens=4096,
-        )
-        return response.choices[0].message.content.strip()
+        return _translate_segmented(text, build_prompt)
     except Exception as e:
         logger.exception("Translation error: %s", e)
         raise
+
+
+def _translate_segment(segment: str, build_prompt) -> str:
+    """
+    Translate one segment, re-splitting it if the output hit max_tokens.
+    """
+    segment_tokens = estimate_tokens(segment)
+    translated, finish_reason = llm.chat(
+        "translation",
+        messages=[{"role": "user", "content": build_prompt(segment.strip())}],
+        temperature=0.0,
+        max_tokens=min(MAX_OUTPUT_TOKENS, segment_tokens * 3 + 256),
+    )
+
+    if finish_reason == "length":
+        parts = split_text(segment, max(1, segment_tokens // 2))
+        if len(parts) > 1:
+            logger.warning(
+                "Translation of %d-token segment was truncated; retrying in %d parts",
+                segment_tokens,
+                len(parts),
+            )
+            return _join_segments(parts, [_translate_segment(p, build_prompt) for p in parts])
+        logger.warning("Translation of %d-token segment was truncated", segment_tokens)
+
+    return translated
+
+
+def _join_segments(originals: list[str], translated: list[str]) -> str:
+    """Reassemble translated segments in order, keeping the original separators."""
+    parts = []
+    for original, text in zip(originals, translated):
+        parts.append(text.strip())
+        parts.append(trailing_whitespace(original) or " ")
+    return "".join(parts).strip()
+
+
+def _translate_segmented(text: str, build_prompt) -> str:
+    """
+    Translate text segment by segment with bounded parallelism.
+
+    Args:
+        text: Text to translate
+        build_prompt: Callable mapping a segment to its translation prompt
+
+    Returns:
+        Translated text, segments joined in original order
+    """
+    segments = [seg for seg in split_text(text, TRANSLATION_SEGMENT_TOKENS) if seg.strip()]
+    if len(segments) <= 1:
+        return _translate_segment(text, build_prompt)
+
+    logger.info("Translating %d segments concurrently", len(segments))
+    with ThreadPoolExecutor(
+        max_workers=min(TRANSLATION_MAX_WORKERS, len(segments)),
+        thread_name_prefix="translate",
+    ) as pool:
+        translated = list(pool.map(lambda seg: _translate_segment(seg, build_prompt), segments))
+    return _join_segments(segments, translated)
+
+
+def translate_summary_and_actions(
+    summary: str,
+    action_items: list[str],
+    target_language: str,
+) -> tuple[str, list[str]]:
+    """
+    Translate a summary and its action items to a target language.
+
+    Short inputs go out as one structured call returning
+    {"summary": ..., "action_items": [...]}, so items keep their
+    one-to-one mapping without splitting text on newlines. Long
+    summaries, or a malformed structured reply, fall back to translating
+    the summary and the item list concurrently.
+
+    Args:
+        summary: Summary text (English)
+        action_items: Action items (English)
+        target_language: Target language name (e.g., 'Spanish')
+
+    Returns:
+        Tuple of (translated_summary, translated_action_items); any part
+        that fails to translate is returned unchanged
+    """
+    action_items = list(action_items or [])
+    if not target_language or target_language.lower() in ("unknown", "english"):
+        return summary, action_items
+
+    if estimate_tokens(summary or "") <= TRANSLATION_SEGMENT_TOKENS:
+        try:
+            result = _translate_structured(summary, action_items, target_language)
+            if result is not None:
+                return result
+            logger.warning("Structured translation reply was malformed; translating parts separately")
+        except Exception as e:
+            logger.warning("Structured translation to %s failed: %s", target_language, e)
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="translate") as pool:
+        summary_future = pool.submit(translate_text, summary, target_language)
+        items_future = pool.submit(_translate_items, action_items, target_language)
+
+        try:
+            translated_summary = summary_future.result() or summary
+        except Exception as e:
+            logger.warning("Could not translate summary to %s: %s", target_language, e)
+            translated_summary = summary
+
+        try:
+            translated_items = items_future.result()
+        except Exception as e:
+            logger.warning("Could not translate action items to %s: %s", target_language, e)
+            translated_items = action_items
+
+    return translated_summary, translated_items
+
+
+def _translate_structured(summary: str, action_items: list[str], target_language: str):
+    """One JSON-mode call for summary + items; None if the reply doesn't fit."""
+    payload = json.dumps({"summary": summary or "", "action_items": action_items}, ensure_ascii=False)
+    prompt = f"""Translate the values of this JSON object to {target_language}. Keep the structure and meaning intact.
+Respond with ONLY a JSON object with the same keys: "summary" (string) and "action_items" (array with exactly {len(action_items)} strings, in the same order).
+
+{payload}"""
+
+    text, finish_reason = llm.chat(
+        "translation",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.0,
+        max_tokens=MAX_OUTPUT_TOKENS,
+        response_format={"type": "json_object"},
+    )
+    if finish_reason == "length":
+        return None
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+    translated_summary = data.get("summary") if isinstance(data, dict) else None
+    translated_items = data.get("action_items") if isinstance(data, dict) else None
+    if not isinstance(translated_summary, str) or not isinstance(translated_items, list):
+        return None
+    if len(translated_items) != len(action_items):
+        return None
+    return (
+        translated_summary.strip() or summary,
+        [str(item).strip() for item in translated_items],
+    )
+
+
+def _translate_items(action_items: list[str], target_language: str) -> list[str]:
+    """Translate a list of strings as a JSON array, keeping order and count."""
+    if not action_items:
+        return []
+
+    prompt = f"""Translate each string in this JSON array to {target_language}. Keep the structure and meaning intact.
+Respond with ONLY a JSON object: {{"items": [exactly {len(action_items)} translated strings, in the same order]}}
+
+{json.dumps(action_items, ensure_ascii=False)}"""
+
+    text, _ = llm.chat(
+        "translation",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.0,
+        max_tokens=MAX_OUTPUT_TOKENS,
+        response_format={"type": "json_object"},
+    )
+    items = json.loads(text).get("items")
+    if not isinstance(items, list) or len(items) != len(action_items):
+        logger.warning(
+            "Action item translation returned %s items for %d",
+            len(items) if isinstance(items, list) else "no",
+            len(action_items),
+        )
+        return action_items
+    return [str(item).strip() for item in items]
+
@@ -0,0 +1,42 @@
+"""meeting listing indexes
+
+Revision ID: c41d2e7a9b10
+Revises: 0b37d8ad60b5
+Create Date: 2026-10-16 10:12:40.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d2e7a9b10'
+down_revision: Union[str, Sequence[str], None] = '0b37d8ad60b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meetings', sa.Column('meeting_type', sa.String(length=50), nullable=True))
+    op.execute(
+        """
+        UPDATE meetings
+        SET meeting_type = json_extract(memo_json, '$.meeting_type')
+        WHERE meeting_type IS NULL AND memo_json IS NOT NULL
+        """
+    )
+    op.create_index('ix_meetings_user_created', 'meetings', ['user_id', 'created_at', 'id'])
+    op.create_index(
+        'ix_meetings_user_type_created', 'meetings', ['user_id', 'meeting_type', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_meetings_user_type_created', table_name='meetings')
+    op.drop_index('ix_meetings_user_created', table_name='meetings')
+    with op.batch_alter_table('meetings') as batch_op:
+        batch_op.drop_column('meeting_type')
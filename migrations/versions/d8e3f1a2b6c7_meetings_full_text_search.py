@@ -0,0 +1,88 @@
+"""meetings full text search
+
+Revision ID: d8e3f1a2b6c7
+Revises: c41d2e7a9b10
+Create Date: 2026-10-16 11:02:15.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e3f1a2b6c7'
+down_revision: Union[str, Sequence[str], None] = 'c41d2e7a9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXED_VALUES = """
+    json_extract({row}.memo_json, '$.title'),
+    coalesce({row}.summary_english, '') || char(10) || coalesce({row}.summary_original, ''),
+    coalesce((SELECT group_concat(value, char(10)) FROM json_each({row}.action_items_english)), '')
+        || char(10)
+        || coalesce((SELECT group_concat(value, char(10)) FROM json_each({row}.action_items_original)), ''),
+    coalesce({row}.transcript_english, '')
+        || CASE WHEN {row}.was_translated THEN char(10) || coalesce({row}.transcript_original, '') ELSE '' END
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+            meeting_id UNINDEXED,
+            user_id UNINDEXED,
+            title,
+            summary,
+            action_items,
+            transcript,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+            INSERT INTO meetings_fts (rowid, meeting_id, user_id, title, summary, action_items, transcript)
+            VALUES (new.rowid, new.id, new.user_id, {_INDEXED_VALUES.format(row='new')});
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+            DELETE FROM meetings_fts WHERE rowid = old.rowid;
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE OF
+            user_id, memo_json, summary_english, summary_original, action_items_english,
+            action_items_original, transcript_english, transcript_original, was_translated
+        ON meetings BEGIN
+            DELETE FROM meetings_fts WHERE rowid = old.rowid;
+            INSERT INTO meetings_fts (rowid, meeting_id, user_id, title, summary, action_items, transcript)
+            VALUES (new.rowid, new.id, new.user_id, {_INDEXED_VALUES.format(row='new')});
+        END
+        """
+    )
+    # Index meetings saved before this revision
+    op.execute(
+        f"""
+        INSERT INTO meetings_fts (rowid, meeting_id, user_id, title, summary, action_items, transcript)
+        SELECT meetings.rowid, meetings.id, meetings.user_id, {_INDEXED_VALUES.format(row='meetings')}
+        FROM meetings
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS meetings_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS meetings_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS meetings_fts_insert")
+    op.execute("DROP TABLE IF EXISTS meetings_fts")
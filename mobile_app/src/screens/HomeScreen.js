@@ -129,6 +129,122 @@ const TRANSLATE_LANGUAGES = [
     "Yoruba"
 ];
 
+const JOB_POLL_INTERVAL_MS = 1500;
+const JOB_POLL_TIMEOUT_MS = 15000;
+
+// Each status poll gets its own timeout; the job itself may run for minutes.
+const fetchJobStatus = async (url, signal) => {
+    const controller = new AbortController();
+    const cancel = () => controller.abort();
+    signal?.addEventListener("abort", cancel);
+    const timeout = setTimeout(cancel, JOB_POLL_TIMEOUT_MS);
+    try {
+        const response = await fetch(url, { signal: controller.signal });
+        const job = await response.json();
+        return { response, job };
+    } catch (error) {
+        if (error?.name === "AbortError" && !signal?.aborted) {
+            throw new Error("Transcription service stopped responding.");
+        }
+        throw error;
+    } finally {
+        clearTimeout(timeout);
+        signal?.removeEventListener("abort", cancel);
+    }
+};
+
+const waitForJob = async (apiBaseUrl, statusUrl, signal) => {
+    while (true) {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        if (signal?.aborted) {
+            const error = new Error("Transcription cancelled.");
+            error.name = "AbortError";
+            throw error;
+        }
+        const { response, job } = await fetchJobStatus(`${apiBaseUrl}${statusUrl}`, signal);
+        if (!response.ok) {
+            throw new Error(job?.error || "Transcription failed.");
+        }
+        if (job.status === "succeeded") {
+            return job.result || {};
+        }
+        if (job.status === "failed") {
+            throw new Error(job.error || "Transcription failed.");
+        }
+    }
+};
+
+// Label shown while each pipeline stage event streamed by the server is current
+const JOB_STAGE_LABELS = {
+    uploaded: "Transcribing meeting…",
+    transcribed: "Detecting language…",
+    language_detected: "Translating transcript…",
+    translated: "Summarizing…",
+    summarized: "Finalizing…",
+    back_translated: "Saving…",
+    saved: "Saving…"
+};
+
+// Follow a job's Server-Sent Events stream. React Native has no EventSource,
+// so the stream is read incrementally from an XHR. Resolves with the result;
+// rejects with jobFailed set when the job itself failed, so callers can fall
+// back to polling on any other (connection) error.
+const followJobEvents = (url, signal, onEvent) =>
+    new Promise((resolve, reject) => {
+        const xhr = new XMLHttpRequest();
+        let offset = 0;
+        let settled = false;
+        const settle = (fn, value) => {
+            if (settled) return;
+            settled = true;
+            signal?.removeEventListener("abort", cancel);
+            xhr.abort();
+            fn(value);
+        };
+        const cancel = () => {
+            const error = new Error("Transcription cancelled.");
+            error.name = "AbortError";
+            settle(reject, error);
+        };
+        const handleBlock = (block) => {
+            let event = "message";
+            const dataLines = [];
+            block.split("\n").forEach((line) => {
+                if (line.startsWith("event:")) event = line.slice(6).trim();
+                else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+            });
+            if (!dataLines.length) return;
+            const data = JSON.parse(dataLines.join("\n"));
+            if (event === "done") {
+                settle(resolve, data.result || {});
+            } else if (event === "failed") {
+                const error = new Error(data.error || "Transcription failed.");
+                error.jobFailed = true;
+                settle(reject, error);
+            } else {
+                onEvent?.(event, data);
+            }
+        };
+        xhr.onprogress = () => {
+            const text = xhr.responseText;
+            let end = text.indexOf("\n\n", offset);
+            while (end !== -1) {
+                handleBlock(text.slice(offset, end));
+                offset = end + 2;
+                end = text.indexOf("\n\n", offset);
+            }
+        };
+        xhr.onload = () => {
+            xhr.onprogress();
+            settle(reject, new Error("Progress stream ended early."));
+        };
+        xhr.onerror = () => settle(reject, new Error("Progress stream unavailable."));
+        signal?.addEventListener("abort", cancel);
+        xhr.open("GET", url);
+        xhr.setRequestHeader("Accept", "text/event-stream");
+        xhr.send();
+    });
+
 export default function HomeScreen({
     onStartRecording,
     onUploadRecording,
@@ -168,6 +284,7 @@ export default function HomeScreen({
     const [transcriptText, setTranscriptText] = useState("");
     const [transcriptLanguage, setTranscriptLanguage] = useState("");
     const [transcriptError, setTranscriptError] = useState("");
+    const [transcriptStage, setTranscriptStage] = useState("");
     const [showTranslateDropdown, setShowTranslateDropdown] = useState(false);
     const [translateError, setTranslateError] = useState("");
     const [isTranslating, setIsTranslating] = useState(false);
@@ -372,6 +489,7 @@ export default function HomeScreen({
         setTranscriptError("");
         setTranscriptText("");
         setTranscriptLanguage("");
+        setTranscriptStage("");
         transcribeRecording(selectedLibraryItem);
     };
 
@@ -722,11 +840,35 @@ export default function HomeScreen({
                 body: formData,
                 signal: controller.signal
             });
-            const payload = await response.json();
+            const queued = await response.json();
             if (!response.ok) {
-                const message = payload?.error || "Transcription failed.";
+                const message = queued?.error || "Transcription failed.";
                 throw new Error(message);
             }
+            // The 30 s limit covers the upload only; polls time out individually
+            clearTimeout(transcriptTimeoutRef.current);
+            transcriptTimeoutRef.current = null;
+            // Stage events show progress and early results; poll if the stream is unavailable
+            const handleJobEvent = (stage, data) => {
+                setTranscriptStage(JOB_STAGE_LABELS[stage] || "");
+                if (stage === "transcribed" && data?.transcript) {
+                    setTranscriptText(data.transcript);
+                } else if (stage === "language_detected" && data?.original_language) {
+                    setTranscriptLanguage(data.original_language);
+                }
+            };
+            const payload = queued.events_url
+                ? await followJobEvents(
+                    `${apiBaseUrl}${queued.events_url}`,
+                    controller.signal,
+                    handleJobEvent
+                ).catch((error) => {
+                    if (error?.name === "AbortError" || error?.jobFailed) {
+                        throw error;
+                    }
+                    return waitForJob(apiBaseUrl, queued.status_url, controller.signal);
+                })
+                : await waitForJob(apiBaseUrl, queued.status_url, controller.signal);
             transcriptValue = payload?.transcript || "";
             languageValue = payload?.original_language || "";
             const createdAt = new Date().toISOString();
@@ -1637,6 +1779,7 @@ export default function HomeScreen({
                         onBack={handleTranscriptProgressClose}
                         title="Transcribing"
                         steps={["Transcribing meeting"]}
+                        helperText={transcriptStage || undefined}
                         cancelLabel="Cancel"
                     />
                 </View>
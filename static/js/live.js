@@ -59,6 +59,34 @@ autoQAToggle.addEventListener("click", () => {
     autoQAToggle.textContent = autoQAPanelCollapsed ? "▶ Meeting Q&A" : "▼ Meeting Q&A";
 });
 
+async function openLiveSession() {
+    try {
+        const response = await fetch("/api/live/sessions", {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+            },
+            // Agenda guides the memo the server builds while recording
+            body: JSON.stringify({ agenda: currentAgenda }),
+        });
+        if (!response.ok) {
+            console.warn("Could not open live session:", response.status);
+            return null;
+        }
+        return await response.json();
+    } catch (err) {
+        console.error("Live session error:", err);
+        return null;
+    }
+}
+
+function closeLiveSession() {
+    if (!liveSession) return;
+    fetch(`/api/live/sessions/${liveSession.session_id}`, { method: "DELETE" })
+        .catch((err) => console.warn("Could not close live session:", err));
+    liveSession = null;
+}
+
 async function detectAndAnswerQuestions() {
     const newTranscript = currentLiveTranscript.substring(lastProcessedTranscriptLength);
 
@@ -68,21 +96,29 @@ async function detectAndAnswerQuestions() {
         return;
     }
 
-    console.log("Auto-detect: Processing", newTranscript.trim().length, "chars of new transcript");
+    if (!liveSession) {
+        liveSession = await openLiveSession();
+        if (!liveSession) return;
+    }
+
+    console.log("Auto-detect: Sending", newTranscript.trim().length, "chars of new transcript");
     lastProcessedTranscriptLength = currentLiveTranscript.length;
 
     try {
-        const response = await fetch("/detect_questions", {
+        // Only the delta is sent; the server keeps the transcript context
+        const response = await fetch(liveSession.append_url, {
             method: "POST",
             headers: {
                 "Content-Type": "application/json",
             },
-            body: JSON.stringify({
-                new_transcript: newTranscript,
-                full_transcript: currentLiveTranscript,
-            }),
+            body: JSON.stringify({ text: newTranscript }),
         });
 
+        if (response.status === 404) {
+            // Session expired; start a new one on the next tick
+            liveSession = null;
+            return;
+        }
         if (!response.ok) {
             console.warn("Question detection failed:", response.status);
             return;
@@ -91,7 +127,7 @@ async function detectAndAnswerQuestions() {
         const data = await response.json();
         const questions = data.questions || [];
 
-        console.log("Auto-detect: Found", questions.length, "questions");
+        console.log("Auto-detect: Found", questions.length, "new questions");
 
         for (const q of questions) {
             // Check if we already have this question
@@ -117,157 +153,318 @@ async function detectAndAnswerQuestions() {
     }
 }
 
-// Start a new recording
-recordBtn.addEventListener("click", async () => {
-    resetUI();
-    currentLiveTranscript = ""; // Reset live transcript for coach
-
-    if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
-        showError("Live recording is not supported in this browser.");
-        return;
-    }
-
-    try {
-        recordingStream = await navigator.mediaDevices.getUserMedia({ audio: true });
-
-        recordedChunks = [];
-        mediaRecorder = new MediaRecorder(recordingStream);
-
-        mediaRecorder.ondataavailable = (event) => {
-            if (event.data && event.data.size > 0) {
-                recordedChunks.push(event.data);
-            }
+// Start live transcription for coach
+function startLiveRecognition() {
+    const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+    if (SpeechRecognition) {
+        const liveRecognition = new SpeechRecognition();
+        liveRecognition.continuous = true;
+        liveRecognition.interimResults = true;
+        liveRecognition.lang = "en-US";
+
+        liveRecognition.onstart = () => {
+            console.log("Live transcription started");
         };
 
-        mediaRecorder.onstart = () => {
-            setLiveStatus("Recording…");
-            setLiveButtonsState({ canRecord: false, canPause: true, canStop: true });
-
-            // Reset auto-detection state
-            detectedQuestions = [];
-            lastProcessedTranscriptLength = 0;
-            autoQAPanelCollapsed = false;
-            updateAutoQADisplay();
-
-            // Start auto-detection interval (every 8 seconds)
-            if (appSettings.auto_detect_qa !== false) {
-                autoDetectionInterval = setInterval(() => {
-                    detectAndAnswerQuestions();
-                }, 8000);
+        liveRecognition.onresult = (event) => {
+            let interimTranscript = "";
+            for (let i = event.resultIndex; i < event.results.length; i++) {
+                const transcript = event.results[i][0].transcript;
+                if (event.results[i].isFinal) {
+                    currentLiveTranscript += transcript + " ";
+                    console.log("Live transcript updated:", currentLiveTranscript.length, "chars");
+                } else {
+                    interimTranscript += transcript;
+                }
             }
+        };
 
-            // Start live transcription for coach
-            const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
-            if (SpeechRecognition) {
-                const liveRecognition = new SpeechRecognition();
-                liveRecognition.continuous = true;
-                liveRecognition.interimResults = true;
-                liveRecognition.lang = "en-US";
-
-                liveRecognition.onstart = () => {
-                    console.log("Live transcription started");
-                };
-
-                liveRecognition.onresult = (event) => {
-                    let interimTranscript = "";
-                    for (let i = event.resultIndex; i < event.results.length; i++) {
-                        const transcript = event.results[i][0].transcript;
-                        if (event.results[i].isFinal) {
-                            currentLiveTranscript += transcript + " ";
-                            console.log("Live transcript updated:", currentLiveTranscript.length, "chars");
-                        } else {
-                            interimTranscript += transcript;
-                        }
-                    }
-                };
-
-                liveRecognition.onerror = (event) => {
-                    // Silently handle errors for live transcription
-                    console.warn("Live transcription error:", event.error);
-                    // Try to restart on errors like "network" or "no-speech"
-                    if (event.error === "network" || event.error === "no-speech") {
-                        console.log("Attempting to restart live recognition...");
-                        try {
-                            setTimeout(() => {
-                                if (mediaRecorder && mediaRecorder.state !== "inactive") {
-                                    liveRecognition.start();
-                                }
-                            }, 1000);
-                        } catch (e) {
-                            console.warn("Could not restart:", e);
-                        }
-                    }
-                };
-
-                liveRecognition.onend = () => {
-                    console.log("Live transcription ended");
-                    // Restart if recording is still active
-                    if (mediaRecorder && mediaRecorder.state !== "inactive") {
-                        console.log("Restarting live transcription...");
-                        try {
+        liveRecognition.onerror = (event) => {
+            // Silently handle errors for live transcription
+            console.warn("Live transcription error:", event.error);
+            // Try to restart on errors like "network" or "no-speech"
+            if (event.error === "network" || event.error === "no-speech") {
+                console.log("Attempting to restart live recognition...");
+                try {
+                    setTimeout(() => {
+                        if (mediaRecorder && mediaRecorder.state !== "inactive") {
                             liveRecognition.start();
-                        } catch (e) {
-                            console.warn("Could not restart live recognition:", e);
                         }
-                    }
-                };
+                    }, 1000);
+                } catch (e) {
+                    console.warn("Could not restart:", e);
+                }
+            }
+        };
 
+        liveRecognition.onend = () => {
+            console.log("Live transcription ended");
+            // Restart if recording is still active
+            if (mediaRecorder && mediaRecorder.state !== "inactive") {
+                console.log("Restarting live transcription...");
                 try {
                     liveRecognition.start();
-                    mediaRecorder.liveRecognition = liveRecognition; // Store reference to stop later
-                } catch (err) {
-                    console.error("Error starting live recognition:", err);
+                } catch (e) {
+                    console.warn("Could not restart live recognition:", e);
                 }
-            } else {
-                console.warn("Speech Recognition not supported");
             }
         };
 
-        mediaRecorder.onpause = () => {
-            setLiveStatus("Recording paused.");
-        };
+        try {
+            liveRecognition.start();
+            activeLiveRecognition = liveRecognition; // Store reference to stop later
+        } catch (err) {
+            console.error("Error starting live recognition:", err);
+        }
+    } else {
+        console.warn("Speech Recognition not supported");
+    }
+}
 
-        mediaRecorder.onresume = () => {
-            setLiveStatus("Recording…");
-        };
+function stopLiveRecognition() {
+    if (activeLiveRecognition) {
+        activeLiveRecognition.stop();
+        activeLiveRecognition = null;
+    }
+}
 
-        mediaRecorder.onstop = async () => {
-            setLiveStatus("Processing recording…");
-            setLiveButtonsState({ canRecord: true, canPause: false, canStop: false });
+// Create a recorder on the shared stream. Each recorder produces one
+// self-contained audio file, so segments can be transcribed on their own.
+function createSegmentRecorder() {
+    const recorder = new MediaRecorder(recordingStream);
+    const chunks = [];
+    const seq = liveSegmentSeq++;
 
-            // Stop auto-detection
-            if (autoDetectionInterval) {
-                clearInterval(autoDetectionInterval);
-                autoDetectionInterval = null;
-            }
+    recorder.ondataavailable = (event) => {
+        if (event.data && event.data.size > 0) {
+            chunks.push(event.data);
+        }
+    };
+
+    recorder.onpause = () => {
+        setLiveStatus("Recording paused.");
+    };
+
+    recorder.onresume = () => {
+        setLiveStatus("Recording…");
+    };
+
+    recorder.onstop = () => {
+        const blob = new Blob(chunks, { type: "audio/webm" });
+        if (recorder === mediaRecorder) {
+            finishRecording(blob, seq);
+        } else {
+            trackSegmentUpload(blob, seq);
+        }
+    };
 
-            if (recordingStream) {
-                recordingStream.getTracks().forEach((track) => track.stop());
-                recordingStream = null;
-            }
+    return recorder;
+}
 
-            // Stop live transcription
-            if (mediaRecorder.liveRecognition) {
-                mediaRecorder.liveRecognition.stop();
-                mediaRecorder.liveRecognition = null;
-            }
+// Record the whole take in one file as well. Segment files each carry
+// their own webm header and can't be joined, so this is what gets
+// uploaded when there is no session or a segment upload failed.
+function startFullRecorder() {
+    recordedChunks = [];
+    fullRecorder = new MediaRecorder(recordingStream);
+    fullRecordingStopped = new Promise((resolve) => {
+        fullRecorder.onstop = resolve;
+    });
+    fullRecorder.ondataavailable = (event) => {
+        if (event.data && event.data.size > 0) {
+            recordedChunks.push(event.data);
+        }
+    };
+    fullRecorder.start();
+}
 
-            if (!recordedChunks.length) {
-                showError("No audio was recorded.");
-                setLiveStatus("");
-                return;
-            }
+function stopFullRecorder() {
+    if (fullRecorder && fullRecorder.state !== "inactive") {
+        fullRecorder.stop();
+    }
+}
 
-            const blob = new Blob(recordedChunks, { type: "audio/webm" });
-            const file = new File([blob], "live_recording.webm", { type: "audio/webm" });
+function hasAudioSession() {
+    return Boolean(liveSession && liveSession.session_id === liveAudioSessionId);
+}
 
-            const formData = new FormData();
-            formData.append("audio_file", file);
+// Start the next segment, then close the current one (no gap in audio)
+function rotateSegment() {
+    if (!hasAudioSession() || !mediaRecorder || mediaRecorder.state !== "recording") return;
 
-            await processFormData(formData, "Uploading recording…", "Transcribing recording…");
-            setLiveStatus("Recording processed.");
-        };
+    const previous = mediaRecorder;
+    mediaRecorder = createSegmentRecorder();
+    mediaRecorder.start();
+    previous.stop();
+}
+
+function trackSegmentUpload(blob, seq) {
+    const upload = uploadLiveSegment(blob, seq).then((ok) => {
+        if (!ok) failedSegments.push({ blob, seq });
+        return ok;
+    });
+    pendingSegmentUploads.add(upload);
+    upload.finally(() => pendingSegmentUploads.delete(upload));
+}
+
+// Resolves to true once the segment is accepted (or there was nothing to send)
+async function uploadLiveSegment(blob, seq) {
+    if (!blob.size) return true;
+    if (!liveAudioSessionId) return false;
+
+    const formData = new FormData();
+    formData.append("audio_file", new File([blob], `segment_${seq}.webm`, { type: "audio/webm" }));
+    formData.append("seq", seq);
+
+    try {
+        const response = await fetch(`/api/live/sessions/${liveAudioSessionId}/audio`, {
+            method: "POST",
+            body: formData,
+        });
+        if (!response.ok) {
+            console.warn("Audio segment upload failed:", response.status);
+        }
+        return response.ok;
+    } catch (err) {
+        console.error("Audio segment upload error:", err);
+        return false;
+    }
+}
+
+// Wait for in-flight segment uploads and retry failed ones once.
+// Returns false if any segment still did not reach the server.
+async function flushSegmentUploads() {
+    await Promise.allSettled([...pendingSegmentUploads]);
+
+    const retries = failedSegments;
+    failedSegments = [];
+    for (const { blob, seq } of retries) {
+        if (!(await uploadLiveSegment(blob, seq))) {
+            return false;
+        }
+    }
+    return true;
+}
+
+function onRecordingStarted() {
+    setLiveStatus("Recording…");
+    setLiveButtonsState({ canRecord: false, canPause: true, canStop: true });
+
+    // Reset auto-detection state
+    detectedQuestions = [];
+    lastProcessedTranscriptLength = 0;
+    autoQAPanelCollapsed = false;
+    updateAutoQADisplay();
+
+    // Start auto-detection interval (every 8 seconds)
+    if (appSettings.auto_detect_qa !== false) {
+        autoDetectionInterval = setInterval(() => {
+            detectAndAnswerQuestions();
+        }, 8000);
+    }
+
+    // Stream audio to the server in segments so it is transcribed while recording
+    if (hasAudioSession()) {
+        liveSegmentTimer = setInterval(rotateSegment, LIVE_SEGMENT_MS);
+    }
+
+    startLiveRecognition();
+}
+
+async function finishRecording(finalBlob, seq) {
+    setLiveStatus("Processing recording…");
+    setLiveButtonsState({ canRecord: true, canPause: false, canStop: false });
+
+    // Stop auto-detection and segment rotation
+    if (autoDetectionInterval) {
+        clearInterval(autoDetectionInterval);
+        autoDetectionInterval = null;
+    }
+    if (liveSegmentTimer) {
+        clearInterval(liveSegmentTimer);
+        liveSegmentTimer = null;
+    }
+
+    if (recordingStream) {
+        recordingStream.getTracks().forEach((track) => track.stop());
+        recordingStream = null;
+    }
+
+    stopLiveRecognition();
+
+    // The whole-take recorder was stopped alongside this one; wait for its last data
+    stopFullRecorder();
+    if (fullRecordingStopped) {
+        await fullRecordingStopped;
+    }
+
+    if (!recordedChunks.length) {
+        closeLiveSession();
+        showError("No audio was recorded.");
+        setLiveStatus("");
+        return;
+    }
+
+    const formData = new FormData();
+    let processUrl = "/api/process";
+    const wholeTake = () => {
+        const blob = new Blob(recordedChunks, { type: "audio/webm" });
+        return new File([blob], "live_recording.webm", { type: "audio/webm" });
+    };
+
+    // Earlier segments must all be on the server before the session stops
+    const segmentsUploaded = hasAudioSession() && await flushSegmentUploads();
+
+    if (segmentsUploaded) {
+        // Earlier segments are already transcribed; send only the last one
+        if (finalBlob.size) {
+            formData.append("audio_file", new File([finalBlob], `segment_${seq}.webm`, { type: "audio/webm" }));
+            formData.append("seq", seq);
+        }
+        processUrl = `/api/live/sessions/${liveAudioSessionId}/stop`;
+        liveSession = null; // The server closes the session once stopped
+    } else {
+        // No session, or a segment is missing: process the whole recording instead
+        closeLiveSession();
+        formData.append("audio_file", wholeTake());
+    }
+    liveAudioSessionId = null;
+
+    let processed = await processFormData(formData, "Uploading recording…", "Transcribing recording…", processUrl);
+    if (!processed && segmentsUploaded) {
+        // The server could not finish from the segments (e.g. one failed to transcribe)
+        const retryData = new FormData();
+        retryData.append("audio_file", wholeTake());
+        processed = await processFormData(retryData, "Uploading full recording…", "Transcribing recording…");
+    }
+    setLiveStatus(processed ? "Recording processed." : "");
+}
+
+// Start a new recording
+recordBtn.addEventListener("click", async () => {
+    resetUI();
+    currentLiveTranscript = ""; // Reset live transcript for coach
+
+    if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
+        showError("Live recording is not supported in this browser.");
+        return;
+    }
+
+    try {
+        recordingStream = await navigator.mediaDevices.getUserMedia({ audio: true });
+
+        liveSegmentSeq = 0;
+        pendingSegmentUploads = new Set();
+        failedSegments = [];
+
+        // Without a session, the whole recording is uploaded on stop
+        closeLiveSession();
+        liveSession = await openLiveSession();
+        liveAudioSessionId = liveSession ? liveSession.session_id : null;
 
+        startFullRecorder();
+        mediaRecorder = createSegmentRecorder();
+        mediaRecorder.onstart = onRecordingStarted;
         mediaRecorder.start();
     } catch (err) {
         console.error("Error starting recording:", err);
@@ -282,9 +479,11 @@ pauseBtn.addEventListener("click", () => {
 
     if (mediaRecorder.state === "recording") {
         mediaRecorder.pause();
+        if (fullRecorder && fullRecorder.state === "recording") fullRecorder.pause();
         pauseBtn.textContent = "▶ Resume";
     } else if (mediaRecorder.state === "paused") {
         mediaRecorder.resume();
+        if (fullRecorder && fullRecorder.state === "paused") fullRecorder.resume();
         pauseBtn.textContent = "⏸ Pause";
     }
 });
@@ -294,6 +493,7 @@ stopBtn.addEventListener("click", () => {
     if (!mediaRecorder) return;
 
     if (mediaRecorder.state === "recording" || mediaRecorder.state === "paused") {
+        stopFullRecorder();
         mediaRecorder.stop();
         pauseBtn.textContent = "⏸ Pause";
     }
@@ -18,7 +18,19 @@ uploadForm.addEventListener("submit", async (event) => {
 
 // ---- Process FormData (shared by upload + live recording) ----
 
-async function processFormData(formData, initialLabel = "Processing…", transcribingLabel = "Transcribing…") {
+// Progress shown for each pipeline stage event streamed by the server
+const STAGE_PROGRESS = {
+    uploaded: [10, "Transcribing audio…"],
+    transcribed: [35, "Detecting language…"],
+    language_detected: [40, "Translating transcript…"],
+    translated: [55, "Summarizing…"],
+    summarized: [80, "Finalizing…"],
+    back_translated: [90, "Saving…"],
+    saved: [95, "Saving…"],
+};
+
+// Resolves to true once results are shown, false if processing failed
+async function processFormData(formData, initialLabel = "Processing…", transcribingLabel = "Transcribing…", url = "/api/process") {
     try {
         setProcessingState(true);
         clearError();
@@ -30,7 +42,7 @@ async function processFormData(formData, initialLabel = "Processing…", transcr
             formData.append("agenda", currentAgenda);
         }
 
-        const response = await fetch("/process", {
+        const response = await fetch(url, {
             method: "POST",
             body: formData,
         });
@@ -44,125 +56,173 @@ async function processFormData(formData, initialLabel = "Processing…", transcr
             }
             setProgress(0, "Error");
             showError(message);
-            return;
+            return false;
         }
 
-        setProgress(60, transcribingLabel);
-
-        const data = parsed;
-
-        if (!data) {
+        if (!parsed || !parsed.events_url) {
             setProgress(0, "Error");
             showError("Unexpected server response. Please try again.");
-            return;
+            return false;
         }
 
+        setProgress(10, transcribingLabel);
+
+        const data = await followJobEvents(parsed.events_url);
+
         setProgress(100, "Done");
         progressSection.style.display = "block";
 
-        if (data.error) {
-            showError(data.error);
-            return;
-        }
+        renderResults(data);
+        return true;
 
-        // Store the meeting data
-        currentMeetingData.originalLanguage = data.original_language || "English";
-        currentMeetingData.originalSummary = data.summary || "(No summary returned)";
-        currentMeetingData.originalTranscript = data.transcript || "(No transcript)";
-        currentMeetingData.englishSummary = data.english_summary || data.summary || "(No summary returned)";
-        currentMeetingData.englishTranscript = data.english_transcript || data.transcript || "(No transcript)";
-        currentMeetingData.actionItems = data.action_items || [];
-        currentMeetingData.englishActionItems = data.english_action_items || data.action_items || [];
-        currentMeetingData.currentDisplayLanguage = currentMeetingData.originalLanguage;
-        updateCurrentLanguageLabel(currentMeetingData.currentDisplayLanguage);
-
-        // Update results
-        resultsSection.style.display = "block";
+    } catch (err) {
+        console.error("Request failed:", err);
+        setProgress(0, "Error");
+        showError(err.message || "Network or server error.");
+        return false;
+    } finally {
+        setProcessingState(false);
+    }
+}
 
-        // Display language information if available
-        if (data.original_language) {
-            languageInfo.style.display = "block";
-            languageText.textContent = `🌐 Meeting language: ${data.original_language}`;
-        } else {
-            languageInfo.style.display = "none";
-        }
+// Follow the server's stage events until the job finishes; resolves with the result
+function followJobEvents(eventsUrl) {
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(eventsUrl);
 
-        // Always enable translation controls so English meetings can be translated too
-        setTranslationEnabled(true);
-
-        // Display content based on settings
-        const summaryPref = (appSettings.summary_language || "auto").toLowerCase();
-        const transcriptPref = (appSettings.default_language || "auto").toLowerCase();
-
-        summaryText.textContent =
-            summaryPref === "english" && currentMeetingData.englishSummary
-                ? currentMeetingData.englishSummary
-                : currentMeetingData.originalSummary;
-
-        transcriptText.textContent =
-            transcriptPref === "english" && currentMeetingData.englishTranscript
-                ? currentMeetingData.englishTranscript
-                : currentMeetingData.originalTranscript;
-
-        actionItemsList.innerHTML = "";
-        const actionItemsToShow =
-            summaryPref === "english" && Array.isArray(currentMeetingData.englishActionItems)
-                ? currentMeetingData.englishActionItems
-                : currentMeetingData.actionItems;
-
-        if (Array.isArray(actionItemsToShow) && actionItemsToShow.length > 0) {
-            actionItemsToShow.forEach((item) => {
-                const li = document.createElement("li");
-                li.textContent = item;
-                actionItemsList.appendChild(li);
+        Object.keys(STAGE_PROGRESS).forEach((stage) => {
+            source.addEventListener(stage, (event) => {
+                const [percent, label] = STAGE_PROGRESS[stage];
+                setProgress(percent, label);
+                renderPartialResults(stage, JSON.parse(event.data));
             });
-        } else {
+        });
+
+        source.addEventListener("done", (event) => {
+            source.close();
+            resolve(JSON.parse(event.data).result || {});
+        });
+
+        source.addEventListener("failed", (event) => {
+            source.close();
+            reject(new Error(JSON.parse(event.data).error || "Processing failed."));
+        });
+
+        source.onerror = () => {
+            // EventSource reconnects on its own (resuming after Last-Event-ID);
+            // only give up once the browser has closed the stream for good.
+            if (source.readyState === EventSource.CLOSED) {
+                reject(new Error("Lost connection to the server."));
+            }
+        };
+    });
+}
+
+// Show results as soon as individual stages produce them
+function renderPartialResults(stage, payload) {
+    if (stage === "transcribed" && payload.transcript) {
+        resultsSection.style.display = "block";
+        transcriptText.textContent = payload.transcript;
+    } else if (stage === "language_detected" && payload.original_language) {
+        languageInfo.style.display = "block";
+        languageText.textContent = `🌐 Meeting language: ${payload.original_language}`;
+    } else if (stage === "summarized" && payload.english_summary) {
+        resultsSection.style.display = "block";
+        summaryText.textContent = payload.english_summary;
+    }
+}
+
+function renderResults(data) {
+    // Store the meeting data
+    currentMeetingData.originalLanguage = data.original_language || "English";
+    currentMeetingData.originalSummary = data.summary || "(No summary returned)";
+    currentMeetingData.originalTranscript = data.transcript || "(No transcript)";
+    currentMeetingData.englishSummary = data.english_summary || data.summary || "(No summary returned)";
+    currentMeetingData.englishTranscript = data.english_transcript || data.transcript || "(No transcript)";
+    currentMeetingData.actionItems = data.action_items || [];
+    currentMeetingData.englishActionItems = data.english_action_items || data.action_items || [];
+    currentMeetingData.currentDisplayLanguage = currentMeetingData.originalLanguage;
+    updateCurrentLanguageLabel(currentMeetingData.currentDisplayLanguage);
+
+    // Update results
+    resultsSection.style.display = "block";
+
+    // Display language information if available
+    if (data.original_language) {
+        languageInfo.style.display = "block";
+        languageText.textContent = `🌐 Meeting language: ${data.original_language}`;
+    } else {
+        languageInfo.style.display = "none";
+    }
+
+    // Always enable translation controls so English meetings can be translated too
+    setTranslationEnabled(true);
+
+    // Display content based on settings
+    const summaryPref = (appSettings.summary_language || "auto").toLowerCase();
+    const transcriptPref = (appSettings.default_language || "auto").toLowerCase();
+
+    summaryText.textContent =
+        summaryPref === "english" && currentMeetingData.englishSummary
+            ? currentMeetingData.englishSummary
+            : currentMeetingData.originalSummary;
+
+    transcriptText.textContent =
+        transcriptPref === "english" && currentMeetingData.englishTranscript
+            ? currentMeetingData.englishTranscript
+            : currentMeetingData.originalTranscript;
+
+    actionItemsList.innerHTML = "";
+    const actionItemsToShow =
+        summaryPref === "english" && Array.isArray(currentMeetingData.englishActionItems)
+            ? currentMeetingData.englishActionItems
+            : currentMeetingData.actionItems;
+
+    if (Array.isArray(actionItemsToShow) && actionItemsToShow.length > 0) {
+        actionItemsToShow.forEach((item) => {
             const li = document.createElement("li");
-            li.textContent = "(No action items found)";
+            li.textContent = item;
             actionItemsList.appendChild(li);
-        }
+        });
+    } else {
+        const li = document.createElement("li");
+        li.textContent = "(No action items found)";
+        actionItemsList.appendChild(li);
+    }
 
-        if (data.transcript_file) {
-            transcriptFileInfo.textContent = `Transcript saved as: ${data.transcript_file}`;
-        } else {
-            transcriptFileInfo.textContent = "";
-        }
+    if (data.transcript_file) {
+        transcriptFileInfo.textContent = `Transcript saved as: ${data.transcript_file}`;
+    } else {
+        transcriptFileInfo.textContent = "";
+    }
 
-        // ---- NEW: Post-processing buttons (Download PDF + Discard) ----
-        if (postActions && downloadPdfBtn && discardBtn && data.download_url && data.discard_url) {
-            postActions.style.display = "block";
-
-            // Download PDF
-            downloadPdfBtn.href = data.download_url;
-
-            // Discard results
-            discardBtn.onclick = async () => {
-                const ok = confirm("Discard transcript/summary/action items for this meeting? This cannot be undone.");
-                if (!ok) return;
-
-                try {
-                    const resp = await fetch(data.discard_url, { method: "POST" });
-                    if (!resp.ok) {
-                        alert("Discard failed.");
-                        return;
-                    }
-                    resetUI();
-                    alert("Discarded.");
-                } catch (e) {
-                    console.error(e);
-                    alert("Discard failed (network error).");
-                }
-            };
-        } else if (postActions) {
-            postActions.style.display = "none";
-        }
+    // ---- NEW: Post-processing buttons (Download PDF + Discard) ----
+    if (postActions && downloadPdfBtn && discardBtn && data.download_url && data.discard_url) {
+        postActions.style.display = "block";
 
-    } catch (err) {
-        console.error("Request failed:", err);
-        setProgress(0, "Error");
-        showError(err.message || "Network or server error.");
-    } finally {
-        setProcessingState(false);
+        // Download PDF
+        downloadPdfBtn.href = data.download_url;
+
+        // Discard results
+        discardBtn.onclick = async () => {
+            const ok = confirm("Discard transcript/summary/action items for this meeting? This cannot be undone.");
+            if (!ok) return;
+
+            try {
+                const resp = await fetch(data.discard_url, { method: "POST" });
+                if (!resp.ok) {
+                    alert("Discard failed.");
+                    return;
+                }
+                resetUI();
+                alert("Discarded.");
+            } catch (e) {
+                console.error(e);
+                alert("Discard failed (network error).");
+            }
+        };
+    } else if (postActions) {
+        postActions.style.display = "none";
     }
 }
 
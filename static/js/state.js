@@ -92,7 +92,9 @@ let appSettings = {
 
 // Live recording via MediaRecorder
 let mediaRecorder = null;
-let recordedChunks = [];
+let recordedChunks = []; // Whole recording from fullRecorder (one valid webm file)
+let fullRecorder = null;
+let fullRecordingStopped = null; // Resolves once fullRecorder has flushed its data
 let recordingStream = null;
 
 // Live transcript for current recording
@@ -103,3 +105,13 @@ let detectedQuestions = []; // Array of {question, answer, isRhetorical}
 let lastProcessedTranscriptLength = 0;
 let autoQAPanelCollapsed = false;
 let autoDetectionInterval = null;
+let liveSession = null; // {session_id, append_url} while recording
+
+// Live audio is uploaded in self-contained segments of this length
+const LIVE_SEGMENT_MS = 30000;
+let liveSegmentSeq = 0;
+let liveSegmentTimer = null;
+let liveAudioSessionId = null; // Session the current recording's segments go to
+let pendingSegmentUploads = new Set(); // Upload promises resolving to true on success
+let failedSegments = []; // {blob, seq} to retry before stopping
+let activeLiveRecognition = null;
@@ -0,0 +1,27 @@
+import pytest
+
+from backend.services import export, llm, render_pool, transcription
+from backend.services.cache import FileCache, SQLiteCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep persistent caches out of the project folder during tests."""
+    monkeypatch.setattr(llm, "response_cache", SQLiteCache(str(tmp_path / "llm.sqlite3")))
+    monkeypatch.setattr(
+        transcription, "transcript_cache", SQLiteCache(str(tmp_path / "transcripts.sqlite3"))
+    )
+    monkeypatch.setattr(export, "pdf_cache", FileCache(str(tmp_path / "pdf"), suffix=".pdf"))
+
+
+@pytest.fixture(autouse=True)
+def inline_rendering(monkeypatch):
+    """Render on the calling thread unless a test opts into the process pool."""
+    monkeypatch.setattr(render_pool, "_max_workers", 0)
+    monkeypatch.setattr(render_pool, "_executor", None)
+
+
+@pytest.fixture(autouse=True)
+def no_janitor(monkeypatch):
+    """Don't start the background janitor on the project folders from test requests."""
+    monkeypatch.setattr("backend.routes.api.JANITOR_ENABLED", False)
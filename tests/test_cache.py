@@ -0,0 +1,81 @@
+import os
+import time
+
+from backend.services import transcription
+from backend.services.cache import FileCache, SQLiteCache
+
+
+def test_cache_roundtrip_and_stats(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+
+    assert cache.get("missing") is None
+    cache.set("key", {"transcript": "hello", "language": "en"})
+    assert cache.get("key") == {"transcript": "hello", "language": "en"}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes_saved"] > 0
+
+
+def test_cache_creates_missing_directory(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "fresh" / "cache.sqlite3"))
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+
+def test_cache_ttl_expiry(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=1)
+    cache.set("key", "value")
+    time.sleep(1.1)
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    assert cache.get("a") == 1  # touch "a" so "b" is the LRU entry
+    time.sleep(0.01)
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_transcribe_uses_digest_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        transcription, "transcript_cache", SQLiteCache(str(tmp_path / "t.sqlite3"))
+    )
+    calls = []
+
+    def fake_single(file_path, prompt=None):
+        calls.append(file_path)
+        return "bonjour tout le monde", "fr"
+
+    monkeypatch.setattr(transcription, "_transcribe_single", fake_single)
+    audio = tmp_path / "a.m4a"
+    audio.write_bytes(b"audio")
+
+    first = transcription.transcribe_audio_file(str(audio), chunked=False, audio_digest="abc")
+    second = transcription.transcribe_audio_file(str(audio), chunked=False, audio_digest="abc")
+
+    assert first == second == ("bonjour tout le monde", "fr")
+    assert len(calls) == 1
+
+
+def test_file_cache_evicts_least_recently_used(tmp_path):
+    cache = FileCache(str(tmp_path / "files"), max_bytes=25, suffix=".bin")
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 10)
+    os.utime(cache.path_for("a"), (time.time() - 60, time.time() - 60))
+    cache.set("c", b"x" * 10)
+
+    assert cache.get("a") is None
+    assert open(cache.get("b"), "rb").read() == b"x" * 10
+    assert cache.get("c") is not None
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,38 @@
+from backend.services.chunking import estimate_tokens, split_text, trailing_whitespace
+
+
+def test_estimate_tokens_counts_dense_scripts_per_character():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("你好世界") == 4
+
+
+def test_split_text_prefers_speaker_turns():
+    text = "Alice: We should ship Friday.\nBob: Agreed, and I will write the notes.\nAlice: Great.\n"
+    segments = split_text(text, 12)
+
+    assert "".join(segments) == text
+    assert segments[0] == "Alice: We should ship Friday.\n"
+    assert all(seg.endswith("\n") for seg in segments)
+
+
+def test_split_text_breaks_long_lines_on_sentences():
+    text = "First sentence here. Second sentence follows! Third one? Done."
+    segments = split_text(text, 6)
+
+    assert "".join(segments) == text
+    assert segments[0] == "First sentence here. "
+    assert all(estimate_tokens(seg) <= 6 for seg in segments)
+
+
+def test_split_text_hard_splits_unpunctuated_cjk():
+    text = "你" * 25
+    segments = split_text(text, 10)
+
+    assert "".join(segments) == text
+    assert [len(seg) for seg in segments] == [10, 10, 5]
+
+
+def test_trailing_whitespace():
+    assert trailing_whitespace("line\n\n") == "\n\n"
+    assert trailing_whitespace("word") == ""
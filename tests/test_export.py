@@ -1,6 +1,13 @@
+import json
 from pathlib import Path
 
+import pytest
+from flask import Flask
+
+from backend.models import db, Meeting
+from backend.routes.api import api
 from backend.services import export
+from tools.import_meeting_artifacts import import_artifacts
 
 
 def test_save_load_delete_artifacts(tmp_path: Path):
@@ -25,3 +32,136 @@ def test_save_load_delete_artifacts(tmp_path: Path):
 
     export.delete_meeting_artifacts(meeting_id)
     assert not (tmp_path / f"{meeting_id}.json").exists()
+
+
+@pytest.fixture()
+def db_app(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_artifacts_are_saved_to_meeting_table(db_app, tmp_path: Path):
+    export.set_transcript_folder(str(tmp_path))
+    meeting_id = export.new_meeting_id()
+
+    export.save_meeting_artifacts(
+        meeting_id=meeting_id,
+        filename="audio.m4a",
+        transcript="hello",
+        summary="summary",
+        action_items=["item 1"],
+        original_language="Spanish",
+        was_translated=True,
+        memo_json={"title": "Test"},
+        transcript_original="hola",
+        summary_original="resumen",
+        action_items_original=["tarea 1"],
+        duration_seconds=61.6,
+    )
+
+    meeting = db.session.get(Meeting, meeting_id)
+    assert meeting.transcript_original == "hola"
+    assert meeting.transcript_english == "hello"
+    assert meeting.action_items_original == ["tarea 1"]
+    assert meeting.duration_seconds == 62
+    assert not (tmp_path / f"{meeting_id}.json").exists()
+
+    data = export.load_meeting_artifacts(meeting_id)
+    assert data["summary"] == "summary"
+    assert data["summary_original"] == "resumen"
+    assert data["memo_json"] == {"title": "Test"}
+
+    export.delete_meeting_artifacts(meeting_id)
+    assert db.session.get(Meeting, meeting_id) is None
+    with pytest.raises(FileNotFoundError):
+        export.load_meeting_artifacts(meeting_id)
+
+
+def test_import_meeting_artifacts(db_app, tmp_path: Path):
+    folder = tmp_path / "transcripts"
+    folder.mkdir()
+    for n in range(5):
+        (folder / f"20260101_00000{n}_000.json").write_text(json.dumps({
+            "meeting_id": f"20260101_00000{n}_000",
+            "created_at": "2026-01-01T09:00:00",
+            "source_filename": "audio.m4a",
+            "original_language": "English",
+            "was_translated": False,
+            "transcript": f"transcript {n}",
+            "summary": "summary",
+            "action_items": [],
+            "memo_json": {},
+        }), encoding="utf-8")
+    (folder / "broken.json").write_text("{", encoding="utf-8")
+
+    counts = import_artifacts(str(folder), batch_size=2)
+    again = import_artifacts(str(folder), batch_size=2)
+
+    assert counts == {"imported": 5, "skipped": 0, "failed": 1}
+    assert again == {"imported": 0, "skipped": 5, "failed": 1}
+    meeting = db.session.get(Meeting, "20260101_000003_000")
+    assert meeting.transcript_original == meeting.transcript_english == "transcript 3"
+
+
+def test_download_renders_once_and_honours_etag(tmp_path: Path, monkeypatch):
+    export.set_transcript_folder(str(tmp_path))
+    meeting_id = export.new_meeting_id()
+    export.save_meeting_artifacts(
+        meeting_id=meeting_id,
+        filename="audio.m4a",
+        transcript="hello",
+        summary="summary",
+        action_items=["item 1"],
+    )
+
+    renders = []
+    build = export.build_pdf_bytes
+    monkeypatch.setattr(export, "build_pdf_bytes", lambda data: renders.append(1) or build(data))
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+    with app.test_client() as client:
+        first = client.get(f"/api/download/{meeting_id}")
+        second = client.get(f"/api/download/{meeting_id}")
+        etag = first.headers["ETag"]
+        not_modified = client.get(f"/api/download/{meeting_id}", headers={"If-None-Match": etag})
+
+        # A changed artifact gets a new ETag and is rendered again
+        export.save_meeting_artifacts(
+            meeting_id=meeting_id,
+            filename="audio.m4a",
+            transcript="hello",
+            summary="updated summary",
+            action_items=["item 1"],
+        )
+        changed = client.get(f"/api/download/{meeting_id}", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.data.startswith(b"%PDF")
+    assert first.headers["Last-Modified"]
+    assert second.data == first.data
+    assert not_modified.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(renders) == 2
+
+
+def test_transcript_is_rendered_in_bounded_chunks():
+    transcript = "First line.\n\n" + "A sentence that repeats. " * 200 + "\n" + "x" * 3000
+    chunks = export._transcript_chunks(transcript, max_chars=500)
+
+    assert chunks[0] == "First line."
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert all(chunk.endswith("repeats.") for chunk in chunks[1:-7])
+    assert "".join(chunks[-6:]) == "x" * 3000
+
+    pdf = export.build_pdf_bytes({"meeting_id": "m", "transcript": "a < b & c\n" + transcript})
+    assert pdf.startswith(b"%PDF")
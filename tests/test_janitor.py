@@ -0,0 +1,102 @@
+import os
+import time
+
+import pytest
+from flask import Flask
+
+from backend.routes.api import api
+from backend.services import janitor
+
+
+@pytest.fixture()
+def folders(tmp_path):
+    uploads = tmp_path / "uploads"
+    transcripts = tmp_path / "transcripts"
+    uploads.mkdir()
+    transcripts.mkdir()
+    janitor.configure(
+        upload_folder=str(uploads),
+        transcript_folder=str(transcripts),
+        retention={"upload": 100, "live_segment": 10, "transcript": 1000},
+    )
+    yield uploads, transcripts
+    janitor.configure(
+        upload_folder=janitor.UPLOAD_FOLDER,
+        transcript_folder=janitor.TRANSCRIPT_FOLDER,
+        retention=janitor.JANITOR_RETENTION_SECONDS,
+    )
+    janitor.rebuild()
+
+
+def _file(path, age):
+    path.write_bytes(b"x")
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return str(path)
+
+
+def test_sweep_applies_retention_per_type(folders):
+    uploads, transcripts = folders
+    old_upload = _file(uploads / "a_meeting.m4a", 150)
+    fresh_upload = _file(uploads / "b_meeting.m4a", 50)
+    old_segment = _file(uploads / "live_abc_00001_segment.webm", 20)
+    transcript = _file(transcripts / "20260101_000000_000.json", 150)
+
+    assert janitor.rebuild() == 4
+    assert janitor.sweep() == 2
+
+    assert not os.path.exists(old_upload)
+    assert not os.path.exists(old_segment)
+    assert os.path.exists(fresh_upload)
+    assert os.path.exists(transcript)
+
+    # The fresh upload is deleted once its own retention passes
+    assert janitor.sweep(now=time.time() + 60) == 1
+    assert not os.path.exists(fresh_upload)
+
+
+def test_pinned_files_survive_until_released(folders):
+    uploads, _ = folders
+    path = _file(uploads / "in_flight.m4a", 500)
+    janitor.track(path)
+
+    with janitor.in_use(path):
+        assert janitor.sweep() == 0
+        assert os.path.exists(path)
+
+    # Re-checked after the janitor interval
+    assert janitor.sweep(now=time.time() + janitor.JANITOR_INTERVAL_SECONDS + 1) == 1
+    assert not os.path.exists(path)
+
+
+def test_touched_files_are_rescheduled(folders):
+    uploads, _ = folders
+    path = _file(uploads / "reused.m4a", 150)
+    janitor.track(path)
+    os.utime(path)  # written again after being tracked
+
+    assert janitor.sweep() == 0
+    assert os.path.exists(path)
+    assert janitor.sweep(now=time.time() + 101) == 1
+
+
+def test_files_outside_watched_folders_are_ignored(folders, tmp_path):
+    path = _file(tmp_path / "elsewhere.m4a", 500)
+    janitor.track(path)
+    assert janitor.sweep() == 0
+    assert os.path.exists(path)
+
+
+def test_janitor_starts_with_first_request(monkeypatch):
+    monkeypatch.setattr("backend.routes.api.JANITOR_ENABLED", True)
+    started = []
+    monkeypatch.setattr(janitor, "start", lambda: started.append(True))
+    monkeypatch.setattr(janitor, "running", lambda: bool(started))
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+    with app.test_client() as client:
+        client.get("/api/health")
+        client.get("/api/health")
+
+    assert started == [True]
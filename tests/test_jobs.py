@@ -0,0 +1,221 @@
+import hashlib
+import io
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from backend.routes.api import api
+from backend.services import janitor, jobs, pipeline
+
+
+def _wait_until_finished(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while not job.is_finished and time.time() < deadline:
+        time.sleep(0.01)
+    assert job.is_finished
+
+
+def test_job_reports_result_and_progress():
+    jobs.configure(max_workers=1)
+
+    def work(job, value):
+        job.update("working", 50)
+        return {"value": value}
+
+    job = jobs.submit(work, 42)
+    _wait_until_finished(job)
+
+    data = job.to_dict()
+    assert data["status"] == jobs.SUCCEEDED
+    assert data["progress"] == 100
+    assert data["result"] == {"value": 42}
+    assert jobs.get_job(job.id) is job
+
+
+def test_job_failure_is_recorded():
+    jobs.configure(max_workers=1)
+
+    def work(job):
+        raise RuntimeError("boom")
+
+    job = jobs.submit(work)
+    _wait_until_finished(job)
+
+    assert job.status == jobs.FAILED
+    assert job.error == "boom"
+
+
+def test_queue_limit_rejects_new_jobs():
+    release = threading.Event()
+    jobs.configure(max_workers=1, queue_limit=1)
+    try:
+        blocker = jobs.submit(lambda job: release.wait(5))
+        with pytest.raises(jobs.QueueFullError):
+            jobs.submit(lambda job: None)
+    finally:
+        release.set()
+        _wait_until_finished(blocker)
+        jobs.configure(queue_limit=50)
+
+
+def test_process_endpoint_returns_job(monkeypatch, tmp_path):
+    jobs.configure(max_workers=1)
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+
+    def fake_process(job, save_path, filename, agenda="", audio_digest=None):
+        job.update("summarizing", 60)
+        return {
+            "meeting_id": "20260101_000000_000",
+            "agenda": agenda,
+            "audio_digest": audio_digest,
+        }
+
+    monkeypatch.setattr(pipeline, "process_meeting", fake_process)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/api/process",
+            data={"audio_file": (io.BytesIO(b"audio"), "meeting.m4a"), "agenda": "Budget"},
+        )
+        assert response.status_code == 202
+        queued = response.get_json()
+
+        _wait_until_finished(jobs.get_job(queued["job_id"]))
+        status = client.get(queued["status_url"]).get_json()
+
+        missing = client.get("/api/jobs/does-not-exist")
+
+    assert status["status"] == "succeeded"
+    assert status["result"]["agenda"] == "Budget"
+    assert status["result"]["audio_digest"] == hashlib.sha256(b"audio").hexdigest()
+    assert status["result"]["download_url"] == "/api/download/20260101_000000_000"
+    assert missing.status_code == 404
+
+
+def test_failed_upload_is_unpinned_and_removed(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+    pinned = []
+    monkeypatch.setattr(janitor, "pin", pinned.append)
+    monkeypatch.setattr(janitor, "unpin", pinned.remove)
+
+    def interrupted_save(file, save_path):
+        with open(save_path, "wb") as out:
+            out.write(b"partial")
+        raise OSError("client went away")
+
+    monkeypatch.setattr("backend.routes.api._save_upload", interrupted_save)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/api/process",
+            data={"audio_file": (io.BytesIO(b"audio"), "meeting.m4a")},
+        )
+
+    assert response.status_code == 500
+    assert pinned == []
+    assert not list(tmp_path.iterdir())
+
+
+def test_upload_is_unpinned_when_submit_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+    pinned = []
+    monkeypatch.setattr(janitor, "pin", pinned.append)
+    monkeypatch.setattr(janitor, "unpin", pinned.remove)
+
+    def broken_submit(fn, *args, **kwargs):
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(jobs, "submit", broken_submit)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/api/process",
+            data={"audio_file": (io.BytesIO(b"audio"), "meeting.m4a")},
+        )
+
+    assert response.status_code == 500
+    assert pinned == []
+    assert not list(tmp_path.iterdir())
+
+
+def test_job_events_stream(monkeypatch):
+    jobs.configure(max_workers=1)
+
+    def work(job):
+        job.update("transcribing", 10)
+        job.emit("transcribed", {"transcript": "hola"})
+        job.emit("saved", {"meeting_id": "20260101_000000_000"})
+        return {"meeting_id": "20260101_000000_000", "transcript": "hola"}
+
+    job = jobs.submit(work)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        response = client.get(f"/api/process/{job.id}/events")
+        body = response.get_data(as_text=True)
+        resumed = client.get(
+            f"/api/process/{job.id}/events", headers={"Last-Event-ID": "2"}
+        ).get_data(as_text=True)
+
+    assert response.mimetype == "text/event-stream"
+    assert [line for line in body.splitlines() if line.startswith("event:")] == [
+        "event: transcribed",
+        "event: saved",
+        "event: done",
+    ]
+    assert '"transcript": "hola"' in body
+    assert '"download_url": "/api/download/20260101_000000_000"' in body
+    assert resumed.startswith("id: 3\nevent: done")
+
+
+def test_finished_job_keeps_a_bounded_event_tail_without_partials(monkeypatch):
+    monkeypatch.setattr(jobs, "JOB_EVENT_HISTORY", 3)
+    job = jobs.Job("bounded")
+    for i in range(5):
+        job.emit("transcribed", {"transcript": f"part {i}"})
+
+    # Only the tail is kept; ids keep counting so Last-Event-ID still works
+    assert [event["id"] for event in job.events_after(0)] == [3, 4, 5]
+    assert job.events_after(4)[0]["data"]["transcript"] == "part 4"
+
+    job._finish({"transcript": "part 0 ... part 4"})
+
+    events = job.events_after(0)
+    assert [event["id"] for event in events] == [4, 5, 6]
+    assert all("transcript" not in event["data"] for event in events[:-1])
+    assert events[-1]["event"] == "done"
+
+
+
+def test_job_that_cannot_be_queued_frees_its_slot(monkeypatch):
+    jobs.configure(max_workers=1)
+    monkeypatch.setattr(jobs, "_queue_limit", 1)
+    executor = jobs._get_executor()
+
+    class ShutDownExecutor:
+        def submit(self, fn):
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(jobs, "_get_executor", ShutDownExecutor)
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="shutdown"):
+            jobs.submit(lambda job: None)
+
+    # The failed submits left no queued job behind, so the one slot is free
+    monkeypatch.setattr(jobs, "_get_executor", lambda: executor)
+    job = jobs.submit(lambda job: "ok")
+    _wait_until_finished(job)
+    assert job.result == "ok"
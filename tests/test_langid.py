@@ -0,0 +1,64 @@
+import pytest
+
+from backend.services import langid
+from backend.services.translation import LANGUAGE_CODES
+
+
+SAMPLES = {
+    "en": "Okay so let's get started. The first item on the agenda is the budget for next quarter, and we need to decide what to cut before Friday. I think the marketing team will have to share that with us.",
+    "es": "Bueno, empecemos. El primer punto de la agenda es el presupuesto para el próximo trimestre y tenemos que decidir qué recortar antes del viernes. Creo que el equipo de marketing también tiene que compartir eso con nosotros.",
+    "fr": "Bon, commençons. Le premier point de l'ordre du jour est le budget pour le prochain trimestre et nous devons décider ce que nous allons couper avant vendredi. Je pense que l'équipe marketing doit partager cela avec nous.",
+    "de": "Also, fangen wir an. Der erste Punkt auf der Tagesordnung ist das Budget für das nächste Quartal und wir müssen entscheiden, was wir vor Freitag kürzen. Ich denke, das Marketingteam muss das auch mit uns teilen.",
+    "it": "Bene, iniziamo. Il primo punto all'ordine del giorno è il budget per il prossimo trimestre e dobbiamo decidere cosa tagliare prima di venerdì. Penso che il team marketing debba condividere questo con noi.",
+    "pt": "Bom, vamos começar. O primeiro item da pauta é o orçamento para o próximo trimestre e precisamos decidir o que cortar antes de sexta-feira. Acho que a equipe de marketing também precisa compartilhar isso com a gente.",
+    "nl": "Oké, laten we beginnen. Het eerste punt op de agenda is het budget voor het volgende kwartaal en we moeten beslissen wat we voor vrijdag schrappen. Ik denk dat het marketingteam dat ook met ons moet delen.",
+    "sv": "Okej, vi börjar. Den första punkten på dagordningen är budgeten för nästa kvartal och vi måste bestämma vad vi ska skära ner innan fredag. Jag tror att marknadsteamet också måste dela det med oss.",
+    "da": "Okay, lad os starte. Det første punkt på dagsordenen er budgettet for næste kvartal, og vi skal beslutte hvad vi skal skære ned på inden fredag. Jeg tror at marketingteamet også skal dele det med os.",
+    "tr": "Tamam, başlayalım. Gündemdeki ilk madde gelecek çeyrek için bütçe ve cumadan önce neyi keseceğimize karar vermemiz gerekiyor. Bence pazarlama ekibi de bunu bizimle paylaşmalı, çok önemli bir konu.",
+    "pl": "Dobrze, zaczynajmy. Pierwszy punkt porządku obrad to budżet na następny kwartał i musimy zdecydować, co obciąć przed piątkiem. Myślę, że zespół marketingu też musi się tym z nami podzielić, bo to jest ważne.",
+    "vi": "Được rồi, chúng ta bắt đầu. Mục đầu tiên trong chương trình là ngân sách cho quý tới và chúng ta cần quyết định cắt giảm những gì trước thứ Sáu. Tôi nghĩ nhóm tiếp thị cũng cần chia sẻ điều này với chúng ta.",
+    "ru": "Хорошо, начнём. Первый пункт повестки — бюджет на следующий квартал, и нам нужно решить, что сократить до пятницы.",
+    "ja": "では始めましょう。最初の議題は来四半期の予算で、金曜日までに何を削減するか決める必要があります。",
+    "ko": "자, 시작하겠습니다. 첫 번째 안건은 다음 분기 예산이고 금요일 전에 무엇을 줄일지 결정해야 합니다.",
+    "zh": "好的，我们开始吧。第一个议题是下个季度的预算，我们需要在周五之前决定削减什么。我觉得市场团队也应该和我们分享这个。",
+    "yue": "好啦，我哋開始啦。第一個議題係下個季度嘅預算，我哋要喺禮拜五之前決定削減啲乜嘢。我覺得市場部都要同我哋分享呢個。",
+    "ar": "حسنًا، لنبدأ. البند الأول في جدول الأعمال هو ميزانية الربع القادم ونحتاج إلى أن نقرر ما سنخفضه قبل يوم الجمعة.",
+    "hi": "ठीक है, शुरू करते हैं। एजेंडा का पहला विषय अगली तिमाही का बजट है और हमें शुक्रवार से पहले तय करना है कि क्या कम करना है।",
+    "th": "เอาล่ะ เริ่มกันเลย วาระแรกคืองบประมาณสำหรับไตรมาสหน้า และเราต้องตัดสินใจว่าจะลดอะไรก่อนวันศุกร์",
+}
+
+
+def test_samples_cover_all_supported_languages():
+    assert set(SAMPLES) == set(LANGUAGE_CODES)
+
+
+@pytest.mark.parametrize("code", sorted(SAMPLES))
+def test_identify_supported_languages(code):
+    guess = langid.identify(SAMPLES[code])
+    assert guess.code == code
+    assert guess.confidence >= 0.8
+
+
+def test_italian_with_many_grave_accents_is_not_french():
+    guess = langid.identify("È vero, il problema è che la data è già passata e non è chiaro chi è responsabile.")
+    assert guess.code == "it"
+    assert guess.confidence >= 0.8
+
+
+def test_short_or_empty_text_is_not_confident():
+    assert langid.identify("") == ("unknown", 0.0)
+    assert langid.identify("ok").confidence < 0.8
+    assert langid.identify("Thanks everyone.").confidence < 0.8
+
+
+def test_confident_text_skips_llm_detection(monkeypatch):
+    from backend.services import translation
+
+    def fail(text):
+        raise AssertionError("LLM detection should not be called")
+
+    monkeypatch.setattr(translation, "detect_language", fail)
+
+    text, language, translated = translation.detect_and_translate_if_needed(SAMPLES["en"])
+
+    assert (text, language, translated) == (SAMPLES["en"], "English", False)
@@ -0,0 +1,318 @@
+import io
+import os
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from backend.routes.api import api
+from backend.services import jobs, live, pipeline, qa_detection, transcription, translation
+
+
+def test_session_index_is_bounded():
+    session = live.LiveSession("s1", qa_detection.TranscriptIndex(window_chars=50, max_windows=3))
+    for i in range(20):
+        session.append(f"Sentence number {i}. ")
+
+    assert len(session.index) == 3
+    assert session.index.tail(20).endswith("Sentence number 19. ")
+    assert session.total_chars == sum(len(f"Sentence number {i}. ") for i in range(20))
+
+
+def test_session_drops_duplicate_questions():
+    session = live.LiveSession("s1")
+    first = session.add_questions([{"question": "What is the deadline?"}])
+    second = session.add_questions([
+        {"question": "what is  the deadline?"},
+        {"question": "Who owns it?"},
+    ])
+
+    assert len(first) == 1
+    assert [q["question"] for q in second] == ["Who owns it?"]
+    assert len(session.questions) == 2
+
+
+def test_live_session_endpoints_send_only_deltas(monkeypatch):
+    calls = []
+
+    def fake_detect(new_transcript, full_transcript="", context=None):
+        calls.append((new_transcript, context))
+        return [{"question": "When is the launch?", "is_rhetorical": False, "answer": "Friday"}]
+
+    monkeypatch.setattr(qa_detection, "detect_and_answer_questions", fake_detect)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        created = client.post("/api/live/sessions")
+        assert created.status_code == 201
+        session = created.get_json()
+
+        first = client.post(session["append_url"], json={"text": "We plan to launch on Friday. "})
+        second = client.post(session["append_url"], json={"text": "When is the launch again? "})
+        state = client.get(f"/api/live/sessions/{session['session_id']}").get_json()
+        closed = client.delete(f"/api/live/sessions/{session['session_id']}")
+        missing = client.post(session["append_url"], json={"text": "More text here, please. "})
+
+    assert len(first.get_json()["questions"]) == 1
+    # Already reported, so not returned again
+    assert second.get_json()["questions"] == []
+    assert calls[1] == (
+        "When is the launch again? ",
+        "[Most recent transcript]\nWe plan to launch on Friday.",
+    )
+    assert state["question_count"] == 1
+    assert closed.status_code == 200
+    assert missing.status_code == 404
+
+
+def test_audio_segments_are_transcribed_in_background_and_ordered(monkeypatch, tmp_path):
+    first_started = threading.Event()
+    release_first = threading.Event()
+    prompts = {}
+
+    def fake_transcribe(path, prompt=None):
+        name = path.rsplit("_", 1)[-1]
+        prompts[name] = prompt
+        if name == "a.webm":
+            first_started.set()
+            release_first.wait(5)
+        return {"a.webm": "first part", "b.webm": "second part", "c.webm": "third part"}[name], "es"
+
+    monkeypatch.setattr(transcription, "transcribe_segment", fake_transcribe)
+    monkeypatch.setattr(translation, "translate_to_english", lambda text, language: f"[{language}] {text}")
+
+    session = live.LiveSession("s-audio")
+    for seq, name in ((0, "a.webm"), (1, "b.webm")):
+        path = tmp_path / f"seg_{name}"
+        path.write_bytes(b"audio")
+        live.add_audio_segment(session, seq, str(path))
+
+    assert first_started.wait(5)
+    release_first.set()
+    session.wait_for_audio(timeout=5)
+
+    # Segment 1 ran while segment 0 was still transcribing, so it had no prompt;
+    # once a segment is done its text prompts the next one
+    path = tmp_path / "seg_c.webm"
+    path.write_bytes(b"audio")
+    live.add_audio_segment(session, 2, str(path))
+    session.wait_for_audio(timeout=5)
+
+    assert prompts == {"a.webm": None, "b.webm": None, "c.webm": "second part"}
+    assert session.audio_transcript() == ("first part second part third part", "es")
+    # Each segment was translated as it arrived, and the English text feeds the memo
+    assert session.english_transcript() == (
+        "[Spanish] first part [Spanish] second part [Spanish] third part", "Spanish", True,
+    )
+    assert session.summary._pending.startswith("[Spanish] first part")
+    assert not list(tmp_path.iterdir())
+
+
+def test_stop_queues_summary_of_streamed_audio(monkeypatch, tmp_path):
+    jobs.configure(max_workers=1)
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(
+        transcription, "transcribe_segment",
+        lambda path, prompt=None: (f"segment {os.path.basename(path).split('_')[2]}", "en"),
+    )
+
+    def fake_process(
+        job, transcript, source_language, filename, agenda="",
+        translate=None, summarize=None, duration_seconds=None,
+    ):
+        english, language, _ = translate(transcript, source_language)
+        return {"transcript": english, "language": language, "agenda": agenda, "filename": filename}
+
+    monkeypatch.setattr(pipeline, "_process_transcript", fake_process)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        session = client.post("/api/live/sessions").get_json()
+        sid = session["session_id"]
+
+        uploaded = client.post(
+            f"/api/live/sessions/{sid}/audio",
+            data={"audio_file": (io.BytesIO(b"one"), "segment_0.webm"), "seq": "0"},
+        )
+        bad = client.post(
+            f"/api/live/sessions/{sid}/audio",
+            data={"audio_file": (io.BytesIO(b"two"), "segment_1.webm")},
+        )
+        stopped = client.post(
+            f"/api/live/sessions/{sid}/stop",
+            data={
+                "audio_file": (io.BytesIO(b"two"), "segment_1.webm"),
+                "seq": "1",
+                "agenda": "Roadmap",
+            },
+        )
+        assert stopped.status_code == 202
+        job = jobs.get_job(stopped.get_json()["job_id"])
+        deadline = time.time() + 5
+        while not job.is_finished and time.time() < deadline:
+            time.sleep(0.01)
+        closed = client.get(f"/api/live/sessions/{sid}")
+
+    assert uploaded.status_code == 202
+    assert bad.status_code == 400
+    assert job.result == {
+        "transcript": "segment 00000 segment 00001",
+        "language": "English",
+        "agenda": "Roadmap",
+        "filename": pipeline.LIVE_RECORDING_FILENAME,
+    }
+    assert closed.status_code == 404
+
+
+def test_stop_rejects_late_segments_and_reopens_when_busy(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(transcription, "transcribe_segment", lambda path, prompt=None: ("text", "en"))
+    accepting = []
+
+    def busy_submit(fn, *args, **kwargs):
+        # The session is already stopped when the job is queued
+        accepting.append(not args[0].stopped)
+        raise jobs.QueueFullError("busy")
+
+    monkeypatch.setattr(jobs, "submit", busy_submit)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        sid = client.post("/api/live/sessions").get_json()["session_id"]
+        busy = client.post(f"/api/live/sessions/{sid}/stop")
+        # Still open, so the client can keep uploading and retry the stop
+        retried = client.post(
+            f"/api/live/sessions/{sid}/audio",
+            data={"audio_file": (io.BytesIO(b"one"), "segment_0.webm"), "seq": "0"},
+        )
+        live.stop_session(live.get_session(sid))
+        late = client.post(
+            f"/api/live/sessions/{sid}/audio",
+            data={"audio_file": (io.BytesIO(b"two"), "segment_1.webm"), "seq": "1"},
+        )
+        client.delete(f"/api/live/sessions/{sid}")
+
+    assert busy.status_code == 503
+    assert accepting == [False]
+    assert retried.status_code == 202
+    assert late.status_code == 409
+
+
+def test_failed_segments_are_retried_at_stop(monkeypatch, tmp_path):
+    attempts = {}
+
+    def flaky_transcribe(path, prompt=None):
+        name = os.path.basename(path)
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == "seg_b.webm" and attempts[name] == 1:
+            raise RuntimeError("upstream timeout")
+        return f"text {name[4]}", "en"
+
+    monkeypatch.setattr(transcription, "transcribe_segment", flaky_transcribe)
+
+    session = live.LiveSession("s-retry")
+    for seq, name in ((0, "seg_a.webm"), (1, "seg_b.webm")):
+        path = tmp_path / name
+        path.write_bytes(b"audio")
+        live.add_audio_segment(session, seq, str(path))
+    session.wait_for_audio(timeout=5)
+
+    # The failed segment keeps its audio until the retry
+    assert session.to_dict()["audio_segments_failed"] == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["seg_b.webm"]
+
+    assert live.retry_failed_segments(session) == []
+    assert session.audio_transcript() == ("text a text b", "en")
+    assert not list(tmp_path.iterdir())
+
+
+def test_stop_fails_when_a_segment_cannot_be_transcribed(monkeypatch, tmp_path):
+    def failing_transcribe(path, prompt=None):
+        if path.endswith("seg_b.webm"):
+            raise RuntimeError("upstream timeout")
+        return "text", "en"
+
+    monkeypatch.setattr(transcription, "transcribe_segment", failing_transcribe)
+    monkeypatch.setattr(
+        pipeline, "_process_transcript",
+        lambda *args, **kwargs: pytest.fail("a partial transcript must not be saved"),
+    )
+
+    session = live.LiveSession("s-hole")
+    for seq, name in ((0, "seg_a.webm"), (1, "seg_b.webm")):
+        path = tmp_path / name
+        path.write_bytes(b"audio")
+        live.add_audio_segment(session, seq, str(path))
+
+    job = jobs.Job("job-hole")
+    with pytest.raises(RuntimeError, match="1 recording segment"):
+        pipeline.finish_live_meeting(job, session)
+    assert not list(tmp_path.iterdir())
+
+
+def test_retried_segment_upload_keeps_the_queued_file(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+    started = threading.Event()
+    release = threading.Event()
+    transcribed = []
+
+    def slow_transcribe(path, prompt=None):
+        started.set()
+        release.wait(5)
+        with open(path, "rb") as audio:
+            transcribed.append(audio.read())
+        return "text", "en"
+
+    monkeypatch.setattr(transcription, "transcribe_segment", slow_transcribe)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        sid = client.post("/api/live/sessions").get_json()["session_id"]
+        for body in (b"original", b"retry"):
+            client.post(
+                f"/api/live/sessions/{sid}/audio",
+                data={"audio_file": (io.BytesIO(body), "segment_0.webm"), "seq": "0"},
+            )
+        assert started.wait(5)
+        release.set()
+        session = live.get_session(sid)
+        session.wait_for_audio(timeout=5)
+        client.delete(f"/api/live/sessions/{sid}")
+
+    assert transcribed == [b"original"]
+    assert session.to_dict()["audio_segments_failed"] == 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_closing_a_session_discards_failed_segment_audio(monkeypatch, tmp_path):
+    monkeypatch.setattr("backend.routes.api.UPLOAD_FOLDER", str(tmp_path))
+
+    def failing_transcribe(path, prompt=None):
+        raise RuntimeError("upstream timeout")
+
+    monkeypatch.setattr(transcription, "transcribe_segment", failing_transcribe)
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+
+    with app.test_client() as client:
+        sid = client.post("/api/live/sessions").get_json()["session_id"]
+        client.post(
+            f"/api/live/sessions/{sid}/audio",
+            data={"audio_file": (io.BytesIO(b"one"), "segment_0.webm"), "seq": "0"},
+        )
+        live.get_session(sid).wait_for_audio(timeout=5)
+        assert len(list(tmp_path.iterdir())) == 1
+        closed = client.delete(f"/api/live/sessions/{sid}")
+
+    assert closed.status_code == 200
+    assert not list(tmp_path.iterdir())
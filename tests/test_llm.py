@@ -0,0 +1,154 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APIStatusError
+
+from backend.services import llm
+
+
+def _status_error(status_code, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return APIStatusError("error", response=response, body=None)
+
+
+def _completion(text):
+    message = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def _fake_client(create):
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_chat_retries_rate_limits_then_succeeds(monkeypatch):
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise _status_error(429, {"retry-after": "0"})
+        return _completion(" ok ")
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+
+    result = llm.chat("translation", messages=[{"role": "user", "content": "hi"}])
+
+    assert result == llm.ChatResult("ok", "stop")
+    assert len(attempts) == 3
+    assert attempts[0]["timeout"] == llm.LLM_TIMEOUTS["translation"]
+
+
+def test_chat_does_not_retry_client_errors(monkeypatch):
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        raise _status_error(400)
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+
+    with pytest.raises(APIStatusError):
+        llm.chat("qa", messages=[])
+    assert len(attempts) == 1
+
+
+def test_chat_respects_global_concurrency_limit(monkeypatch):
+    monkeypatch.setattr(llm, "_semaphore", threading.BoundedSemaphore(2))
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def create(**kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return _completion("ok")
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+
+    threads = [threading.Thread(target=llm.chat, args=("qa", [])) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) == 2
+
+
+def test_deterministic_calls_are_cached(monkeypatch):
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        return _completion("hola")
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+    messages = [{"role": "user", "content": "Translate: hello  \r\n"}]
+
+    first = llm.chat("translation", messages=messages, temperature=0.0)
+    second = llm.chat(
+        "translation", messages=[{"role": "user", "content": "Translate: hello"}], temperature=0.0
+    )
+
+    assert first == second == llm.ChatResult("hola", "stop")
+    assert len(attempts) == 1
+    stats = llm.response_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["bytes_saved"] > 0
+
+
+def test_truncated_and_malformed_json_responses_are_not_cached(monkeypatch):
+    replies = [
+        SimpleNamespace(choices=[SimpleNamespace(
+            message=SimpleNamespace(content='{"title": "Cut'), finish_reason="length",
+        )]),
+        _completion('{"title": '),
+        _completion('{"title": "Full memo"}'),
+        _completion('{"title": "Not requested again"}'),
+    ]
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        return replies[len(attempts) - 1]
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+    messages = [{"role": "user", "content": "Summarize"}]
+
+    def memo():
+        return llm.chat(
+            "summarization", messages=messages, temperature=0.2, cache=True,
+            response_format={"type": "json_object"},
+        ).text
+
+    assert memo() == '{"title": "Cut'
+    assert memo() == '{"title":'
+    assert memo() == '{"title": "Full memo"}'
+    assert memo() == '{"title": "Full memo"}'
+    assert len(attempts) == 3
+
+
+def test_non_deterministic_and_opted_out_calls_skip_cache(monkeypatch):
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        return _completion("answer")
+
+    monkeypatch.setattr(llm, "_client", _fake_client(create))
+    messages = [{"role": "user", "content": "question"}]
+
+    llm.chat("qa", messages=messages, temperature=0.5)
+    llm.chat("qa", messages=messages, temperature=0.5)
+    llm.chat("translation", messages=messages, temperature=0.0, cache=False)
+    llm.chat("translation", messages=messages, temperature=0.0, cache=False)
+
+    assert len(attempts) == 4
+    assert "cache" not in attempts[0]
@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from backend.models import db, Meeting
+from backend.routes.api import api
+from backend.services import export
+
+
+@pytest.fixture()
+def client(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+    app.register_blueprint(api)
+
+    with app.app_context():
+        db.create_all()
+        start = datetime(2026, 3, 1, 12, 0, 0)
+        for n in range(7):
+            db.session.add(Meeting(
+                id=f"20260301_1200{n:02d}_000",
+                user_id=1,
+                created_at=start + timedelta(days=n // 2),  # pairs share a timestamp
+                original_language="Spanish" if n % 2 else "English",
+                meeting_type="standup" if n < 3 else "planning",
+                transcript_original="x" * 1000,
+                transcript_english="x" * 1000,
+                memo_json={"meeting_type": "standup"},
+            ))
+        db.session.add(Meeting(id="20260301_other_000", user_id=2, created_at=start))
+        db.session.commit()
+
+        with app.test_client() as test_client:
+            yield test_client
+        db.session.remove()
+        db.drop_all()
+
+
+def test_meetings_keyset_pages(client):
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/meetings?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        data = client.get(url).get_json()
+        seen.extend(item["meeting_id"] for item in data["meetings"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    # Newest first, ties broken by id, no repeats across pages, other users excluded
+    assert seen == [f"20260301_1200{n:02d}_000" for n in reversed(range(7))]
+    assert client.get("/api/meetings?cursor=bogus").status_code == 400
+
+
+def test_meetings_filters(client):
+    spanish = client.get("/api/meetings?language=spanish").get_json()["meetings"]
+    planning = client.get("/api/meetings?meeting_type=planning").get_json()["meetings"]
+    dated = client.get("/api/meetings?from=2026-03-02&to=2026-03-02").get_json()["meetings"]
+
+    assert {m["original_language"] for m in spanish} == {"Spanish"}
+    assert len(spanish) == 3
+    assert len(planning) == 4
+    assert all(m["download_url"].startswith("/api/download/") for m in planning)
+    assert sorted(m["meeting_id"] for m in dated) == ["20260301_120002_000", "20260301_120003_000"]
+    assert client.get("/api/meetings?from=yesterday").status_code == 400
+
+
+def test_meetings_listing_skips_transcript_columns(client):
+    statements = []
+    engine = db.engine
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        assert client.get("/api/meetings").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    select = next(s for s in statements if "FROM meetings" in s)
+    assert "transcript_original" not in select
+    assert "memo_json" not in select
+
+
+def test_search_ranks_and_highlights(client):
+    db.session.add(Meeting(
+        id="20260310_090000_000",
+        user_id=1,
+        created_at=datetime(2026, 3, 10, 9, 0, 0),
+        original_language="Spanish",
+        was_translated=True,
+        transcript_original="Hablamos del presupuesto de marketing.",
+        transcript_english="We discussed the marketing budget.",
+        summary_english="Budget review for the marketing team.",
+        memo_json={"title": "Marketing budget review"},
+    ))
+    db.session.add(Meeting(
+        id="20260311_090000_000",
+        user_id=1,
+        created_at=datetime(2026, 3, 11, 9, 0, 0),
+        transcript_english="Someone mentioned the budget once in passing.",
+        summary_english="Hiring plan.",
+    ))
+    db.session.commit()
+
+    results = client.get("/api/search?q=budget").get_json()["results"]
+    assert [r["meeting_id"] for r in results] == ["20260310_090000_000", "20260311_090000_000"]
+    assert results[0]["matched_in"] == "title"
+    assert "<mark>budget</mark>" in results[0]["snippet"].lower()
+    assert results[1]["matched_in"] == "transcript"
+
+    # Original-language transcript and prefix matches are indexed too
+    spanish = client.get("/api/search?q=presupu").get_json()["results"]
+    assert [r["meeting_id"] for r in spanish] == ["20260310_090000_000"]
+
+    # Updates and deletes keep the index in sync
+    meeting = db.session.get(Meeting, "20260311_090000_000")
+    meeting.transcript_english = "Nothing relevant."
+    db.session.commit()
+    db.session.delete(db.session.get(Meeting, "20260310_090000_000"))
+    db.session.commit()
+    assert client.get("/api/search?q=budget").get_json()["results"] == []
+
+    assert client.get('/api/search?q="unbalanced (').status_code == 200
+    assert client.get("/api/search").status_code == 400
+
+
+def test_search_snippets_are_html_escaped(client):
+    db.session.add(Meeting(
+        id="20260312_090000_000",
+        user_id=1,
+        created_at=datetime(2026, 3, 12, 9, 0, 0),
+        transcript_english='The deadline is <script>alert("x")</script> & Friday.',
+    ))
+    db.session.commit()
+
+    [result] = client.get("/api/search?q=deadline").get_json()["results"]
+    assert "<script>" not in result["snippet"]
+    assert "&lt;script&gt;" in result["snippet"]
+    assert "&amp;" in result["snippet"]
+    assert "<mark>deadline</mark>" in result["snippet"]
+
+
+def test_search_finds_non_ascii_action_items(client):
+    db.session.add(Meeting(
+        id="20260313_090000_000",
+        user_id=1,
+        created_at=datetime(2026, 3, 13, 9, 0, 0),
+        original_language="Spanish",
+        was_translated=True,
+        action_items_original=["Revisar la reunión con José"],
+        action_items_english=["Review the meeting with José"],
+    ))
+    db.session.commit()
+
+    [result] = client.get("/api/search?q=José").get_json()["results"]
+    assert result["meeting_id"] == "20260313_090000_000"
+    assert result["matched_in"] == "action_items"
+    # Indexed as the decoded strings, not JSON text
+    assert "\\u" not in result["snippet"] and '["' not in result["snippet"]
+    assert "<mark>José</mark>" in result["snippet"]
+
+
+def _zip_names(response):
+    import io
+    import zipfile
+
+    with zipfile.ZipFile(io.BytesIO(response.get_data())) as archive:
+        assert archive.testzip() is None
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def test_bulk_export_streams_zip(client, monkeypatch):
+    from backend.services import meetings
+
+    monkeypatch.setattr(meetings, "MEETINGS_MAX_PAGE_SIZE", 3)  # walk several pages
+
+    response = client.get("/api/export/bulk?format=json")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/zip"
+    assert "attachment" in response.headers["Content-Disposition"]
+    entries = _zip_names(response)
+    assert sorted(entries) == [f"20260301_1200{n:02d}_000.json" for n in range(7)]
+    assert b'"meeting_id": "20260301_120000_000"' in entries["20260301_120000_000.json"]
+
+    entries = _zip_names(client.get("/api/export/bulk?format=md&from=2026-03-02&to=2026-03-02"))
+    assert sorted(entries) == ["20260301_120002_000.md", "20260301_120003_000.md"]
+    assert entries["20260301_120002_000.md"].startswith(b"# ")
+    assert b"## Transcript" in entries["20260301_120002_000.md"]
+
+    entries = _zip_names(client.get("/api/export/bulk?meeting_type=standup"))
+    assert sorted(entries) == [f"20260301_1200{n:02d}_000.pdf" for n in range(3)]
+    assert all(body.startswith(b"%PDF") for body in entries.values())
+    # Bulk renders are not stored in the shared PDF cache
+    assert export.pdf_cache.stats()["entries"] == 0
+
+
+def test_bulk_export_rejects_bad_params(client):
+    assert client.get("/api/export/bulk?format=docx").status_code == 400
+    assert client.get("/api/export/bulk?from=yesterday").status_code == 400
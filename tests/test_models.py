@@ -1,7 +1,9 @@
 import pytest
 from flask import Flask
 
-from backend.models import db, User, Setting
+from sqlalchemy import event, text
+
+from backend.models import db, init_db, User, Setting
 
 
 @pytest.fixture()
@@ -36,3 +38,64 @@ def test_setting_boolean_parsing(app_context):
 
     Setting.set("auto_detect_qa", "true", data_type="bool", user_id=1)
     assert Setting.get("auto_detect_qa", user_id=1) is True
+
+
+def test_init_db_applies_sqlite_profile(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'profile.db'}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    init_db(app, pragmas={"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 1234})
+
+    with app.app_context():
+        assert db.session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert db.session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert db.session.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_settings_batched_and_cached(app_context):
+    db.session.add(User(id=1, username="default", email=None))
+    db.session.commit()
+
+    statements = []
+    commits = []
+    event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    event.listen(db.engine, "commit", lambda conn: commits.append(conn))
+
+    Setting.set_many({
+        "default_language": ("auto", "string"),
+        "auto_detect_qa": ("false", "bool"),
+        "recent": ([1, 2], "json"),
+    }, user_id=1)
+    assert len(commits) == 1
+
+    statements.clear()
+    values = Setting.get_many(["default_language", "auto_detect_qa", "recent", "missing"], user_id=1)
+    assert values == {"default_language": "auto", "auto_detect_qa": False, "recent": [1, 2], "missing": None}
+    assert Setting.get("recent", user_id=1) == [1, 2]
+    assert len([s for s in statements if "FROM settings" in s]) == 1  # second read is cached
+
+    # Writes invalidate the cache
+    Setting.set("default_language", "Spanish", user_id=1)
+    assert Setting.get("default_language", user_id=1) == "Spanish"
+
+
+def test_settings_load_overlapping_a_write_is_not_cached(app_context):
+    Setting.set("default_language", "auto", user_id=1)
+    statements = []
+
+    def write_during_load(conn, cursor, statement, *args):
+        statements.append(statement)
+        if "FROM settings" in statement and len(statements) == 1:
+            Setting.invalidate_cache(1)  # as set_many does after committing
+
+    event.listen(db.engine, "before_cursor_execute", write_during_load)
+    try:
+        Setting.get("default_language", user_id=1)
+        Setting.get("default_language", user_id=1)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", write_during_load)
+
+    # The first load overlapped an invalidation, so the second one reloads
+    assert len([s for s in statements if "FROM settings" in s]) == 2
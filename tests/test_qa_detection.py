@@ -0,0 +1,130 @@
+from types import SimpleNamespace
+
+from backend.services import llm, qa_detection
+from backend.services.qa_detection import TranscriptIndex
+
+
+def _filler(i):
+    return f"Speaker {i % 3}: we talked about item {i} and general updates for the team. "
+
+
+def test_index_retrieves_relevant_window():
+    index = TranscriptIndex(window_chars=200, max_windows=100)
+    for i in range(40):
+        index.add(_filler(i))
+        if i == 7:
+            index.add("The vendor contract renewal deadline is March 15 according to legal. ")
+
+    results = index.search("When is the vendor contract deadline?", k=2)
+
+    assert results
+    assert "vendor contract renewal" in results[0]
+
+
+def test_context_size_stays_flat_as_transcript_grows():
+    sizes = []
+    for length in (50, 500):
+        index = TranscriptIndex(window_chars=300, max_windows=1000)
+        for i in range(length):
+            index.add(_filler(i))
+        sizes.append(len(index.context_for("What about item 12?", k=3, tail_chars=600)))
+
+    assert sizes[1] <= sizes[0] * 1.5
+    assert sizes[1] < 300 * 3 + 600 + 200
+
+
+def test_index_evicts_old_windows():
+    index = TranscriptIndex(window_chars=100, max_windows=5)
+    index.add("alpha " * 100)
+    index.add("omega " * 100)
+
+    assert len(index) == 5
+    assert index.search("alpha") == []
+    assert index.search("omega")
+
+
+def test_long_transcript_prompt_uses_retrieved_context(monkeypatch):
+    prompts = []
+
+    def create(**kwargs):
+        prompts.append(kwargs["messages"][-1]["content"])
+        message = SimpleNamespace(content="[]")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    monkeypatch.setattr(
+        llm, "_client", SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    )
+
+    full = "".join(_filler(i) for i in range(2000))
+    snippet = "So what did we decide about item 42 then?"
+    qa_detection.detect_and_answer_questions(snippet, full + snippet)
+
+    assert len(prompts) == 1
+    assert len(prompts[0]) < len(full) / 10
+    assert "item 42 " in prompts[0]
+
+
+def test_question_score_cues():
+    assert qa_detection.question_score("Is the report ready?") == 1.0
+    assert qa_detection.question_score("so what do we think about the budget") >= 0.8
+    assert qa_detection.question_score("¿Cuándo terminamos el informe") >= 0.8
+    assert qa_detection.question_score("我们什么时候开始") >= 0.8
+    assert qa_detection.question_score("Bu rapor hazır mı") >= 0.8
+    assert qa_detection.question_score("We finished the migration and it went fine.") == 0.0
+    assert qa_detection.question_score("Okay that's what we did for the launch") == 0.0
+
+
+def test_question_score_tag_and_ja_cues_need_question_form():
+    assert qa_detection.question_score("We ship on Friday, right") >= 0.8
+    assert qa_detection.question_score("何が起きたの") >= 0.8
+    # Statements that only share a word with a question cue
+    assert qa_detection.question_score("Yes, that's right.") == 0.0
+    assert qa_detection.question_score("Turn right after the lobby") == 0.0
+    assert qa_detection.question_score("何か問題があれば後で連絡してください") == 0.0
+    assert qa_detection.question_score("何も問題ありません。") == 0.0
+    assert qa_detection.question_score("任何问题都可以发邮件") == 0.0
+
+
+def test_question_score_ignores_cue_words_inside_statements():
+    assert qa_detection.question_score("Hazır mısınız") >= 0.8
+    assert qa_detection.question_score("いつ始めますか") >= 0.8
+    assert qa_detection.question_score("Когда мы закончим релиз") >= 0.6
+    # Turkish particle only at clause end, not Spanish/Italian "mi"
+    assert qa_detection.question_score("Yo creo que mi equipo termina el informe mañana") == 0.0
+    assert qa_detection.question_score("いつもありがとうございます、資料を送ります") == 0.0
+    assert qa_detection.question_score("没什么问题，我们明天发布") == 0.0
+    assert qa_detection.question_score("Мы решили, когда закончим релиз") == 0.0
+    # A comma does not open a clause for lead words
+    assert qa_detection.question_score("We ship the release, which means the docs are done") == 0.0
+    assert qa_detection.question_score("Der Plan ist fertig, wie besprochen") == 0.0
+    # German "was" is also English "was"; only a question mark counts for it
+    assert qa_detection.question_score("Done. Was a long week, but we shipped.") == 0.0
+    assert qa_detection.question_score("Was machen wir jetzt?") == 1.0
+
+
+def test_question_score_counts_inversion_only_at_clause_start():
+    assert qa_detection.question_score("Okay, is everyone here") >= 0.8
+    assert qa_detection.question_score("It was decided. Does anyone object") >= 0.8
+    assert qa_detection.question_score("The problem is it does not scale") == 0.0
+    assert qa_detection.question_score("The main issue is we have not hired anyone yet") == 0.0
+    assert qa_detection.question_score("The good news is everyone agreed on the scope") == 0.0
+    assert qa_detection.question_score("We ship the plan, which is done") == 0.0
+    assert qa_detection.question_score("Como dije antes, el plan está listo") == 0.0
+    assert qa_detection.question_score("Que bueno que terminamos temprano") == 0.0
+
+
+def test_prefilter_skips_llm_call_and_counts_it(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(llm, "chat", fail)
+    before = qa_detection.prefilter_stats()
+
+    result = qa_detection.detect_and_answer_questions(
+        "We finished the migration last week and it went fine."
+    )
+
+    after = qa_detection.prefilter_stats()
+    assert result == []
+    assert after["llm_calls_saved"] == before["llm_calls_saved"] + 1
+    assert after["checked"] == before["checked"] + 1
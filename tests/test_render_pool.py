@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+from flask import Flask
+
+from backend.routes.api import api
+from backend.services import export, render_pool
+
+
+def test_renders_in_worker_process():
+    render_pool.configure(max_workers=1, queue_limit=4)
+    try:
+        pdf = render_pool.run(export.build_pdf_bytes, {"meeting_id": "m", "transcript": "hello"})
+    finally:
+        render_pool.configure(max_workers=0)
+
+    assert pdf.startswith(b"%PDF")
+    assert render_pool.pending() == 0
+
+
+def test_full_queue_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_pool, "_queue_limit", 0)
+    with pytest.raises(render_pool.QueueFullError):
+        render_pool.run(export.build_pdf_bytes, {})
+
+    export.set_transcript_folder(str(tmp_path))
+    meeting_id = export.new_meeting_id()
+    export.save_meeting_artifacts(
+        meeting_id=meeting_id, filename="audio.m4a", transcript="hi", summary="s", action_items=[],
+    )
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+    with app.test_client() as client:
+        response = client.get(f"/api/download/{meeting_id}")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+
+
+def test_waiting_caller_gets_the_next_free_slot(monkeypatch):
+    monkeypatch.setattr(render_pool, "_queue_limit", 1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "first"
+
+    first = threading.Thread(target=render_pool.run, args=(slow,))
+    first.start()
+    assert started.wait(5)
+
+    with pytest.raises(render_pool.QueueFullError):
+        render_pool.run(lambda: "rejected", wait=0.05)
+
+    threading.Timer(0.05, release.set).start()
+    assert render_pool.run(lambda: "second", wait=5) == "second"
+    first.join(5)
+    assert render_pool.pending() == 0
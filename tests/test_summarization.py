@@ -0,0 +1,231 @@
+import json
+from types import SimpleNamespace
+
+from backend.services import llm, summarization
+from backend.services.summarization import merge_memos
+
+
+def test_merge_memos_dedupes_deterministically():
+    partials = [
+        {
+            "meeting_type": "planning",
+            "title": "Q3 planning",
+            "summary_bullets": ["Budget is $40k."],
+            "decisions": ["Ship beta Friday"],
+            "action_items": [{"item": "Draft launch email", "owner": "Unassigned", "due": "Not stated"}],
+            "notes_by_section": [{"heading": "Budget", "bullets": ["Budget is $40k."]}],
+        },
+        {
+            "meeting_type": "status_update",
+            "title": "",
+            "summary_bullets": ["budget is $40k", "Hiring paused."],
+            "decisions": ["Ship beta Friday.", "Pause hiring"],
+            "action_items": [
+                {"item": "Draft launch email.", "owner": "Dana", "due": "Monday"},
+                "Book venue",
+            ],
+            "notes_by_section": [{"heading": "budget", "bullets": ["Hiring paused."]}],
+        },
+        {"meeting_type": "planning"},
+    ]
+
+    merged = merge_memos(partials)
+
+    assert merged == merge_memos(partials)
+    assert merged["meeting_type"] == "planning"
+    assert merged["title"] == "Q3 planning"
+    assert merged["summary_bullets"] == ["Budget is $40k.", "Hiring paused."]
+    assert merged["decisions"] == ["Ship beta Friday", "Pause hiring"]
+    assert merged["action_items"] == [
+        {"item": "Draft launch email", "owner": "Dana", "due": "Monday"},
+        {"item": "Book venue", "owner": "Unassigned", "due": "Not stated"},
+    ]
+    assert merged["notes_by_section"] == [
+        {"heading": "Budget", "bullets": ["Budget is $40k.", "Hiring paused."]}
+    ]
+
+
+def test_long_transcript_uses_map_reduce(monkeypatch):
+    prompts = []
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        prompts.append(prompt)
+        if "Rewrite the overview" in prompt:
+            memo = {"meeting_type": "planning", "title": "Full meeting", "summary_bullets": ["Overall"]}
+        else:
+            memo = {
+                "meeting_type": "planning",
+                "title": "Part",
+                "summary_bullets": ["Part bullet"],
+                "action_items": [{"item": "Follow up", "owner": "Sam", "due": "Friday"}],
+            }
+        message = SimpleNamespace(content=json.dumps(memo))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+    monkeypatch.setattr(summarization, "SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS", 50)
+    monkeypatch.setattr(summarization, "SUMMARY_WINDOW_TOKENS", 40)
+
+    transcript = "\n".join(f"Speaker {i}: we discussed item {i} at length." for i in range(20))
+    summary, action_items, memo = summarization.summarize_and_extract_actions(transcript)
+
+    window_prompts = [p for p in prompts if "This is part" in p]
+    assert len(window_prompts) > 1
+    assert memo["title"] == "Full meeting"
+    assert memo["summary_bullets"] == ["Overall"]
+    assert action_items == ["Follow up — Sam (Due: Friday)"]
+    assert summary.startswith("Full meeting")
+
+
+def test_map_reduce_retries_failed_windows(monkeypatch):
+    import re
+
+    attempts = {}
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        if "Rewrite the overview" in prompt:
+            memo = {"meeting_type": "planning", "title": "Full meeting", "summary_bullets": ["Overall"]}
+        else:
+            part = re.search(r"This is part (\d+) of", prompt).group(1)
+            attempts[part] = attempts.get(part, 0) + 1
+            if part == "2" and attempts[part] == 1:
+                raise RuntimeError("rate limited")
+            memo = {"title": f"Part {part}", "action_items": [{"item": f"Task {part}"}]}
+        message = SimpleNamespace(content=json.dumps(memo))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+    monkeypatch.setattr(summarization, "SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS", 50)
+    monkeypatch.setattr(summarization, "SUMMARY_WINDOW_TOKENS", 40)
+
+    transcript = "\n".join(f"Speaker {i}: we discussed item {i} at length." for i in range(20))
+    _, action_items, memo = summarization.summarize_and_extract_actions(transcript)
+
+    # The failed window is summarized again, so no part of the meeting is missing
+    assert attempts["2"] == 2
+    assert len(action_items) == len(attempts)
+    assert "Task 2 — Unassigned (Due: Not stated)" in action_items
+    assert memo["title"] == "Full meeting"
+
+
+def test_map_reduce_raises_when_a_window_keeps_failing(monkeypatch):
+    import pytest
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        if "This is part 2 of" in prompt:
+            raise RuntimeError("service down")
+        message = SimpleNamespace(content=json.dumps({"title": "Part"}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+    monkeypatch.setattr(summarization, "SUMMARY_WINDOW_TOKENS", 40)
+
+    transcript = "\n".join(f"Speaker {i}: we discussed item {i} at length." for i in range(20))
+    with pytest.raises(RuntimeError, match="window 2/"):
+        summarization._summarize_map_reduce(transcript)
+
+
+def test_rolling_summary_summarizes_windows_as_text_arrives(monkeypatch):
+    import re
+
+    prompts = []
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        prompts.append(prompt)
+        if "Rewrite the overview" in prompt:
+            memo = {"meeting_type": "planning", "title": "Whole meeting", "summary_bullets": ["Overall"]}
+        else:
+            part = re.search(r"This is part (\d+) of an ongoing", prompt).group(1)
+            memo = {
+                "meeting_type": "planning",
+                "title": f"Part {part}",
+                "summary_bullets": [f"Bullet {part}"],
+                "action_items": [{"item": f"Task {part}", "owner": "Sam", "due": "Friday"}],
+            }
+        message = SimpleNamespace(content=json.dumps(memo))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+
+    rolling = summarization.RollingSummary(window_tokens=40)
+    for i in range(12):
+        rolling.add(f"Speaker {i}: we discussed item {i} at length. ")
+
+    # Windows are summarized in the background while text keeps arriving
+    assert len(rolling._futures) >= 2
+    for future in list(rolling._futures):
+        future.result()
+    summarized_while_recording = len(prompts)
+    assert rolling.memo()["action_items"][0]["item"] == "Task 1"
+
+    summary, action_items, memo = rolling.finalize()
+
+    # Only the pending tail window and the reduce call run at the end
+    assert len(prompts) - summarized_while_recording <= 2
+    assert memo["title"] == "Whole meeting"
+    assert action_items[0] == "Task 1 — Sam (Due: Friday)"
+    assert len(action_items) == len(rolling._futures)
+
+
+def test_rolling_summary_retries_failed_windows_on_finalize(monkeypatch):
+    import re
+
+    attempts = {}
+
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        if "Rewrite the overview" in prompt:
+            memo = {"meeting_type": "planning", "title": "Whole meeting", "summary_bullets": ["Overall"]}
+        else:
+            part = re.search(r"This is part (\d+) of an ongoing", prompt).group(1)
+            attempts[part] = attempts.get(part, 0) + 1
+            if part == "1" and attempts[part] == 1:
+                raise RuntimeError("rate limited")
+            memo = {
+                "meeting_type": "planning",
+                "title": f"Part {part}",
+                "action_items": [{"item": f"Task {part}", "owner": "Sam", "due": "Friday"}],
+            }
+        message = SimpleNamespace(content=json.dumps(memo))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+
+    rolling = summarization.RollingSummary(window_tokens=40)
+    for i in range(12):
+        rolling.add(f"Speaker {i}: we discussed item {i} at length. ")
+    for future in list(rolling._futures):
+        future.result()
+    assert rolling._futures[0].result() is None
+
+    _, action_items, _ = rolling.finalize()
+
+    # The failed first window is summarized again rather than dropped
+    assert attempts["1"] == 2
+    assert action_items[0] == "Task 1 — Sam (Due: Friday)"
+    assert len(action_items) == len(rolling._futures)
+
+
+def test_rolling_summary_raises_when_a_window_keeps_failing(monkeypatch):
+    import pytest
+
+    def create(**kwargs):
+        raise RuntimeError("service down")
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm, "_client", fake)
+
+    rolling = summarization.RollingSummary(window_tokens=40)
+    rolling.add("Speaker 1: we discussed the launch plan. ")
+
+    with pytest.raises(RuntimeError, match="window 1"):
+        rolling.finalize()
@@ -0,0 +1,69 @@
+import os
+
+from backend.services import transcription
+from backend.services.transcription import plan_segments, stitch_transcripts
+
+
+def test_plan_segments_short_recording_is_single_segment():
+    assert plan_segments(120.0, [], target_seconds=600) == [(0.0, 120.0)]
+
+
+def test_plan_segments_cuts_at_latest_silence_with_overlap():
+    silences = [(300.0, 301.0), (500.0, 502.0), (1100.0, 1102.0)]
+    segments = plan_segments(1500.0, silences, target_seconds=600, overlap_seconds=2.0)
+
+    assert segments == [(0.0, 501.0), (499.0, 1101.0), (1099.0, 1500.0)]
+
+
+def test_plan_segments_hard_cut_without_silence():
+    segments = plan_segments(1300.0, [], target_seconds=600, overlap_seconds=1.0)
+    assert segments == [(0.0, 600.0), (599.0, 1200.0), (1199.0, 1300.0)]
+
+
+def test_stitch_transcripts_removes_overlap():
+    texts = [
+        "We agreed to ship the beta on Friday.",
+        "on friday. Next, the budget review is due Monday",
+        "",
+        "due Monday, and Alice owns it.",
+    ]
+    assert stitch_transcripts(texts) == (
+        "We agreed to ship the beta on Friday. Next, the budget review is due Monday and Alice owns it."
+    )
+
+
+def test_stitch_transcripts_keeps_single_word_coincidence():
+    assert stitch_transcripts(["Yes", "yes we can"]) == "Yes yes we can"
+
+
+def test_chunked_segments_are_prompted_with_previous_tail(monkeypatch):
+    extracted = {}
+    prompts = {}
+
+    def fake_extract(file_path, start, end, out_path):
+        extracted[os.path.basename(out_path)] = (start, end)
+        open(out_path, "wb").close()
+
+    def fake_single(path, prompt=None):
+        name = os.path.basename(path)
+        prompts[name] = prompt
+        if name.startswith("tail_"):
+            return f"end of part {int(name[5:9])}", "en"
+        return f"part {int(name[8:12])}", "en"
+
+    monkeypatch.setattr(transcription, "probe_duration", lambda path: 1300.0)
+    monkeypatch.setattr(transcription, "_detect_silences", lambda path: [])
+    monkeypatch.setattr(transcription, "_extract_segment", fake_extract)
+    monkeypatch.setattr(transcription, "_transcribe_single", fake_single)
+    monkeypatch.setattr(transcription, "TRANSCRIPTION_PROMPT_TAIL_SECONDS", 15)
+
+    transcript, language = transcription._transcribe_chunked("meeting.m4a")
+
+    assert transcript == "part 0 part 1 part 2"
+    assert language == "en"
+    # Only segments followed by another one get a tail pass
+    assert extracted["tail_0000.mp3"] == (585.0, 600.0)
+    assert "tail_0002.mp3" not in extracted
+    assert prompts["segment_0000.mp3"] is None
+    assert prompts["segment_0001.mp3"] == "end of part 0"
+    assert prompts["segment_0002.mp3"] == "end of part 1"
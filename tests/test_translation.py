@@ -11,3 +11,121 @@ def test_detect_and_translate_empty_text():
     assert text == ""
     assert language == "Unknown"
     assert translated is False
+
+
+class _FakeCompletions:
+    def __init__(self, truncate_over=None):
+        self.prompts = []
+        self.truncate_over = truncate_over
+
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        prompt = kwargs["messages"][-1]["content"]
+        self.prompts.append(prompt)
+        source = prompt.split("Text:\n", 1)[1]
+        finish_reason = "stop"
+        if self.truncate_over and len(source) > self.truncate_over:
+            finish_reason = "length"
+        message = SimpleNamespace(content=source.upper())
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+def _fake_client(completions):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def test_translate_text_segments_and_reassembles_in_order(monkeypatch):
+    from backend.services import llm, translation
+
+    completions = _FakeCompletions()
+    monkeypatch.setattr(llm, "_client", _fake_client(completions))
+    monkeypatch.setattr(translation, "TRANSLATION_SEGMENT_TOKENS", 10)
+
+    text = "\n".join(f"Speaker {i}: line number {i} here." for i in range(8))
+    result = translation.translate_text(text, "Spanish")
+
+    assert len(completions.prompts) > 1
+    assert result == text.upper()
+
+
+def test_translate_text_resplits_truncated_segment(monkeypatch):
+    from backend.services import llm, translation
+
+    completions = _FakeCompletions(truncate_over=30)
+    monkeypatch.setattr(llm, "_client", _fake_client(completions))
+
+    text = "One short sentence. Another short sentence. And a third."
+    result = translation.translate_text(text, "French")
+
+    assert result == text.upper()
+    assert len(completions.prompts) > 1
+
+
+class _JSONCompletions:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts = []
+
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.prompts.append(kwargs["messages"][-1]["content"])
+        reply = self.replies.pop(0)
+        content = reply(self.prompts[-1]) if callable(reply) else reply
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def test_translate_summary_and_actions_single_structured_call(monkeypatch):
+    import json
+
+    from backend.services import llm, translation
+
+    completions = _JSONCompletions([
+        json.dumps({"summary": "Resumen", "action_items": ["Ana: enviar informe\nhoy", "Revisar presupuesto"]}),
+    ])
+    monkeypatch.setattr(llm, "_client", _fake_client(completions))
+
+    summary, items = translation.translate_summary_and_actions(
+        "Summary", ["Ana: send report today", "Review budget"], "Spanish"
+    )
+
+    assert len(completions.prompts) == 1
+    assert summary == "Resumen"
+    # Embedded newlines no longer split one item into two
+    assert items == ["Ana: enviar informe\nhoy", "Revisar presupuesto"]
+
+
+def test_translate_summary_and_actions_falls_back_on_count_mismatch(monkeypatch):
+    import json
+
+    from backend.services import llm, translation
+
+    def reply(prompt):
+        if '"items"' in prompt:
+            return json.dumps({"items": ["Uno", "Dos"]})
+        return prompt.split("Text:\n", 1)[1].upper()
+
+    completions = _JSONCompletions([
+        json.dumps({"summary": "Resumen", "action_items": ["Uno"]}),
+        reply,
+        reply,
+    ])
+    monkeypatch.setattr(llm, "_client", _fake_client(completions))
+
+    summary, items = translation.translate_summary_and_actions(
+        "Summary", ["One", "Two"], "Spanish"
+    )
+
+    assert len(completions.prompts) == 3
+    assert summary == "SUMMARY"
+    assert items == ["Uno", "Dos"]
+
+
+def test_translate_summary_and_actions_skips_english():
+    from backend.services import translation
+
+    assert translation.translate_summary_and_actions("S", ["a"], "English") == ("S", ["a"])
@@ -0,0 +1,79 @@
+import argparse
+import time
+import tracemalloc
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph
+
+from backend.services import export
+
+SENTENCES = [
+    "Let's go over the budget for the next quarter.",
+    "I think marketing needs another two weeks before the launch.",
+    "Can someone follow up with the vendor about the contract?",
+    "We agreed to move the design review to Thursday afternoon.",
+    "The support backlog is down thirty percent since last month.",
+]
+
+
+def make_transcript(chars: int) -> str:
+    """Synthetic single-line transcript (Whisper output has no line breaks)."""
+    parts, size, n = [], 0, 0
+    while size < chars:
+        sentence = SENTENCES[n % len(SENTENCES)]
+        parts.append(sentence)
+        size += len(sentence) + 1
+        n += 1
+    return " ".join(parts)[:chars]
+
+
+def render_single_paragraph(data: dict) -> bytes:
+    """The previous layout: the whole transcript as one Paragraph."""
+    buf = BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter, leftMargin=0.8 * inch, rightMargin=0.8 * inch,
+                            topMargin=0.8 * inch, bottomMargin=0.8 * inch)
+    styles = getSampleStyleSheet()
+    doc.build([Paragraph(data["transcript"].replace("\n", "<br/>"), styles["BodyText"])])
+    return buf.getvalue()
+
+
+def measure(render, data: dict) -> tuple[float, float, int]:
+    """Seconds, peak traced memory (MB) and output size of one render."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    pdf = render(data)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), len(pdf)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PDF render time and peak memory vs transcript length")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Transcript lengths in characters")
+    parser.add_argument("--legacy-max", type=int, default=100000,
+                        help="Largest size to also render with the old single-paragraph layout")
+    args = parser.parse_args()
+
+    print(f"{'chars':>9}  {'layout':<16} {'seconds':>8} {'peak MB':>8} {'PDF KB':>8}")
+    for chars in (int(size) for size in args.sizes.split(",")):
+        data = {
+            "meeting_id": "bench",
+            "created_at": "2026-01-01T09:00:00",
+            "summary": "Benchmark meeting.",
+            "action_items": ["Check the numbers"],
+            "transcript": make_transcript(chars),
+        }
+        layouts = [("per-chunk", export.build_pdf_bytes)]
+        if chars <= args.legacy_max:
+            layouts.append(("single paragraph", render_single_paragraph))
+        for name, render in layouts:
+            seconds, peak_mb, size = measure(render, data)
+            print(f"{chars:>9}  {name:<16} {seconds:>8.2f} {peak_mb:>8.1f} {size / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+from backend.config import SQLITE_PRAGMAS, SQLALCHEMY_ENGINE_OPTIONS
+from backend.models import db, init_db, Setting
+from backend.services import export
+
+# SQLite's defaults: rollback journal, synchronous=FULL, 5 s busy timeout
+DEFAULT_PROFILE = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def _make_app(path: str, tuned: bool) -> Flask:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    if tuned:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = SQLALCHEMY_ENGINE_OPTIONS
+        init_db(app)
+    else:
+        init_db(app, pragmas=DEFAULT_PROFILE)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def run_profile(tuned: bool, writers: int, writes: int, readers: int) -> dict:
+    """Concurrent meeting/setting writers (plus readers); returns throughput and errors."""
+    with tempfile.TemporaryDirectory() as folder:
+        app = _make_app(os.path.join(folder, "bench.db"), tuned)
+        export.set_transcript_folder(folder)
+        errors = []
+        reads = [0]
+        done = threading.Event()
+        transcript = "word " * 2000  # ~10 KB, a short meeting
+
+        def write(worker: int):
+            with app.app_context():
+                for n in range(writes):
+                    try:
+                        export.save_meeting_artifacts(
+                            meeting_id=f"bench_{worker:03d}_{n:05d}",
+                            filename="bench.m4a",
+                            transcript=transcript,
+                            summary="summary",
+                            action_items=["item"],
+                        )
+                        Setting.set(f"bench_{worker}", str(n), user_id=1)
+                    except OperationalError as e:
+                        db.session.rollback()
+                        errors.append(str(e.orig))
+
+        def read():
+            # Query directly: Setting.get would mostly be served from the settings cache
+            with app.app_context():
+                while not done.is_set():
+                    db.session.query(Setting.value).filter_by(user_id=1, key="bench_0").scalar()
+                    db.session.rollback()
+                    reads[0] += 1
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+        reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+        started = time.perf_counter()
+        for thread in threads + reader_threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        done.set()
+        for thread in reader_threads:
+            thread.join()
+
+        with app.app_context():
+            db.engine.dispose()
+
+    committed = writers * writes * 2 - len(errors)
+    return {
+        "profile": "tuned" if tuned else "default",
+        "seconds": round(elapsed, 2),
+        "commits_per_second": round(committed / elapsed, 1),
+        "reads": reads[0],
+        "errors": len(errors),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent SQLite writers: default vs tuned profile")
+    parser.add_argument("--writers", type=int, default=8, help="Concurrent writer threads")
+    parser.add_argument("--writes", type=int, default=100, help="Meetings saved per writer")
+    parser.add_argument("--readers", type=int, default=2, help="Concurrent reader threads")
+    args = parser.parse_args()
+
+    print(f"Tuned pragmas: {SQLITE_PRAGMAS}")
+    for tuned in (False, True):
+        result = run_profile(tuned, args.writers, args.writes, args.readers)
+        print(
+            f"{result['profile']:>8}: {result['commits_per_second']:>8} commits/s "
+            f"({result['seconds']} s, {result['reads']} reads, {result['errors']} lock errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
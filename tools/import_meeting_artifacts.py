@@ -0,0 +1,77 @@
+import argparse
+import glob
+import json
+import logging
+import os
+
+from backend.config import DEFAULT_USER_ID, TRANSCRIPT_FOLDER
+from backend.models import db, Meeting
+from backend.services import export
+
+logger = logging.getLogger(__name__)
+
+
+def import_artifacts(
+    folder: str = TRANSCRIPT_FOLDER,
+    batch_size: int = 200,
+    user_id: int = DEFAULT_USER_ID,
+    delete: bool = False,
+) -> dict:
+    """Import meeting JSON artifacts into the Meeting table.
+
+    Each batch is inserted in one transaction. Meetings already in the
+    database are skipped, so the import can be re-run safely.
+
+    Returns:
+        Counts of imported, skipped (already present) and failed files
+    """
+    paths = sorted(glob.glob(os.path.join(folder, "*.json")))
+    counts = {"imported": 0, "skipped": 0, "failed": 0}
+
+    for start in range(0, len(paths), batch_size):
+        meetings = {}
+        for path in paths[start:start + batch_size]:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    meeting = export.meeting_from_artifact(json.load(f), user_id)
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping %s: %s", path, e)
+                counts["failed"] += 1
+                continue
+            meetings[meeting.id] = (meeting, path)
+
+        existing = {
+            row.id for row in
+            Meeting.query.with_entities(Meeting.id).filter(Meeting.id.in_(list(meetings)))
+        }
+        new = [(meeting, path) for meeting_id, (meeting, path) in meetings.items()
+               if meeting_id not in existing]
+        counts["skipped"] += len(meetings) - len(new)
+
+        db.session.add_all(meeting for meeting, _ in new)
+        db.session.commit()
+        counts["imported"] += len(new)
+
+        if delete:
+            for _, path in new:
+                os.remove(path)
+
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import meeting JSON artifacts into the database")
+    parser.add_argument("--folder", default=TRANSCRIPT_FOLDER, help="Folder with <meeting_id>.json files")
+    parser.add_argument("--batch-size", type=int, default=200, help="Meetings per transaction")
+    parser.add_argument("--delete", action="store_true", help="Delete JSON files once imported")
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        counts = import_artifacts(args.folder, batch_size=args.batch_size, delete=args.delete)
+    print(f"Imported {counts['imported']}, skipped {counts['skipped']}, failed {counts['failed']}")
+
+
+if __name__ == "__main__":
+    main()